@@ -0,0 +1,181 @@
+"""
+Blender Engine Backends Module
+Execution backends that decide where an agent's work runs.
+"""
+
+import asyncio
+import hashlib
+import pickle
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Dict, Optional, Tuple
+
+from .tasks import TaskContext, TaskResult
+
+
+class ExecutionBackend:
+    """Base class for execution backends."""
+
+    name = "base"
+
+    def prepare(self, agent: Any) -> None:
+        """Get ready to run ``agent``; called when it is registered."""
+
+    async def run(self, agent: Any, context: TaskContext) -> TaskResult:
+        """Run ``agent.execute(context)`` and return its result."""
+        raise NotImplementedError
+
+    def shutdown(self) -> None:
+        """Release any pooled resources."""
+
+
+class InlineBackend(ExecutionBackend):
+    """Run agents directly on the engine's event loop."""
+
+    name = "inline"
+
+    async def run(self, agent: Any, context: TaskContext) -> TaskResult:
+        return await agent.execute(context)
+
+
+_thread_state = threading.local()
+
+
+def _thread_loop() -> asyncio.AbstractEventLoop:
+    """Return the private event loop of the current pool thread."""
+    loop = getattr(_thread_state, "loop", None)
+    if loop is None:
+        loop = asyncio.new_event_loop()
+        _thread_state.loop = loop
+    return loop
+
+
+def _run_in_thread(agent: Any, context: TaskContext) -> TaskResult:
+    return _thread_loop().run_until_complete(agent.execute(context))
+
+
+class ThreadBackend(ExecutionBackend):
+    """
+    Run agents on a thread pool, each thread with its own event loop.
+
+    Suited to agents that block in I/O or release the GIL in native code.
+    """
+
+    name = "thread"
+
+    def __init__(self, max_workers: Optional[int] = None):
+        self.max_workers = max_workers
+        self._pool: Optional[ThreadPoolExecutor] = None
+
+    async def run(self, agent: Any, context: TaskContext) -> TaskResult:
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="blender-engine"
+            )
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._pool, _run_in_thread, agent, context)
+
+    def shutdown(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+
+
+# Agents unpickled in a worker process, keyed by the digest of their pickle
+_process_agents: Dict[str, Any] = {}
+_process_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+class _AgentNotLoaded(Exception):
+    """Raised in a worker process asked to run an agent it has not been sent."""
+
+
+def _load_process_agents(agent_blobs: Dict[str, bytes]) -> None:
+    for agent_key, agent_blob in agent_blobs.items():
+        if agent_key not in _process_agents:
+            _process_agents[agent_key] = pickle.loads(agent_blob)
+
+
+def _run_in_process(
+    agent_key: str,
+    context_data: Dict[str, Any],
+    agent_blob: Optional[bytes] = None
+) -> Dict[str, Any]:
+    global _process_loop
+    agent = _process_agents.get(agent_key)
+    if agent is None:
+        if agent_blob is None:
+            raise _AgentNotLoaded(agent_key)
+        agent = pickle.loads(agent_blob)
+        _process_agents[agent_key] = agent
+    if _process_loop is None:
+        _process_loop = asyncio.new_event_loop()
+    context = TaskContext.from_dict(context_data)
+    result = _process_loop.run_until_complete(agent.execute(context))
+    return result.to_dict()
+
+
+class ProcessBackend(ExecutionBackend):
+    """
+    Run agents in a process pool, for CPU-bound work.
+
+    Agents must be picklable. Each agent is pickled once, when it is
+    registered, and every worker process unpickles the agents known when
+    the pool starts; calls then pass only the agent's key. A worker that
+    has not seen an agent (registered after the pool started, or a
+    replacement process) reports it, and that one call is resent with the
+    pickle. Contexts and results cross the process boundary as plain
+    dictionaries rather than dataclasses.
+    """
+
+    name = "process"
+
+    def __init__(self, max_workers: Optional[int] = None):
+        self.max_workers = max_workers
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._blobs: Dict[str, Tuple[Any, str, bytes]] = {}
+
+    def prepare(self, agent: Any) -> None:
+        self._agent_blob(agent)
+
+    def _agent_blob(self, agent: Any) -> Tuple[str, bytes]:
+        cached = self._blobs.get(agent.name)
+        if cached is None or cached[0] is not agent:
+            blob = pickle.dumps(agent, protocol=pickle.HIGHEST_PROTOCOL)
+            cached = (agent, hashlib.sha1(blob).hexdigest(), blob)
+            self._blobs[agent.name] = cached
+        return cached[1], cached[2]
+
+    async def run(self, agent: Any, context: TaskContext) -> TaskResult:
+        agent_key, agent_blob = self._agent_blob(agent)
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                initializer=_load_process_agents,
+                initargs=({key: blob for _, key, blob in self._blobs.values()},)
+            )
+        loop = asyncio.get_running_loop()
+        context_data = context.to_dict()
+        try:
+            result_data = await loop.run_in_executor(
+                self._pool, _run_in_process, agent_key, context_data
+            )
+        except _AgentNotLoaded:
+            result_data = await loop.run_in_executor(
+                self._pool, _run_in_process, agent_key, context_data, agent_blob
+            )
+        return TaskResult.from_dict(result_data)
+
+    def shutdown(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+        self._blobs.clear()
+
+
+BACKENDS = {
+    InlineBackend.name: InlineBackend,
+    ThreadBackend.name: ThreadBackend,
+    ProcessBackend.name: ProcessBackend,
+}
@@ -0,0 +1,103 @@
+"""
+Blender Engine Batching Module
+Micro-batching of individual tasks into ``execute_batch`` agent calls.
+"""
+
+import asyncio
+from typing import Any, Dict, List, Optional, Tuple
+
+from .tasks import TaskContext, TaskResult, TaskType
+
+
+class MicroBatcher:
+    """
+    Collects tasks bound for one agent and runs them in batches.
+
+    Tasks are grouped by task type. A group is flushed as soon as it holds
+    ``max_batch_size`` tasks, or ``max_wait`` seconds after its first task
+    arrived, whichever comes first. The agent must implement
+    ``execute_batch(contexts)`` returning one result per context, matched
+    back by task ID (or by position when IDs are missing).
+    """
+
+    def __init__(self, agent: Any, max_batch_size: int = 32, max_wait: float = 0.01):
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        self.agent = agent
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self._groups: Dict[TaskType, List[Tuple[TaskContext, asyncio.Future]]] = {}
+        self._timers: Dict[TaskType, asyncio.TimerHandle] = {}
+        self._running: set = set()
+        self.batches = 0
+        self.batched_tasks = 0
+
+    async def submit(self, context: TaskContext) -> TaskResult:
+        """Queue a task for the next batch of its type and await its result."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        group = self._groups.setdefault(context.task_type, [])
+        group.append((context, future))
+        if len(group) >= self.max_batch_size:
+            self._flush(context.task_type)
+        elif context.task_type not in self._timers:
+            self._timers[context.task_type] = loop.call_later(
+                self.max_wait, self._flush, context.task_type
+            )
+        return await future
+
+    def _flush(self, task_type: TaskType) -> None:
+        timer = self._timers.pop(task_type, None)
+        if timer is not None:
+            timer.cancel()
+        group = self._groups.pop(task_type, [])
+        # Callers that gave up while waiting are dropped from the batch
+        group = [(ctx, future) for ctx, future in group if not future.done()]
+        for start in range(0, len(group), self.max_batch_size):
+            batch = group[start:start + self.max_batch_size]
+            task = asyncio.ensure_future(self._run(batch))
+            self._running.add(task)
+            task.add_done_callback(self._running.discard)
+
+    async def _run(self, batch: List[Tuple[TaskContext, asyncio.Future]]) -> None:
+        contexts = [ctx for ctx, _ in batch]
+        self.batches += 1
+        self.batched_tasks += len(contexts)
+        try:
+            results = await self.agent.execute_batch(contexts)
+        except Exception as e:
+            self._fail(batch, e)
+            return
+
+        try:
+            results = list(results)
+            by_id: Dict[str, TaskResult] = {r.task_id: r for r in results if r.task_id}
+            for position, (ctx, future) in enumerate(batch):
+                if future.done():
+                    continue
+                result: Optional[TaskResult] = by_id.get(ctx.task_id)
+                if result is None and len(results) == len(batch):
+                    result = results[position]
+                if result is None:
+                    future.set_exception(RuntimeError(
+                        f"Agent '{self.agent.name}' returned no result for task '{ctx.task_id}'"
+                    ))
+                else:
+                    future.set_result(result)
+        except Exception as e:
+            # A malformed return must not leave callers waiting forever
+            error = RuntimeError(f"Agent '{self.agent.name}' returned an invalid batch: {e}")
+            error.__cause__ = e
+            self._fail(batch, error)
+
+    def _fail(self, batch: List[Tuple[TaskContext, asyncio.Future]], error: Exception) -> None:
+        for _, future in batch:
+            if not future.done():
+                future.set_exception(error)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "batches": self.batches,
+            "batched_tasks": self.batched_tasks,
+            "mean_batch_size": self.batched_tasks / self.batches if self.batches else 0.0,
+        }
@@ -0,0 +1,377 @@
+#!/usr/bin/env python3
+"""
+Blender Engine Benchmarks
+Reproducible benchmarks for the orchestration engine hot paths.
+
+Usage:
+    python -m blender_engine.bench --output bench.json
+    python -m blender_engine.bench --quick --compare bench.json
+"""
+
+import argparse
+import asyncio
+import gc
+import json
+import logging
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+from . import __version__
+from .compact import CompactTaskContext, CompactTaskResult
+from .engine import BlenderEngine
+from .history import TaskHistory
+from .limits import AIMDLimit, GradientLimit
+from .tasks import TaskContext, TaskResult, TaskStatus, TaskType
+
+
+class SyntheticAgent:
+    """
+    Agent with configurable latency and CPU cost, for benchmarking.
+
+    Args:
+        name: Agent name
+        capabilities: Task types the agent accepts
+        latency: Seconds of simulated I/O wait per task
+        cpu_cost: Iterations of busy work per task
+        capacity: Concurrent calls the simulated backend can serve; extra
+            calls queue inside the agent, and every call slows down in
+            proportion to the overload, so throughput falls as load rises
+    """
+
+    def __init__(
+        self,
+        name: str = "synthetic",
+        capabilities: Optional[List[TaskType]] = None,
+        latency: float = 0.0,
+        cpu_cost: int = 0,
+        capacity: Optional[int] = None
+    ):
+        self._name = name
+        self._capabilities = capabilities or list(TaskType)
+        self.latency = latency
+        self.cpu_cost = cpu_cost
+        self.capacity = capacity
+        self._servers = asyncio.Semaphore(capacity) if capacity else None
+        self.in_flight = 0
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def capabilities(self) -> List[TaskType]:
+        return self._capabilities
+
+    async def execute(self, context: TaskContext) -> TaskResult:
+        self.in_flight += 1
+        try:
+            acc = 0
+            for i in range(self.cpu_cost):
+                acc += i
+            if self._servers is not None:
+                async with self._servers:
+                    overload = max(0, self.in_flight - self.capacity) / self.capacity
+                    await asyncio.sleep(self.latency * (1.0 + overload))
+            elif self.latency:
+                await asyncio.sleep(self.latency)
+            return TaskResult(task_id=context.task_id, status=TaskStatus.COMPLETED, output={"acc": acc})
+        finally:
+            self.in_flight -= 1
+
+
+def _contexts(count: int, prefix: str = "task") -> List[TaskContext]:
+    return [
+        TaskContext(task_id=f"{prefix}-{i}", task_type=TaskType.ANALYSIS, input_data={"i": i})
+        for i in range(count)
+    ]
+
+
+def _percentile(values: List[float], q: float) -> float:
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, max(0, int(round(q * (len(ordered) - 1)))))
+    return ordered[index]
+
+
+def _result(value: float, unit: str, higher_is_better: bool, **extra: Any) -> Dict[str, Any]:
+    return {"value": value, "unit": unit, "higher_is_better": higher_is_better, **extra}
+
+
+async def bench_throughput(tasks: int = 20_000) -> Dict[str, Any]:
+    """Tasks per second through a parallel workflow with a zero-cost agent."""
+    engine = BlenderEngine()
+    engine.register_agent(SyntheticAgent())
+    contexts = _contexts(tasks)
+    start = time.perf_counter()
+    await engine.execute_workflow(contexts, parallel=True)
+    elapsed = time.perf_counter() - start
+    return _result(tasks / elapsed, "tasks/s", True, tasks=tasks, seconds=elapsed)
+
+
+async def bench_scheduling_overhead(tasks: int = 20_000) -> Dict[str, Any]:
+    """Engine overhead per task: sequential execute_task with a zero-cost agent."""
+    engine = BlenderEngine()
+    engine.register_agent(SyntheticAgent())
+    contexts = _contexts(tasks)
+    start = time.perf_counter()
+    for ctx in contexts:
+        await engine.execute_task(ctx)
+    elapsed = time.perf_counter() - start
+    return _result(elapsed / tasks * 1e6, "us/task", False, tasks=tasks)
+
+
+async def bench_dag_fanout(width: int = 2_000) -> Dict[str, Any]:
+    """Wall time of a generate -> N-way fan-out -> join graph."""
+    engine = BlenderEngine()
+    engine.register_agent(SyntheticAgent(latency=0.001))
+    root = TaskContext(task_id="root", task_type=TaskType.CODE_GENERATION, input_data={})
+    fan = [
+        TaskContext(task_id=f"fan-{i}", task_type=TaskType.CODE_REVIEW, input_data={}, depends_on=["root"])
+        for i in range(width)
+    ]
+    join = TaskContext(
+        task_id="join", task_type=TaskType.ORCHESTRATION, input_data={},
+        depends_on=[ctx.task_id for ctx in fan]
+    )
+    start = time.perf_counter()
+    await engine.execute_dag([root, *fan, join])
+    elapsed = time.perf_counter() - start
+    return _result(elapsed, "s", False, width=width)
+
+
+def _traced_bytes(build: Callable[[], Any]) -> int:
+    """Return the bytes still allocated by ``build()`` while its result is alive."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = build()
+    gc.collect()
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del kept
+    return used
+
+
+async def bench_history_memory(entries: int = 100_000, compact: bool = False) -> Dict[str, Any]:
+    """Memory retained by the task history per 100k results."""
+    def build() -> TaskHistory:
+        history = TaskHistory(compact=compact)
+        for i in range(entries):
+            history.append(TaskResult(
+                task_id=f"task-{i}",
+                status=TaskStatus.COMPLETED,
+                output={"i": i},
+                execution_time=0.001
+            ))
+        return history
+
+    used = _traced_bytes(build)
+    return _result(used * 100_000 / entries / 2 ** 20, "MiB/100k", False, entries=entries, compact=compact)
+
+
+async def bench_history_memory_compact(entries: int = 100_000) -> Dict[str, Any]:
+    """Memory retained by a compact task history per 100k results."""
+    return await bench_history_memory(entries, compact=True)
+
+
+async def bench_object_memory(count: int = 100_000) -> Dict[str, Any]:
+    """Bytes per context and result object, dataclass versus compact."""
+    def contexts(cls: Any) -> Callable[[], List[Any]]:
+        return lambda: [cls(task_id=f"task-{i}", task_type=TaskType.ANALYSIS, input_data={}) for i in range(count)]
+
+    def results(cls: Any) -> Callable[[], List[Any]]:
+        return lambda: [cls(task_id=f"task-{i}", status=TaskStatus.COMPLETED) for i in range(count)]
+
+    sizes = {
+        "context_bytes": _traced_bytes(contexts(TaskContext)) / count,
+        "compact_context_bytes": _traced_bytes(contexts(CompactTaskContext)) / count,
+        "result_bytes": _traced_bytes(results(TaskResult)) / count,
+        "compact_result_bytes": _traced_bytes(results(CompactTaskResult)) / count,
+    }
+    return _result(sizes["compact_result_bytes"], "B/result", False, count=count, **sizes)
+
+
+async def bench_result_codec(count: int = 50_000) -> Dict[str, Any]:
+    """Size and round-trip cost of packed result records versus JSON dictionaries."""
+    results = [
+        CompactTaskResult(f"task-{i}", TaskStatus.COMPLETED, {"i": i, "code": "x = 1"}, None, 0.001)
+        for i in range(count)
+    ]
+    start = time.perf_counter()
+    packed = [CompactTaskResult.unpack(r.pack()) for r in results]
+    packed_time = time.perf_counter() - start
+    start = time.perf_counter()
+    dumped = [TaskResult.from_dict(json.loads(json.dumps(r.to_dict()))) for r in results]
+    json_time = time.perf_counter() - start
+    return _result(
+        sum(len(r.pack()) for r in packed) / count, "bytes/record", False,
+        json_bytes=sum(len(json.dumps(r.to_dict())) for r in dumped) / count,
+        packed_us=packed_time / count * 1e6,
+        json_us=json_time / count * 1e6,
+        count=count
+    )
+
+
+async def bench_tail_latency(
+    tasks: int = 5_000,
+    latency: float = 0.002,
+    max_concurrency: int = 256
+) -> Dict[str, Any]:
+    """Per-task latency percentiles under a capped parallel load."""
+    engine = BlenderEngine(max_concurrency=max_concurrency)
+    engine.register_agent(SyntheticAgent(latency=latency))
+    results = await engine.execute_workflow(_contexts(tasks), parallel=True)
+    latencies = [r.execution_time for r in results]
+    return _result(
+        _percentile(latencies, 0.99) * 1e3, "ms p99", False,
+        p50_ms=_percentile(latencies, 0.50) * 1e3,
+        p95_ms=_percentile(latencies, 0.95) * 1e3,
+        tasks=tasks,
+        max_concurrency=max_concurrency
+    )
+
+
+async def bench_adaptive_concurrency(
+    tasks: int = 500,
+    capacity: int = 8,
+    latency: float = 0.002
+) -> Dict[str, Any]:
+    """Throughput against a load-degrading agent: unlimited versus adaptive limits."""
+    algorithms = {
+        "unlimited": None,
+        "aimd": AIMDLimit(timeout=latency * 3),
+        "gradient": GradientLimit(),
+    }
+    goodput = {}
+    limits = {}
+    for mode, algorithm in algorithms.items():
+        engine = BlenderEngine()
+        engine.register_agent(
+            SyntheticAgent(latency=latency, capacity=capacity),
+            adaptive_concurrency=algorithm
+        )
+        start = time.perf_counter()
+        results = await engine.execute_workflow(_contexts(tasks), parallel=True)
+        elapsed = time.perf_counter() - start
+        completed = sum(1 for r in results if r.status == TaskStatus.COMPLETED)
+        goodput[mode] = completed / elapsed
+        limits[mode] = engine.get_engine_status()["concurrency_limits"]["synthetic"]["limit"]
+    return _result(
+        goodput["gradient"], "completed/s", True,
+        unlimited=goodput["unlimited"],
+        aimd=goodput["aimd"],
+        final_limit_aimd=limits["aimd"],
+        final_limit_gradient=limits["gradient"],
+        capacity=capacity,
+        tasks=tasks
+    )
+
+
+BENCHMARKS: Dict[str, Callable[..., Any]] = {
+    "throughput": bench_throughput,
+    "scheduling_overhead": bench_scheduling_overhead,
+    "dag_fanout": bench_dag_fanout,
+    "history_memory": bench_history_memory,
+    "history_memory_compact": bench_history_memory_compact,
+    "object_memory": bench_object_memory,
+    "result_codec": bench_result_codec,
+    "tail_latency": bench_tail_latency,
+    "adaptive_concurrency": bench_adaptive_concurrency,
+}
+
+QUICK_ARGS: Dict[str, Dict[str, Any]] = {
+    "throughput": {"tasks": 2_000},
+    "scheduling_overhead": {"tasks": 2_000},
+    "dag_fanout": {"width": 200},
+    "history_memory": {"entries": 10_000},
+    "history_memory_compact": {"entries": 10_000},
+    "object_memory": {"count": 10_000},
+    "result_codec": {"count": 5_000},
+    "tail_latency": {"tasks": 500},
+    "adaptive_concurrency": {"tasks": 200},
+}
+
+
+async def run_suite(names: Optional[List[str]] = None, quick: bool = False) -> Dict[str, Any]:
+    """Run the selected benchmarks and return a JSON-serializable report."""
+    # Per-task INFO logging would dominate every measurement
+    engine_logger = logging.getLogger("blender_engine")
+    previous_level = engine_logger.level
+    engine_logger.setLevel(logging.WARNING)
+    try:
+        results = {}
+        for name in names or list(BENCHMARKS):
+            kwargs = QUICK_ARGS.get(name, {}) if quick else {}
+            results[name] = await BENCHMARKS[name](**kwargs)
+    finally:
+        engine_logger.setLevel(previous_level)
+    return {
+        "version": __version__,
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "timestamp": datetime.now().isoformat(),
+        "quick": quick,
+        "benchmarks": results,
+    }
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any], tolerance: float = 0.10) -> List[str]:
+    """
+    Compare two reports.
+
+    Returns:
+        Descriptions of benchmarks that regressed by more than ``tolerance``
+    """
+    regressions = []
+    for name, result in current["benchmarks"].items():
+        base = baseline.get("benchmarks", {}).get(name)
+        if not base or not base["value"]:
+            continue
+        change = (result["value"] - base["value"]) / base["value"]
+        worse = -change if result["higher_is_better"] else change
+        if worse > tolerance:
+            regressions.append(
+                f"{name}: {base['value']:.4g} -> {result['value']:.4g} {result['unit']} "
+                f"({worse:+.1%} worse)"
+            )
+    return regressions
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Blender Engine benchmark suite")
+    parser.add_argument("--output", metavar="FILE", help="Write the JSON report to FILE")
+    parser.add_argument("--compare", metavar="FILE", help="Baseline JSON report to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.10,
+                        help="Relative slowdown reported as a regression (default: 0.10)")
+    parser.add_argument("--quick", action="store_true", help="Run reduced problem sizes")
+    parser.add_argument("--only", action="append", choices=sorted(BENCHMARKS),
+                        help="Run only the named benchmark (repeatable)")
+    args = parser.parse_args()
+
+    report = asyncio.run(run_suite(args.only, args.quick))
+    for name, result in report["benchmarks"].items():
+        print(f"{name:24s} {result['value']:12.4g} {result['unit']}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"Report written to: {args.output}")
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(baseline, report, args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -6,17 +6,461 @@ Supports interactive mode, script execution, and Python integration.
 """
 
 import argparse
+import asyncio
+import heapq
+import itertools
+import json
 import sys
 import os
+import shutil
+import socket
 import subprocess
+import tempfile
+import time
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+try:
+    from .blender_worker import read_frame, write_frame
+except ImportError:  # run as a script
+    from blender_worker import read_frame, write_frame
+
+WORKER_SCRIPT = Path(__file__).with_name('blender_worker.py')
+
+# BlenderTool methods that generate and run a snippet
+TOOL_OPERATIONS = ('build', 'material', 'lighting', 'camera', 'render', 'export',
+                   'reset', 'optimize', 'procedural')
+
+
+@dataclass
+class BlenderRunResult:
+    """Outcome of one Blender process run by ``run_blender_async``."""
+    args: List[str]
+    returncode: Optional[int]
+    stdout: str
+    stderr: str
+    duration: float
+    timed_out: bool = False
+    
+    @property
+    def ok(self) -> bool:
+        return self.returncode == 0 and not self.timed_out
+
+
+async def _pump_lines(
+    stream: asyncio.StreamReader,
+    name: str,
+    lines: List[str],
+    on_output: Optional[Callable[[str, str], Any]]
+):
+    async for raw in stream:
+        line = raw.decode('utf-8', errors='replace')
+        lines.append(line)
+        if on_output is not None:
+            on_output(name, line.rstrip('\n'))
+
+
+async def _terminate(process: asyncio.subprocess.Process, grace: float):
+    """Ask the process to exit, killing it if it has not after ``grace`` seconds."""
+    if process.returncode is not None:
+        return
+    try:
+        process.terminate()
+        try:
+            await asyncio.wait_for(process.wait(), grace)
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+    except ProcessLookupError:
+        pass
+
+
+async def run_blender_async(
+    args: List[str],
+    timeout: Optional[float] = None,
+    on_output: Optional[Callable[[str, str], Any]] = None,
+    terminate_grace: float = 5.0,
+    cpus: Optional[Sequence[int]] = None
+) -> BlenderRunResult:
+    """
+    Run Blender without blocking the event loop.
+    
+    Args:
+        args: Full command line, e.g. from ``BlenderTool._get_blender_args``
+        timeout: Optional seconds before the process is stopped
+        on_output: Called with (``'stdout'`` or ``'stderr'``, line) as each
+            line arrives
+        terminate_grace: Seconds between SIGTERM and SIGKILL when stopping
+        cpus: CPUs to pin Blender to (Linux only; ignored elsewhere)
+        
+    Returns:
+        BlenderRunResult; a timed-out run has ``timed_out`` set
+        
+    If the calling task is cancelled, Blender is stopped the same way
+    before the cancellation propagates.
+    """
+    start = time.perf_counter()
+    preexec_fn = None
+    if cpus and hasattr(os, 'sched_setaffinity'):
+        # Set in the child before exec so every thread Blender starts inherits it
+        cpu_set = set(cpus)
+        preexec_fn = lambda: os.sched_setaffinity(0, cpu_set)
+    process = await asyncio.create_subprocess_exec(
+        *args,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        limit=1 << 20,
+        preexec_fn=preexec_fn
+    )
+    stdout: List[str] = []
+    stderr: List[str] = []
+    pumps = asyncio.gather(
+        _pump_lines(process.stdout, 'stdout', stdout, on_output),
+        _pump_lines(process.stderr, 'stderr', stderr, on_output)
+    )
+    timed_out = False
+    try:
+        try:
+            await asyncio.wait_for(process.wait(), timeout)
+        except asyncio.TimeoutError:
+            timed_out = True
+            await _terminate(process, terminate_grace)
+        await pumps
+    except BaseException:
+        # Cancelled: stop Blender, then let the readers drain its closed pipes
+        async def stop():
+            await _terminate(process, terminate_grace)
+            await pumps
+        await asyncio.shield(stop())
+        raise
+    
+    return BlenderRunResult(
+        args=list(args),
+        returncode=process.returncode,
+        stdout=''.join(stdout),
+        stderr=''.join(stderr),
+        duration=time.perf_counter() - start,
+        timed_out=timed_out
+    )
+
+
+class BlenderWorkerError(RuntimeError):
+    """The Blender worker could not be started or lost a command."""
+
+
+class BlenderWorker:
+    """
+    Long-lived Blender process that runs Python snippets sent over a local socket.
+    
+    Blender is started once with the ``blender_worker.py`` command server, so
+    commands skip Blender's startup cost. Before each command the worker is
+    health-checked with a ping; a worker that died or stopped answering is
+    restarted. A command that crashes Blender or exceeds its timeout fails,
+    and the worker is restarted for the next one. ``startup_code`` runs after
+    every (re)start, e.g. to reopen a session's scene.
+    """
+    
+    def __init__(
+        self,
+        blender_executable: str,
+        startup_timeout: float = 60.0,
+        command_timeout: float = 120.0,
+        health_timeout: float = 5.0,
+        max_restarts: int = 3,
+        startup_code: Optional[str] = None
+    ):
+        self.blender_executable = blender_executable
+        self.startup_code = startup_code
+        self.startup_timeout = startup_timeout
+        self.command_timeout = command_timeout
+        self.health_timeout = health_timeout
+        self.max_restarts = max_restarts
+        self.restarts = 0
+        self.process: Optional[subprocess.Popen] = None
+        self._conn: Optional[socket.socket] = None
+        self._dir = tempfile.mkdtemp(prefix='blender-worker-')
+        self.log_path = os.path.join(self._dir, 'worker.log')
+        self._log = None
+        if hasattr(socket, 'AF_UNIX'):
+            self.socket_path: Optional[str] = os.path.join(self._dir, 'worker.sock')
+            self.port: Optional[int] = None
+        else:
+            self.socket_path = None
+            with socket.socket() as probe:
+                probe.bind(('127.0.0.1', 0))
+                self.port = probe.getsockname()[1]
+    
+    def start(self):
+        """Start Blender and wait until the command server accepts connections."""
+        address = ['--socket', self.socket_path] if self.socket_path else ['--port', str(self.port)]
+        args = [self.blender_executable, '--background', '--python', str(WORKER_SCRIPT), '--'] + address
+        self._log = open(self.log_path, 'ab')
+        self.process = subprocess.Popen(
+            args,
+            stdin=subprocess.DEVNULL,
+            stdout=self._log,
+            stderr=subprocess.STDOUT
+        )
+        deadline = time.monotonic() + self.startup_timeout
+        while True:
+            if self.process.poll() is not None:
+                self._kill()
+                raise BlenderWorkerError(
+                    f"Blender worker exited during startup with code {self.process.returncode}; "
+                    f"see {self.log_path}"
+                )
+            try:
+                self._conn = self._connect()
+                break
+            except OSError:
+                if time.monotonic() > deadline:
+                    self._kill()
+                    raise BlenderWorkerError(f"Blender worker did not start within {self.startup_timeout}s")
+                time.sleep(0.05)
+        
+        if self.startup_code:
+            try:
+                reply = self._request({'op': 'exec', 'code': self.startup_code}, self.command_timeout)
+            except (OSError, ValueError) as e:
+                self._kill()
+                raise BlenderWorkerError(f"Blender worker failed during startup code: {e}")
+            if not reply.get('ok'):
+                self._kill()
+                raise BlenderWorkerError(f"Blender worker startup code failed: {reply.get('error')}")
+    
+    def _connect(self) -> socket.socket:
+        if self.socket_path:
+            conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            target: Any = self.socket_path
+        else:
+            conn = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            target = ('127.0.0.1', self.port)
+        try:
+            conn.settimeout(self.health_timeout)
+            conn.connect(target)
+        except OSError:
+            conn.close()
+            raise
+        return conn
+    
+    def _request(self, message: Dict[str, Any], timeout: float) -> Dict[str, Any]:
+        self._conn.settimeout(timeout)
+        write_frame(self._conn, message)
+        return read_frame(self._conn)
+    
+    def ping(self) -> bool:
+        """Return whether the worker process is alive and answering."""
+        if self.process is None or self.process.poll() is not None or self._conn is None:
+            return False
+        try:
+            return bool(self._request({'op': 'ping'}, self.health_timeout).get('ok'))
+        except (OSError, ValueError):
+            return False
+    
+    def restart(self):
+        """Replace the worker process, retrying startup up to ``max_restarts`` times."""
+        self._kill()
+        for attempt in range(1, self.max_restarts + 1):
+            self.restarts += 1
+            try:
+                self.start()
+                return
+            except BlenderWorkerError:
+                if attempt == self.max_restarts:
+                    raise
+    
+    def ensure_running(self):
+        """Start the worker, or restart it if it fails its health check."""
+        if self.process is None:
+            self.start()
+        elif not self.ping():
+            print("Blender worker is not responding; restarting")
+            self.restart()
+    
+    def execute(self, code: str, filename: Optional[str] = None, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Run Python code in the worker.
+        
+        Returns:
+            Reply with ``ok``, ``stdout``, ``stderr``, ``error`` and ``duration``
+            
+        Raises:
+            BlenderWorkerError: If the command timed out or Blender crashed
+        """
+        self.ensure_running()
+        try:
+            return self._request(
+                {'op': 'exec', 'code': code, 'filename': filename},
+                timeout or self.command_timeout
+            )
+        except socket.timeout:
+            self.restart()
+            raise BlenderWorkerError("Blender command timed out; worker restarted")
+        except (OSError, ValueError) as e:
+            self.restart()
+            raise BlenderWorkerError(f"Blender worker crashed during the command ({e}); worker restarted")
+    
+    def stop(self):
+        """Ask the worker to exit, killing it if it does not."""
+        if self.process is not None and self.process.poll() is None and self._conn is not None:
+            try:
+                self._request({'op': 'shutdown'}, self.health_timeout)
+                self.process.wait(timeout=self.health_timeout)
+            except (OSError, ValueError, subprocess.TimeoutExpired):
+                pass
+        self._kill()
+        shutil.rmtree(self._dir, ignore_errors=True)
+    
+    def _kill(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+        if self.process is not None and self.process.poll() is None:
+            self.process.kill()
+            self.process.wait()
+        if self._log is not None:
+            self._log.close()
+            self._log = None
+    
+    def __enter__(self) -> "BlenderWorker":
+        self.ensure_running()
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+
+class BlenderSession:
+    """
+    A scene that persists between BlenderTool commands as a ``.blend`` file.
+    
+    Sessions are named; a name resolves to ``<name>.blend`` in the sessions
+    directory (``$BLENDER_TOOL_SESSIONS`` or ``~/.blender_tool/sessions``),
+    while a value ending in ``.blend`` is used as the file path itself. The
+    file is written after every successful command, uncompressed and
+    without ``.blend1`` backups so that saves stay fast.
+    """
+    
+    def __init__(self, name: str, directory: Optional[str] = None):
+        if name.endswith('.blend'):
+            self.path = Path(name).expanduser().resolve()
+            self.name = self.path.stem
+        else:
+            directory = directory or os.environ.get('BLENDER_TOOL_SESSIONS') or Path.home() / '.blender_tool' / 'sessions'
+            self.path = Path(directory).expanduser().resolve() / f'{name}.blend'
+            self.name = name
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+    
+    @property
+    def exists(self) -> bool:
+        return self.path.exists()
+    
+    def load_code(self) -> str:
+        """Python that opens the session's last saved scene, or the startup scene if none."""
+        return f"""
+import bpy, os
+if os.path.exists({str(self.path)!r}):
+    bpy.ops.wm.open_mainfile(filepath={str(self.path)!r})
+else:
+    bpy.ops.wm.read_homefile()
+"""
+    
+    def save_code(self) -> str:
+        """Python that saves the current scene to the session file."""
+        return f"""
+import bpy
+bpy.context.preferences.filepaths.save_version = 0
+bpy.ops.wm.save_as_mainfile(filepath={str(self.path)!r}, compress=False, check_existing=False)
+"""
+    
+    def delete(self):
+        """Discard the saved scene."""
+        if self.path.exists():
+            self.path.unlink()
 
 
 class BlenderTool:
     """Blender CLI Tool for managing Blender operations."""
     
-    def __init__(self):
-        self.blender_executable = self._find_blender()
+    def __init__(
+        self,
+        use_worker: bool = False,
+        session: Optional[str] = None,
+        command_timeout: Optional[float] = 120.0,
+        blender_executable: Optional[str] = None
+    ):
+        self.blender_executable = blender_executable or self._find_blender()
+        self.session = BlenderSession(session) if session else None
+        self.command_timeout = command_timeout
+        self.worker = None
+        self._capture: Optional[List[str]] = None
+        if use_worker:
+            self.worker = BlenderWorker(
+                self.blender_executable,
+                command_timeout=command_timeout,
+                startup_code=self.session.load_code() if self.session else None
+            )
+    
+    def snippet(self, operation: str, **params: Any) -> str:
+        """
+        Return the Python code an operation such as ``build`` would run.
+        
+        Raises:
+            ValueError: If ``operation`` is not one of TOOL_OPERATIONS
+        """
+        if operation not in TOOL_OPERATIONS:
+            raise ValueError(f"Unknown operation: {operation}")
+        captured: List[str] = []
+        self._capture = captured
+        try:
+            getattr(self, operation)(**params)
+        finally:
+            self._capture = None
+        return captured[0]
+    
+    async def run_code_async(
+        self,
+        python_code: str,
+        timeout: Optional[float] = None,
+        on_output: Optional[Callable[[str, str], Any]] = None
+    ) -> BlenderRunResult:
+        """Run Python code in a new Blender process from asyncio code."""
+        return await run_blender_async(
+            self._get_blender_args(python_code=python_code),
+            timeout=timeout,
+            on_output=on_output
+        )
+    
+    async def run_async(
+        self,
+        operation: str,
+        timeout: Optional[float] = None,
+        on_output: Optional[Callable[[str, str], Any]] = None,
+        **params: Any
+    ) -> BlenderRunResult:
+        """
+        Run an operation such as ``render`` in a new Blender process from asyncio code.
+        
+        Example:
+            result = await tool.run_async('render', engine='eevee', timeout=3600)
+        """
+        return await self.run_code_async(self.snippet(operation, **params), timeout, on_output)
+    
+    def pool(self, slots: Optional[int] = None, threads: Optional[int] = None, pin_cpus: bool = True) -> "BlenderJobPool":
+        """Create a pool that runs several Blender processes at once."""
+        return BlenderJobPool(self.blender_executable, slots=slots, threads=threads, pin_cpus=pin_cpus)
+    
+    def batch(self, stop_on_error: bool = True) -> "BlenderBatch":
+        """Start a batch of operations that run in a single Blender launch."""
+        return BlenderBatch(self, stop_on_error=stop_on_error)
+    
+    def close(self):
+        """Stop the persistent Blender worker, if one is running."""
+        if self.worker is not None:
+            self.worker.stop()
+            self.worker = None
     
     def _find_blender(self) -> str:
         """Find Blender executable in system PATH."""
@@ -38,14 +482,23 @@ class BlenderTool:
         return 'blender'  # Default to 'blender' if not found
     
     def _get_blender_args(self, python_code: str = None, python_file: str = None) -> list:
-        """Get Blender command arguments."""
-        args = [self.blender_executable, '--background']
+        """Get Blender command arguments, opening and saving the session scene if any."""
+        # Blender exits 0 when a script raises unless told otherwise; this
+        # also stops a failed command from being saved to a session
+        args = [self.blender_executable, '--background', '--python-exit-code', '1']
+        
+        if self.session is not None and self.session.exists:
+            args.append(str(self.session.path))
         
         if python_code:
             args.extend(['--python-expr', python_code])
         elif python_file:
             args.extend(['--python', python_file])
         
+        if self.session is not None:
+            # Blender runs scripts in order, so this saves after the command
+            args.extend(['--python-expr', self.session.save_code()])
+        
         return args
     
     def build(self, scene_type: str = 'default', interactive: bool = False):
@@ -89,8 +542,7 @@ else:
 print("Scene built successfully with type: '{scene_type}'")
 """
         
-        args = self._get_blender_args(python_code=python_code)
-        self._run_blender(args)
+        self._run_code(python_code)
     
     def material(self, material_type: str = ' principled', name: str = 'NewMaterial', interactive: bool = False):
         """Create or modify materials."""
@@ -171,8 +623,7 @@ else:
 print("Material '{name}' created with type: '{material_type}'")
 """
         
-        args = self._get_blender_args(python_code=python_code)
-        self._run_blender(args)
+        self._run_code(python_code)
     
     def lighting(self, light_type: str = 'area', energy: float = 100, interactive: bool = False):
         """Setup lighting in the scene."""
@@ -258,8 +709,7 @@ else:
 print("Lighting setup complete with type: '{light_type}', energy: {energy}")
 """
         
-        args = self._get_blender_args(python_code=python_code)
-        self._run_blender(args)
+        self._run_code(python_code)
     
     def camera(self, camera_type: str = 'perspective', position: tuple = None, interactive: bool = False):
         """Setup camera in the scene."""
@@ -310,8 +760,7 @@ camera.rotation_euler = rot_quat.to_euler()
 print("Camera setup complete with type: '{camera_type}' at position: ({pos_x}, {pos_y}, {pos_z})")
 """
         
-        args = self._get_blender_args(python_code=python_code)
-        self._run_blender(args)
+        self._run_code(python_code)
     
     def render(self, engine: str = 'cycles', samples: int = 128, output_path: str = '/tmp/render.png', interactive: bool = False):
         """Render the scene."""
@@ -348,8 +797,7 @@ print(f"Render complete using {engine} engine with {samples} samples")
 print(f"Output saved to: {{'{output_path}'}}")
 """
         
-        args = self._get_blender_args(python_code=python_code)
-        self._run_blender(args)
+        self._run_code(python_code)
     
     def export(self, format: str = 'obj', output_path: str = '/tmp/export', interactive: bool = False):
         """Export the scene to various formats."""
@@ -408,8 +856,7 @@ else:
     print("Supported formats: obj, fbx, gltf, usd, stl")
 """
         
-        args = self._get_blender_args(python_code=python_code)
-        self._run_blender(args)
+        self._run_code(python_code)
     
     def reset(self, interactive: bool = False):
         """Reset the Blender scene."""
@@ -443,8 +890,7 @@ bpy.context.scene.cycles.samples = 128
 print("Scene reset complete")
 """
         
-        args = self._get_blender_args(python_code=python_code)
-        self._run_blender(args)
+        self._run_code(python_code)
     
     def optimize(self, level: str = 'medium', interactive: bool = False):
         """Optimize the Blender scene."""
@@ -491,8 +937,7 @@ for obj in bpy.data.objects:
 print(f"Scene optimization complete at level: '{level}'")
 """
         
-        args = self._get_blender_args(python_code=python_code)
-        self._run_blender(args)
+        self._run_code(python_code)
     
     def procedural(self, procedural_type: str = 'terrain', interactive: bool = False):
         """Create procedural content."""
@@ -622,8 +1067,7 @@ else:
 print(f"Procedural generation complete: '{{'{procedural_type}'}}'")
 """
         
-        args = self._get_blender_args(python_code=python_code)
-        self._run_blender(args)
+        self._run_code(python_code)
     
     def run_file(self, file_path: str):
         """Run a Python script file in Blender."""
@@ -631,8 +1075,12 @@ print(f"Procedural generation complete: '{{'{procedural_type}'}}'")
             print(f"Error: File not found: {file_path}")
             return False
         
-        args = self._get_blender_args(python_file=file_path)
-        self._run_blender(args)
+        if self.worker is not None:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                self._run_code(f.read(), filename=file_path)
+        else:
+            args = self._get_blender_args(python_file=file_path)
+            self._run_blender(args)
     
     def run_interactive(self):
         """Run in interactive mode."""
@@ -707,6 +1155,55 @@ print(f"Procedural generation complete: '{{'{procedural_type}'}}'")
             except Exception as e:
                 print(f"Error: {e}")
     
+    def _run_code(self, python_code: str, filename: Optional[str] = None):
+        """Run Python code in the persistent worker, or in a new Blender process."""
+        if self._capture is not None:
+            # A batch is collecting the generated code instead of running it
+            self._capture.append(python_code)
+            return
+        
+        if self.worker is None:
+            self._run_blender(self._get_blender_args(python_code=python_code))
+            return
+        
+        if self.session is not None:
+            python_code = f"{python_code}\n{self.session.save_code()}"
+        
+        try:
+            reply = self.worker.execute(python_code, filename=filename)
+        except BlenderWorkerError as e:
+            print(f"Blender operation failed: {e}")
+            return
+        
+        if reply.get('ok'):
+            print(f"Blender operation completed successfully in {reply.get('duration', 0):.2f}s")
+            if reply.get('stdout'):
+                print(reply['stdout'])
+        else:
+            print("Blender operation failed")
+            if reply.get('stdout'):
+                print(reply['stdout'])
+            print(f"Error: {reply.get('error')}")
+            self._restore_session()
+    
+    def _restore_session(self):
+        """
+        Discard a failed command's partial edits from the worker's live scene.
+        
+        Without this, the next successful command would save them to the
+        session file. The worker reopens the last saved scene, or is
+        restarted (which also reopens it) if that fails.
+        """
+        if self.worker is None or self.session is None:
+            return
+        try:
+            if self.worker.execute(self.session.load_code()).get('ok'):
+                return
+        except BlenderWorkerError:
+            # The worker was restarted, which reopened the scene
+            return
+        self.worker.restart()
+    
     def _run_blender(self, args: list):
         """Run Blender with given arguments."""
         try:
@@ -714,7 +1211,7 @@ print(f"Procedural generation complete: '{{'{procedural_type}'}}'")
                 args,
                 capture_output=True,
                 text=True,
-                timeout=120
+                timeout=self.command_timeout
             )
             
             if result.returncode == 0:
@@ -732,6 +1229,460 @@ print(f"Procedural generation complete: '{{'{procedural_type}'}}'")
             print(f"Error running Blender: {e}")
 
 
+def load_spec(path: str) -> Any:
+    """Load a JSON or YAML (needs PyYAML) spec file; ``-`` reads JSON from stdin."""
+    if path == '-':
+        return json.load(sys.stdin)
+    with open(path, 'r', encoding='utf-8') as f:
+        if path.endswith(('.yaml', '.yml')):
+            try:
+                import yaml
+            except ImportError:
+                raise ImportError("YAML specs require PyYAML: pip install pyyaml")
+            return yaml.safe_load(f)
+        return json.load(f)
+
+
+STEP_MARKER = '@@BLENDER_STEP@@ '
+
+# Runs inside Blender: each step gets its own namespace, and its outcome is
+# printed as a marker line for BlenderBatch to parse
+_BATCH_RUNNER = '''
+import contextlib, io, json, time, traceback
+_failed = False
+for _index, (_op, _code) in enumerate(_STEPS):
+    _out = io.StringIO()
+    _error = None
+    _start = time.perf_counter()
+    with contextlib.redirect_stdout(_out), contextlib.redirect_stderr(_out):
+        try:
+            exec(compile(_code, '<step %d: %s>' % (_index, _op), 'exec'), {'__name__': '__main__'})
+        except BaseException:
+            _error = traceback.format_exc()
+    print(_MARKER + json.dumps({
+        'step': _index, 'ok': _error is None, 'output': _out.getvalue(),
+        'error': _error, 'duration': time.perf_counter() - _start,
+    }), flush=True)
+    if _error is not None:
+        _failed = True
+        if _STOP_ON_ERROR:
+            break
+if _failed:
+    raise RuntimeError('Blender batch had failed steps')
+'''
+
+
+class BlenderBatch:
+    """
+    Ordered BlenderTool operations compiled into one script for one Blender launch.
+    
+    Steps are BlenderTool method names with their keyword arguments, or
+    ``python`` with a ``code`` snippet. Each step runs in its own namespace
+    and reports its own result; after a failure the remaining steps are
+    skipped unless ``stop_on_error`` is False. A session scene is saved only
+    if every step succeeded.
+    
+    Example:
+        results = (tool.batch()
+                   .add('build', scene_type='architectural')
+                   .add('lighting', light_type='three-point')
+                   .add('render', engine='eevee', output_path='/tmp/out.png')
+                   .run())
+    """
+    
+    OPERATIONS = TOOL_OPERATIONS + ('python',)
+    
+    # Spec files may use the CLI option names
+    CLI_PARAMS = {
+        'build': {'type': 'scene_type'},
+        'material': {'type': 'material_type'},
+        'lighting': {'type': 'light_type'},
+        'camera': {'type': 'camera_type'},
+        'render': {'output': 'output_path'},
+        'export': {'output': 'output_path'},
+        'procedural': {'type': 'procedural_type'},
+    }
+    
+    def __init__(self, tool: BlenderTool, stop_on_error: bool = True):
+        self.tool = tool
+        self.stop_on_error = stop_on_error
+        self.steps: List[Dict[str, Any]] = []
+    
+    def add(self, operation: str, **params: Any) -> "BlenderBatch":
+        """
+        Append a step.
+        
+        Raises:
+            ValueError: If the operation is unknown
+        """
+        if operation not in self.OPERATIONS:
+            raise ValueError(f"Unknown batch operation: {operation}")
+        aliases = self.CLI_PARAMS.get(operation, {})
+        params = {aliases.get(key, key): value for key, value in params.items()}
+        if operation == 'camera' and params.get('position') is not None:
+            params['position'] = tuple(params['position'])
+        self.steps.append({'operation': operation, 'params': params})
+        return self
+    
+    def python(self, code: str) -> "BlenderBatch":
+        """Append a raw Python step."""
+        return self.add('python', code=code)
+    
+    @classmethod
+    def from_spec(cls, tool: BlenderTool, spec: Any) -> "BlenderBatch":
+        """
+        Build a batch from a spec: a list of steps, or a mapping with ``steps``
+        and optional ``stop_on_error``. Each step is a mapping with ``op``
+        and that operation's parameters.
+        """
+        if isinstance(spec, dict):
+            batch = cls(tool, stop_on_error=spec.get('stop_on_error', True))
+            steps = spec.get('steps', [])
+        else:
+            batch = cls(tool)
+            steps = spec
+        for step in steps:
+            step = dict(step)
+            batch.add(step.pop('op'), **step)
+        return batch
+    
+    @classmethod
+    def from_file(cls, tool: BlenderTool, path: str) -> "BlenderBatch":
+        """Load a JSON or YAML (needs PyYAML) spec file; ``-`` reads JSON from stdin."""
+        return cls.from_spec(tool, load_spec(path))
+    
+    def _snippet(self, step: Dict[str, Any]) -> str:
+        if step['operation'] == 'python':
+            return step['params']['code']
+        return self.tool.snippet(step['operation'], **step['params'])
+    
+    def script(self) -> str:
+        """The combined script for all steps."""
+        steps = [(step['operation'], self._snippet(step)) for step in self.steps]
+        return (
+            f"_STEPS = {steps!r}\n"
+            f"_MARKER = {STEP_MARKER!r}\n"
+            f"_STOP_ON_ERROR = {self.stop_on_error!r}\n"
+            f"{_BATCH_RUNNER}"
+        )
+    
+    def run(self, timeout: Optional[float] = 600) -> List[Dict[str, Any]]:
+        """
+        Run every step in one Blender launch (or in the tool's worker).
+        
+        Args:
+            timeout: Seconds the whole batch may run; None for no limit
+        
+        Returns:
+            One result per step with ``step``, ``operation``, ``params``,
+            ``status`` (completed, failed or skipped), ``output``, ``error``
+            and ``duration``
+        """
+        script = self.script()
+        error = None
+        if self.tool.worker is not None:
+            if self.tool.session is not None:
+                script = f"{script}\n{self.tool.session.save_code()}"
+            try:
+                reply = self.tool.worker.execute(script, filename='<blender-batch>', timeout=timeout)
+                output, error = reply.get('stdout', ''), reply.get('error')
+                if not reply.get('ok'):
+                    self.tool._restore_session()
+            except BlenderWorkerError as e:
+                output, error = '', str(e)
+        else:
+            with tempfile.NamedTemporaryFile('w', suffix='.py', delete=False) as f:
+                f.write(script)
+            try:
+                result = subprocess.run(
+                    self.tool._get_blender_args(python_file=f.name),
+                    capture_output=True,
+                    text=True,
+                    timeout=timeout
+                )
+                output = result.stdout
+                if result.returncode != 0:
+                    error = result.stderr or f"Blender exited with code {result.returncode}"
+            except subprocess.TimeoutExpired:
+                output, error = '', f"Blender batch timed out after {timeout}s"
+            finally:
+                os.unlink(f.name)
+        
+        reported = {}
+        for line in output.splitlines():
+            if line.startswith(STEP_MARKER):
+                data = json.loads(line[len(STEP_MARKER):])
+                reported[data['step']] = data
+        
+        results = []
+        for index, step in enumerate(self.steps):
+            data = reported.get(index)
+            if data is not None:
+                status = 'completed' if data['ok'] else 'failed'
+            else:
+                # Not reached: skipped after a failure, or lost with the process
+                status = 'skipped' if any(not d['ok'] for d in reported.values()) else 'failed'
+                data = {'output': '', 'error': None if status == 'skipped' else error, 'duration': 0.0}
+            results.append({
+                'step': index,
+                'operation': step['operation'],
+                'params': step['params'],
+                'status': status,
+                'output': data['output'],
+                'error': data['error'],
+                'duration': data['duration'],
+            })
+        return results
+
+
+def print_batch_results(results: List[Dict[str, Any]]):
+    """Print a per-step report of a batch run."""
+    for r in results:
+        print(f"[{r['step']}] {r['operation']:<10} {r['status']:<9} {r['duration']:.2f}s")
+        if r['output'].strip():
+            print('    ' + r['output'].strip().replace('\n', '\n    '))
+        if r['error']:
+            print('    ' + r['error'].strip().replace('\n', '\n    '))
+    completed = sum(r['status'] == 'completed' for r in results)
+    print(f"Batch: {completed}/{len(results)} steps completed")
+
+
+@dataclass
+class BlenderJob:
+    """A queued Blender run: Python code or a script, optionally on a .blend file."""
+    job_id: str
+    python_code: Optional[str] = None
+    python_file: Optional[str] = None
+    blend_file: Optional[str] = None
+    priority: int = 0
+    timeout: Optional[float] = None
+    slot: Optional[int] = None
+    queued_at: float = field(default_factory=time.monotonic)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    result: Optional[BlenderRunResult] = None
+    
+    @property
+    def ok(self) -> bool:
+        return self.result is not None and self.result.ok
+    
+    @property
+    def run_time(self) -> Optional[float]:
+        if self.started_at is None or self.finished_at is None:
+            return None
+        return self.finished_at - self.started_at
+
+
+class BlenderJobPool:
+    """
+    Runs queued Blender jobs in several Blender processes at once.
+    
+    The pool has ``slots`` concurrent processes. Each one gets
+    ``--threads <threads>`` and, with ``pin_cpus`` on Linux, its own CPU
+    set, so slots * threads processes never oversubscribe the cores
+    available to this process. By default the available CPUs are split
+    into slots of up to four threads. Higher priorities run first; ties
+    run in submit order.
+    
+    Example:
+        pool = tool.pool(slots=4)
+        for path in blend_files:
+            pool.submit(tool.snippet('render', output_path=path + '.png'), blend_file=path)
+        jobs = pool.run_sync()
+        print(pool.stats())
+    """
+    
+    def __init__(
+        self,
+        blender_executable: str = 'blender',
+        slots: Optional[int] = None,
+        threads: Optional[int] = None,
+        pin_cpus: bool = True,
+        on_output: Optional[Callable[[BlenderJob, str, str], Any]] = None
+    ):
+        if hasattr(os, 'sched_getaffinity'):
+            cpus = sorted(os.sched_getaffinity(0))
+        else:
+            cpus = list(range(os.cpu_count() or 1))
+        if slots is None and threads is None:
+            threads = min(4, len(cpus))
+        if slots is None:
+            slots = max(1, len(cpus) // threads)
+        if threads is None:
+            threads = max(1, len(cpus) // slots)
+        if slots < 1 or threads < 1:
+            raise ValueError("slots and threads must be at least 1")
+        
+        self.blender_executable = blender_executable
+        self.slots = slots
+        self.threads = threads
+        self.pin_cpus = pin_cpus and hasattr(os, 'sched_setaffinity')
+        self.on_output = on_output
+        # Consecutive CPUs per slot; wraps around if slots * threads exceeds them
+        self.slot_cpus = [
+            [cpus[(slot * threads + i) % len(cpus)] for i in range(threads)]
+            for slot in range(slots)
+        ]
+        self.finished: List[BlenderJob] = []
+        self._heap: List[tuple] = []
+        self._seq = itertools.count()
+        self._busy = [0.0] * slots
+        self._started: Optional[float] = None
+        self._stopped: Optional[float] = None
+    
+    def submit(
+        self,
+        python_code: Optional[str] = None,
+        python_file: Optional[str] = None,
+        blend_file: Optional[str] = None,
+        priority: int = 0,
+        timeout: Optional[float] = None,
+        job_id: Optional[str] = None
+    ) -> BlenderJob:
+        """
+        Queue a job.
+        
+        Raises:
+            ValueError: If neither ``python_code`` nor ``python_file`` is given
+        """
+        if python_code is None and python_file is None:
+            raise ValueError("A job needs python_code or python_file")
+        seq = next(self._seq)
+        job = BlenderJob(
+            job_id=job_id or f"job-{seq}",
+            python_code=python_code,
+            python_file=python_file,
+            blend_file=blend_file,
+            priority=priority,
+            timeout=timeout
+        )
+        heapq.heappush(self._heap, (-priority, seq, job))
+        return job
+    
+    def _args(self, job: BlenderJob) -> List[str]:
+        args = [self.blender_executable, '--background', '--python-exit-code', '1']
+        if job.blend_file:
+            args.append(job.blend_file)
+        args.extend(['--threads', str(self.threads)])
+        if job.python_code is not None:
+            args.extend(['--python-expr', job.python_code])
+        else:
+            args.extend(['--python', job.python_file])
+        return args
+    
+    async def _run_slot(self, slot: int):
+        while self._heap:
+            entry = heapq.heappop(self._heap)
+            job = entry[2]
+            job.slot = slot
+            job.started_at = time.monotonic()
+            on_output = None
+            if self.on_output is not None:
+                on_output = lambda stream, line, job=job: self.on_output(job, stream, line)
+            try:
+                job.result = await run_blender_async(
+                    self._args(job),
+                    timeout=job.timeout,
+                    on_output=on_output,
+                    cpus=self.slot_cpus[slot] if self.pin_cpus else None
+                )
+            except asyncio.CancelledError:
+                # Requeue it in its old place so a later run() picks it up
+                job.slot = job.started_at = None
+                heapq.heappush(self._heap, entry)
+                raise
+            except OSError as e:
+                job.result = BlenderRunResult(self._args(job), None, '', str(e), 0.0)
+            job.finished_at = time.monotonic()
+            self._busy[slot] += job.run_time
+            self.finished.append(job)
+    
+    async def run(self) -> List[BlenderJob]:
+        """
+        Run queued jobs until the queue is empty.
+        
+        Returns:
+            The jobs finished by this call, in completion order. Cancelling
+            the call stops the running Blender processes and puts their
+            jobs back in the queue.
+        """
+        already = len(self.finished)
+        if self._started is None:
+            self._started = time.monotonic()
+        try:
+            await asyncio.gather(*(self._run_slot(slot) for slot in range(self.slots)))
+        finally:
+            self._stopped = time.monotonic()
+        return self.finished[already:]
+    
+    def run_sync(self) -> List[BlenderJob]:
+        """Run queued jobs from synchronous code (not from a running event loop)."""
+        return asyncio.run(self.run())
+    
+    def stats(self) -> Dict[str, Any]:
+        """Throughput and slot utilization of the jobs run so far."""
+        elapsed = (self._stopped or time.monotonic()) - self._started if self._started else 0.0
+        completed = sum(1 for job in self.finished if job.ok)
+        return {
+            'slots': self.slots,
+            'threads': self.threads,
+            'queued': len(self._heap),
+            'finished': len(self.finished),
+            'completed': completed,
+            'failed': len(self.finished) - completed,
+            'elapsed': elapsed,
+            'jobs_per_minute': len(self.finished) * 60.0 / elapsed if elapsed > 0 else 0.0,
+            'utilization': sum(self._busy) / (elapsed * self.slots) if elapsed > 0 else 0.0,
+        }
+
+
+def submit_pool_spec(pool: BlenderJobPool, tool: BlenderTool, spec: Any) -> List[BlenderJob]:
+    """
+    Queue jobs from a spec: a list of jobs, or a mapping with ``jobs``.
+    
+    Each job is a mapping with one of ``op`` (a BlenderTool operation and
+    its parameters), ``python`` (code) or ``script`` (a file), plus
+    optional ``blend``, ``priority``, ``timeout`` and ``id``.
+    """
+    jobs = spec.get('jobs', []) if isinstance(spec, dict) else spec
+    submitted = []
+    for entry in jobs:
+        entry = dict(entry)
+        options = {
+            'blend_file': entry.pop('blend', None),
+            'priority': entry.pop('priority', 0),
+            'timeout': entry.pop('timeout', None),
+            'job_id': entry.pop('id', None),
+        }
+        if 'python' in entry:
+            submitted.append(pool.submit(python_code=entry['python'], **options))
+        elif 'script' in entry:
+            submitted.append(pool.submit(python_file=entry['script'], **options))
+        else:
+            operation = entry.pop('op')
+            if operation not in TOOL_OPERATIONS:
+                raise ValueError(f"Unknown pool operation: {operation}")
+            aliases = BlenderBatch.CLI_PARAMS.get(operation, {})
+            params = {aliases.get(key, key): value for key, value in entry.items()}
+            submitted.append(pool.submit(python_code=tool.snippet(operation, **params), **options))
+    return submitted
+
+
+def print_pool_stats(jobs: List[BlenderJob], stats: Dict[str, Any]):
+    """Print a per-job report and the throughput of a pool run."""
+    for job in jobs:
+        result = job.result
+        status = 'ok' if job.ok else ('timed out' if result.timed_out else f'failed ({result.returncode})')
+        print(f"{job.job_id:<20} slot {job.slot}  priority {job.priority:<3} {job.run_time:7.2f}s  {status}")
+        if not job.ok and result.stderr.strip():
+            print('    ' + result.stderr.strip().replace('\n', '\n    '))
+    print(
+        f"Pool: {stats['completed']}/{stats['finished']} jobs completed in {stats['elapsed']:.2f}s "
+        f"({stats['jobs_per_minute']:.1f} jobs/min, {stats['slots']} slots x {stats['threads']} threads, "
+        f"{stats['utilization']:.0%} slot utilization)"
+    )
+
+
 def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(
@@ -751,6 +1702,11 @@ Examples:
   %(prog)s -i                             # Interactive mode
   %(prog)s --file script.py               # Run script file
   %(prog)s --python "import bpy"          # Run Python code
+  %(prog)s -i --worker                    # Interactive mode with a warm Blender
+  %(prog)s build --session demo           # Build into the "demo" session scene
+  %(prog)s render --session demo          # Render the same scene
+  %(prog)s batch --spec job.json          # Run several steps in one Blender launch
+  %(prog)s pool --spec jobs.json --slots 4  # Run queued jobs in 4 Blender processes
         """
     )
     
@@ -758,7 +1714,7 @@ Examples:
     parser.add_argument(
         'command',
         nargs='?',
-        choices=['build', 'material', 'lighting', 'camera', 'render', 'export', 'reset', 'optimize', 'procedural'],
+        choices=['build', 'material', 'lighting', 'camera', 'render', 'export', 'reset', 'optimize', 'procedural', 'batch', 'pool'],
         help='Command to execute'
     )
     
@@ -783,6 +1739,67 @@ Examples:
         help='Execute Python code in Blender'
     )
     
+    # Persistent worker
+    parser.add_argument(
+        '--worker',
+        action='store_true',
+        help='Keep one Blender process running and send commands to it'
+    )
+    
+    # Persistent scene
+    parser.add_argument(
+        '--session',
+        metavar='NAME',
+        help='Run commands against a saved scene (a session name or .blend path)'
+    )
+    parser.add_argument(
+        '--new-session',
+        action='store_true',
+        help='Discard the saved scene of --session before running'
+    )
+    
+    parser.add_argument(
+        '--timeout',
+        type=float,
+        default=120.0,
+        metavar='SECONDS',
+        help='Seconds a Blender command may run (default: 120; 0 for no limit)'
+    )
+    
+    # Batch mode
+    parser.add_argument(
+        '--spec',
+        metavar='FILE',
+        help='Batch or pool spec (JSON, or YAML with PyYAML; - for JSON on stdin)'
+    )
+    parser.add_argument(
+        '--keep-going',
+        action='store_true',
+        help='Run the remaining batch steps after a step fails'
+    )
+    
+    # Job pool
+    parser.add_argument(
+        '--slots',
+        type=int,
+        help='Blender processes the pool runs at once (default: CPUs / threads)'
+    )
+    parser.add_argument(
+        '--threads',
+        type=int,
+        help='Threads per pooled Blender process (default: CPUs / slots, at most 4 if neither is set)'
+    )
+    parser.add_argument(
+        '--no-pin',
+        action='store_true',
+        help='Do not pin pooled Blender processes to CPUs'
+    )
+    parser.add_argument(
+        '--blender',
+        metavar='PATH',
+        help='Blender executable to use instead of the one found on PATH'
+    )
+    
     # Command-specific arguments
     parser.add_argument(
         '--type',
@@ -854,16 +1871,29 @@ Examples:
     args = parser.parse_args()
     
     # Create tool instance
-    tool = BlenderTool()
+    tool = BlenderTool(
+        use_worker=args.worker,
+        session=args.session,
+        command_timeout=args.timeout or None,
+        blender_executable=args.blender
+    )
+    if args.new_session and tool.session is not None:
+        tool.session.delete()
     
-    # Handle modes
+    try:
+        _dispatch(tool, args, parser)
+    finally:
+        tool.close()
+
+
+def _dispatch(tool: BlenderTool, args: argparse.Namespace, parser: argparse.ArgumentParser):
+    """Run the mode or command selected on the command line."""
     if args.interactive:
         tool.run_interactive()
     elif args.file:
         tool.run_file(args.file)
     elif args.python:
-        args_blender = tool._get_blender_args(python_code=args.python)
-        tool._run_blender(args_blender)
+        tool._run_code(args.python)
     elif args.command:
         # Execute command
         if args.command == 'build':
@@ -884,6 +1914,26 @@ Examples:
             tool.optimize(args.level)
         elif args.command == 'procedural':
             tool.procedural(args.type)
+        elif args.command == 'batch':
+            if not args.spec:
+                parser.error("batch requires --spec")
+            batch = BlenderBatch.from_file(tool, args.spec)
+            if args.keep_going:
+                batch.stop_on_error = False
+            results = batch.run(timeout=args.timeout or None)
+            print_batch_results(results)
+            if any(r['status'] != 'completed' for r in results):
+                sys.exit(1)
+        elif args.command == 'pool':
+            if not args.spec:
+                parser.error("pool requires --spec")
+            pool = tool.pool(slots=args.slots, threads=args.threads, pin_cpus=not args.no_pin)
+            submit_pool_spec(pool, tool, load_spec(args.spec))
+            jobs = pool.run_sync()
+            stats = pool.stats()
+            print_pool_stats(jobs, stats)
+            if stats['failed']:
+                sys.exit(1)
     else:
         parser.print_help()
 
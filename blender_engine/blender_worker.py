@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Blender Worker
+Command server that runs inside a long-lived Blender process.
+
+Started by BlenderTool as:
+    blender --background --python blender_worker.py -- --socket /tmp/worker.sock
+    blender --background --python blender_worker.py -- --port 7500
+
+Requests and replies are frames of a 4-byte big-endian length followed by a
+UTF-8 JSON object (the same framing as blender_engine.remote). Commands run
+one at a time on Blender's main thread. This file only uses the standard
+library, because it runs on Blender's bundled Python.
+
+    {"op": "ping"}                        -> {"ok": true, "pid": ...}
+    {"op": "exec", "code", "filename"}    -> {"ok", "stdout", "stderr", "error", "duration"}
+    {"op": "shutdown"}                    -> {"ok": true}, then the process exits
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import socket
+import struct
+import sys
+import time
+import traceback
+
+_FRAME_HEADER = struct.Struct("!I")
+
+
+def _recv_exact(conn, size):
+    chunks = []
+    while size:
+        chunk = conn.recv(size)
+        if not chunk:
+            raise ConnectionError("Connection closed")
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b"".join(chunks)
+
+
+def read_frame(conn):
+    (length,) = _FRAME_HEADER.unpack(_recv_exact(conn, _FRAME_HEADER.size))
+    return json.loads(_recv_exact(conn, length))
+
+
+def write_frame(conn, message):
+    body = json.dumps(message, default=str).encode("utf-8")
+    conn.sendall(_FRAME_HEADER.pack(len(body)) + body)
+
+
+def run_code(code, filename="<blender-worker>"):
+    """Run a snippet in a fresh namespace, capturing its output."""
+    stdout = io.StringIO()
+    stderr = io.StringIO()
+    error = None
+    start = time.perf_counter()
+    namespace = {"__name__": "__main__", "__file__": filename}
+    with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+        try:
+            exec(compile(code, filename, "exec"), namespace)
+        except SystemExit as e:
+            if e.code not in (None, 0):
+                error = f"SystemExit: {e.code}"
+        except BaseException:
+            error = traceback.format_exc()
+    return {
+        "ok": error is None,
+        "stdout": stdout.getvalue(),
+        "stderr": stderr.getvalue(),
+        "error": error,
+        "duration": time.perf_counter() - start,
+    }
+
+
+def handle(message):
+    op = message.get("op")
+    if op == "ping":
+        return {"ok": True, "pid": os.getpid()}
+    if op == "exec":
+        return run_code(message.get("code", ""), message.get("filename") or "<blender-worker>")
+    return {"ok": False, "error": f"Unknown op: {op}"}
+
+
+def serve(server):
+    """Serve connections one at a time until a shutdown request arrives."""
+    while True:
+        conn, _ = server.accept()
+        with conn:
+            while True:
+                try:
+                    message = read_frame(conn)
+                except (ConnectionError, OSError):
+                    break
+                if message.get("op") == "shutdown":
+                    write_frame(conn, {"ok": True})
+                    return
+                write_frame(conn, handle(message))
+
+
+def _script_args():
+    # Blender passes its own command line through; ours follows "--"
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    parser = argparse.ArgumentParser(prog="blender_worker")
+    parser.add_argument("--socket", help="Unix socket path to listen on")
+    parser.add_argument("--port", type=int, help="Local TCP port to listen on")
+    return parser.parse_args(argv)
+
+
+def main():
+    args = _script_args()
+    if args.socket:
+        if os.path.exists(args.socket):
+            os.unlink(args.socket)
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind(args.socket)
+    else:
+        server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        server.bind(("127.0.0.1", args.port or 0))
+    server.listen(1)
+    print(f"Blender worker ready (pid {os.getpid()})", flush=True)
+    try:
+        serve(server)
+    finally:
+        server.close()
+        if args.socket and os.path.exists(args.socket):
+            os.unlink(args.socket)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+"""
+Blender Engine Cache Module
+Content-addressed caching of task results for idempotent agents.
+"""
+
+import copy
+import hashlib
+import json
+import os
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+
+from .tasks import TaskContext, TaskResult
+
+
+def task_key(context: TaskContext, agent_name: Optional[str] = None) -> str:
+    """
+    Compute a stable content hash for a task.
+
+    The key covers the task type, a canonical JSON encoding of the input
+    data and of the upstream outputs a dependency graph passed in, the
+    project path and the agent name, so two contexts that differ only in
+    task ID or metadata share a key.
+    """
+    payload = {
+        "task_type": context.task_type.value,
+        "input_data": context.input_data,
+        "upstream_outputs": context.upstream_outputs,
+        "project_path": context.project_path,
+        "agent": agent_name,
+    }
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class ResultCache:
+    """
+    Two-tier LRU cache of completed task results.
+
+    The memory tier holds up to ``max_entries`` results. When ``disk_path``
+    is set, results are also written there as one JSON file per key, with
+    at most ``max_disk_entries`` files kept; the oldest writes are evicted
+    first. The files already on disk are indexed once, when the cache is
+    created, so enforcing that bound does not rescan the directory. Entries
+    older than ``ttl`` seconds are treated as missing in both tiers.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl: Optional[float] = None,
+        disk_path: Optional[Union[str, Path]] = None,
+        max_disk_entries: Optional[int] = None
+    ):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.disk_path = Path(disk_path) if disk_path else None
+        self.max_disk_entries = max_disk_entries
+        self._memory: "OrderedDict[str, Tuple[float, TaskResult]]" = OrderedDict()
+        # Keys of the files on disk, oldest write first; kept only when bounded
+        self._disk_keys: "OrderedDict[str, None]" = OrderedDict()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        if self.disk_path is not None:
+            self.disk_path.mkdir(parents=True, exist_ok=True)
+            if self.max_disk_entries is not None:
+                for path in sorted(self.disk_path.glob("*.json"), key=lambda p: p.stat().st_mtime):
+                    self._disk_keys[path.stem] = None
+
+    def _expired(self, stored_at: float) -> bool:
+        return self.ttl is not None and time.time() - stored_at > self.ttl
+
+    def get(self, key: str) -> Optional[TaskResult]:
+        """Return a private copy of the cached result for ``key``, if any."""
+        entry = self._memory.get(key)
+        if entry is not None:
+            if self._expired(entry[0]):
+                del self._memory[key]
+            else:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return copy.deepcopy(entry[1])
+
+        entry = self._read_disk(key)
+        if entry is not None:
+            self._remember(key, *entry)
+            self.hits += 1
+            self.disk_hits += 1
+            return copy.deepcopy(entry[1])
+
+        self.misses += 1
+        return None
+
+    def put(self, key: str, result: TaskResult) -> None:
+        """Cache a copy of ``result`` under ``key``."""
+        stored_at = time.time()
+        result = copy.deepcopy(result)
+        self._remember(key, stored_at, result)
+        if self.disk_path is not None:
+            self._write_disk(key, stored_at, result)
+
+    def clear(self) -> None:
+        """Drop every entry from both tiers."""
+        self._memory.clear()
+        self._disk_keys.clear()
+        if self.disk_path is not None:
+            for path in self.disk_path.glob("*.json"):
+                path.unlink()
+
+    def _remember(self, key: str, stored_at: float, result: TaskResult) -> None:
+        self._memory[key] = (stored_at, result)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self.evictions += 1
+
+    def _read_disk(self, key: str) -> Optional[Tuple[float, TaskResult]]:
+        if self.disk_path is None:
+            return None
+        path = self.disk_path / f"{key}.json"
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                record = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if self._expired(record["stored_at"]):
+            path.unlink(missing_ok=True)
+            self._disk_keys.pop(key, None)
+            return None
+        return record["stored_at"], TaskResult.from_dict(record["result"])
+
+    def _write_disk(self, key: str, stored_at: float, result: TaskResult) -> None:
+        path = self.disk_path / f"{key}.json"
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"stored_at": stored_at, "result": result.to_dict()}, f, default=str)
+        os.replace(tmp_path, path)
+
+        if self.max_disk_entries is not None:
+            self._disk_keys.pop(key, None)
+            self._disk_keys[key] = None
+            while len(self._disk_keys) > self.max_disk_entries:
+                stale, _ = self._disk_keys.popitem(last=False)
+                (self.disk_path / f"{stale}.json").unlink(missing_ok=True)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and tier sizes."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "memory_entries": len(self._memory),
+            "evictions": self.evictions,
+        }
@@ -0,0 +1,122 @@
+"""
+Blender Engine Checkpoint Module
+Durable per-workflow checkpoints so interrupted workflows can resume.
+"""
+
+import json
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from .tasks import TaskContext, TaskResult, TaskStatus
+
+
+class CheckpointStore:
+    """
+    SQLite store of workflow manifests and completed task results.
+
+    A manifest records a workflow's task contexts and execution mode
+    under its workflow ID. Every task that completes is recorded,
+    including its output and artifact paths, and committed immediately,
+    so a crash loses at most the tasks that were still running.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(self.path))
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS workflows ("
+            "workflow_id TEXT PRIMARY KEY, parallel INTEGER, tasks TEXT, "
+            "status TEXT, updated_at REAL)"
+        )
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            "workflow_id TEXT, task_id TEXT, result TEXT, recorded_at REAL, "
+            "PRIMARY KEY (workflow_id, task_id))"
+        )
+        self._db.commit()
+
+    def save_manifest(self, workflow_id: str, tasks: List[TaskContext], parallel: bool) -> None:
+        """
+        Record (or replace) the tasks of a workflow, keeping its results.
+
+        Task deadlines are not stored: they are absolute times that belong
+        to one run and would already have passed by the time the workflow
+        is resumed. Pass ``deadline`` or ``timeout`` to ``resume`` instead.
+        """
+        self._db.execute(
+            "INSERT INTO workflows (workflow_id, parallel, tasks, status, updated_at) "
+            "VALUES (?, ?, ?, 'running', ?) "
+            "ON CONFLICT(workflow_id) DO UPDATE SET parallel = excluded.parallel, "
+            "tasks = excluded.tasks, status = 'running', updated_at = excluded.updated_at",
+            (
+                workflow_id,
+                int(parallel),
+                json.dumps([{**ctx.to_dict(), "deadline": None} for ctx in tasks], default=str),
+                time.time(),
+            )
+        )
+        self._db.commit()
+
+    def load_manifest(self, workflow_id: str) -> Optional[Tuple[List[TaskContext], bool]]:
+        """Return the tasks and ``parallel`` flag of a workflow, or None if unknown."""
+        row = self._db.execute(
+            "SELECT tasks, parallel FROM workflows WHERE workflow_id = ?", (workflow_id,)
+        ).fetchone()
+        if row is None:
+            return None
+        return [TaskContext.from_dict(data) for data in json.loads(row[0])], bool(row[1])
+
+    def record(self, workflow_id: str, result: TaskResult) -> None:
+        """Durably record a completed task result."""
+        self._db.execute(
+            "INSERT OR REPLACE INTO results (workflow_id, task_id, result, recorded_at) "
+            "VALUES (?, ?, ?, ?)",
+            (workflow_id, result.task_id, json.dumps(result.to_dict(), default=str), time.time())
+        )
+        self._db.commit()
+
+    def completed(self, workflow_id: str) -> Dict[str, TaskResult]:
+        """Return the recorded results of a workflow by task ID."""
+        rows = self._db.execute(
+            "SELECT result FROM results WHERE workflow_id = ?", (workflow_id,)
+        ).fetchall()
+        results = [TaskResult.from_dict(json.loads(row[0])) for row in rows]
+        return {r.task_id: r for r in results if r.status == TaskStatus.COMPLETED}
+
+    def set_status(self, workflow_id: str, status: str) -> None:
+        self._db.execute(
+            "UPDATE workflows SET status = ?, updated_at = ? WHERE workflow_id = ?",
+            (status, time.time(), workflow_id)
+        )
+        self._db.commit()
+
+    def workflows(self) -> List[Dict[str, Any]]:
+        """Return the ID, status and progress of every checkpointed workflow."""
+        rows = self._db.execute(
+            "SELECT w.workflow_id, w.status, w.updated_at, w.tasks, "
+            "(SELECT COUNT(*) FROM results r WHERE r.workflow_id = w.workflow_id) "
+            "FROM workflows w ORDER BY w.updated_at"
+        ).fetchall()
+        return [
+            {
+                "workflow_id": workflow_id,
+                "status": status,
+                "updated_at": updated_at,
+                "tasks": len(json.loads(tasks)),
+                "completed": completed,
+            }
+            for workflow_id, status, updated_at, tasks, completed in rows
+        ]
+
+    def delete(self, workflow_id: str) -> None:
+        """Forget a workflow and its results."""
+        self._db.execute("DELETE FROM results WHERE workflow_id = ?", (workflow_id,))
+        self._db.execute("DELETE FROM workflows WHERE workflow_id = ?", (workflow_id,))
+        self._db.commit()
+
+    def close(self) -> None:
+        self._db.close()
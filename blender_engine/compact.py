@@ -0,0 +1,418 @@
+"""
+Blender Engine Compact Module
+Memory-lean, slotted task contexts and results with a compact record format.
+
+Packed records keep fixed fields (status, task type, times) in a struct
+header and encode free-form payloads such as input data and outputs as
+JSON. They are less than half the size of ``to_dict`` JSON, but no faster
+to encode, since the payloads still go through the ``json`` module.
+"""
+
+import json
+import math
+import struct
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from .tasks import TaskContext, TaskResult, TaskStatus, TaskType
+
+# Offset that turns a monotonic reading into wall-clock seconds. Captured
+# once so that timestamps cost a float instead of a datetime per object.
+_WALL_OFFSET = time.time() - time.monotonic()
+
+_STATUSES: Tuple[TaskStatus, ...] = tuple(TaskStatus)
+_STATUS_CODES = {status: code for code, status in enumerate(_STATUSES)}
+_TASK_TYPES: Tuple[TaskType, ...] = tuple(TaskType)
+_TASK_TYPE_CODES = {task_type: code for code, task_type in enumerate(_TASK_TYPES)}
+
+_VERSION = 2
+# magic, version, status, execution_time, then byte lengths of
+# task_id, error, output, artifacts (-1 encodes None)
+_RESULT_HEADER = struct.Struct("<2sBBd4i")
+# magic, version, task_type, created (wall seconds), timeout, deadline
+# (NaN encodes None), then byte lengths of task_id, user_id, project_path,
+# input_data, metadata, depends_on, upstream_outputs, agent_name
+_CONTEXT_HEADER = struct.Struct("<2sBBddd8i")
+_RESULT_MAGIC = b"BR"
+_CONTEXT_MAGIC = b"BC"
+
+
+# One shared encoder; json.dumps with non-default options builds a new one per call
+_encode_json = json.JSONEncoder(separators=(",", ":"), default=str).encode
+
+
+def _dump(value: Any) -> Optional[bytes]:
+    if value is None:
+        return None
+    return _encode_json(value).encode("utf-8")
+
+
+def _load(blob: Optional[bytes]) -> Any:
+    return None if blob is None else json.loads(blob)
+
+
+def _text(value: Optional[str]) -> Optional[bytes]:
+    return None if value is None else value.encode("utf-8")
+
+
+def _untext(blob: Optional[bytes]) -> Optional[str]:
+    return None if blob is None else blob.decode("utf-8")
+
+
+def _pack(header: struct.Struct, fixed: Tuple[Any, ...], blobs: List[Optional[bytes]]) -> bytes:
+    lengths = [-1 if blob is None else len(blob) for blob in blobs]
+    return b"".join([header.pack(*fixed, *lengths), *(blob for blob in blobs if blob)])
+
+
+def _unpack(
+    header: struct.Struct,
+    magic: bytes,
+    data: bytes,
+    fixed_count: int
+) -> Tuple[Tuple[Any, ...], List[Optional[bytes]]]:
+    if len(data) < header.size:
+        raise ValueError("Truncated record")
+    values = header.unpack_from(data)
+    if values[0] != magic or values[1] != _VERSION:
+        raise ValueError("Not a compact record of the expected kind and version")
+    offset = header.size
+    blobs: List[Optional[bytes]] = []
+    for length in values[fixed_count:]:
+        if length < 0:
+            blobs.append(None)
+        else:
+            blobs.append(bytes(data[offset:offset + length]))
+            offset += length
+    if offset != len(data):
+        raise ValueError("Record length does not match its header")
+    return values[2:fixed_count], blobs
+
+
+def _wall_to_monotonic(moment: datetime) -> float:
+    return moment.timestamp() - _WALL_OFFSET
+
+
+class CompactTaskContext:
+    """
+    Slotted, memory-lean equivalent of ``TaskContext``.
+
+    Exposes the same attributes, so the engine accepts it wherever a
+    ``TaskContext`` is expected. ``metadata``, ``depends_on`` and
+    ``upstream_outputs`` are only allocated when first accessed, and the
+    creation time is a monotonic float; ``created_at`` converts it to a
+    ``datetime`` on demand.
+    """
+
+    __slots__ = (
+        "task_id", "task_type", "input_data", "user_id", "project_path",
+        "_metadata", "created", "_depends_on", "_upstream_outputs",
+        "timeout", "deadline", "agent_name"
+    )
+
+    def __init__(
+        self,
+        task_id: str,
+        task_type: TaskType,
+        input_data: Dict[str, Any],
+        user_id: Optional[str] = None,
+        project_path: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        created: Optional[float] = None,
+        depends_on: Optional[List[str]] = None,
+        upstream_outputs: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+        deadline: Optional[datetime] = None,
+        agent_name: Optional[str] = None
+    ):
+        self.task_id = task_id
+        self.task_type = task_type
+        self.input_data = input_data
+        self.user_id = user_id
+        self.project_path = project_path
+        self._metadata = metadata or None
+        self.created = time.monotonic() if created is None else created
+        self._depends_on = depends_on or None
+        self._upstream_outputs = upstream_outputs or None
+        self.timeout = timeout
+        self.deadline = deadline
+        self.agent_name = agent_name
+
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        if self._metadata is None:
+            self._metadata = {}
+        return self._metadata
+
+    @metadata.setter
+    def metadata(self, value: Dict[str, Any]) -> None:
+        self._metadata = value
+
+    @property
+    def depends_on(self) -> List[str]:
+        if self._depends_on is None:
+            self._depends_on = []
+        return self._depends_on
+
+    @depends_on.setter
+    def depends_on(self, value: List[str]) -> None:
+        self._depends_on = value
+
+    @property
+    def upstream_outputs(self) -> Dict[str, Any]:
+        if self._upstream_outputs is None:
+            self._upstream_outputs = {}
+        return self._upstream_outputs
+
+    @upstream_outputs.setter
+    def upstream_outputs(self, value: Dict[str, Any]) -> None:
+        self._upstream_outputs = value
+
+    @property
+    def created_at(self) -> datetime:
+        return datetime.fromtimestamp(self.created + _WALL_OFFSET)
+
+    @classmethod
+    def from_context(cls, context: TaskContext) -> "CompactTaskContext":
+        """Convert a ``TaskContext``."""
+        return cls(
+            task_id=context.task_id,
+            task_type=context.task_type,
+            input_data=context.input_data,
+            user_id=context.user_id,
+            project_path=context.project_path,
+            metadata=context.metadata,
+            created=_wall_to_monotonic(context.created_at),
+            depends_on=context.depends_on,
+            upstream_outputs=context.upstream_outputs,
+            timeout=context.timeout,
+            deadline=context.deadline,
+            agent_name=context.agent_name,
+        )
+
+    def to_context(self) -> TaskContext:
+        """Convert back to a ``TaskContext``."""
+        return TaskContext(
+            task_id=self.task_id,
+            task_type=self.task_type,
+            input_data=self.input_data,
+            user_id=self.user_id,
+            project_path=self.project_path,
+            metadata=self.metadata,
+            created_at=self.created_at,
+            depends_on=self.depends_on,
+            upstream_outputs=self.upstream_outputs,
+            timeout=self.timeout,
+            deadline=self.deadline,
+            agent_name=self.agent_name,
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the context to the same dictionary as ``TaskContext.to_dict``."""
+        return {
+            "task_id": self.task_id,
+            "task_type": self.task_type.value,
+            "input_data": self.input_data,
+            "user_id": self.user_id,
+            "project_path": self.project_path,
+            "metadata": self._metadata or {},
+            "created_at": self.created_at.isoformat(),
+            "depends_on": self._depends_on or [],
+            "upstream_outputs": self._upstream_outputs or {},
+            "timeout": self.timeout,
+            "deadline": self.deadline.isoformat() if self.deadline else None,
+            "agent_name": self.agent_name,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CompactTaskContext":
+        """Rebuild a context from the output of ``to_dict``."""
+        return cls(
+            task_id=data["task_id"],
+            task_type=TaskType(data["task_type"]),
+            input_data=data.get("input_data", {}),
+            user_id=data.get("user_id"),
+            project_path=data.get("project_path"),
+            metadata=data.get("metadata"),
+            created=_wall_to_monotonic(datetime.fromisoformat(data["created_at"])) if data.get("created_at") else None,
+            depends_on=data.get("depends_on"),
+            upstream_outputs=data.get("upstream_outputs"),
+            timeout=data.get("timeout"),
+            deadline=datetime.fromisoformat(data["deadline"]) if data.get("deadline") else None,
+            agent_name=data.get("agent_name"),
+        )
+
+    def pack(self) -> bytes:
+        """Serialize the context to a compact binary record."""
+        fixed = (
+            _CONTEXT_MAGIC, _VERSION, _TASK_TYPE_CODES[self.task_type],
+            self.created + _WALL_OFFSET,
+            math.nan if self.timeout is None else self.timeout,
+            math.nan if self.deadline is None else self.deadline.timestamp(),
+        )
+        return _pack(_CONTEXT_HEADER, fixed, [
+            _text(self.task_id),
+            _text(self.user_id),
+            _text(self.project_path),
+            _dump(self.input_data),
+            _dump(self._metadata),
+            _dump(self._depends_on),
+            _dump(self._upstream_outputs),
+            _text(self.agent_name),
+        ])
+
+    @classmethod
+    def unpack(cls, data: Union[bytes, bytearray, memoryview]) -> "CompactTaskContext":
+        """Rebuild a context from the output of ``pack``."""
+        (task_type, created, timeout, deadline), blobs = _unpack(
+            _CONTEXT_HEADER, _CONTEXT_MAGIC, data, 6
+        )
+        task_id, user_id, project_path, input_data, metadata, depends_on, upstream, agent_name = blobs
+        return cls(
+            task_id=_untext(task_id),
+            task_type=_TASK_TYPES[task_type],
+            input_data=_load(input_data),
+            user_id=_untext(user_id),
+            project_path=_untext(project_path),
+            metadata=_load(metadata),
+            created=created - _WALL_OFFSET,
+            depends_on=_load(depends_on),
+            upstream_outputs=_load(upstream),
+            timeout=None if math.isnan(timeout) else timeout,
+            deadline=None if math.isnan(deadline) else datetime.fromtimestamp(deadline),
+            agent_name=_untext(agent_name),
+        )
+
+    def __repr__(self) -> str:
+        return f"CompactTaskContext(task_id={self.task_id!r}, task_type={self.task_type})"
+
+
+class CompactTaskResult:
+    """
+    Slotted, memory-lean equivalent of ``TaskResult``.
+
+    ``artifacts`` is only allocated when first accessed. Exposes the same
+    attributes and ``to_dict``/``from_dict`` as ``TaskResult``.
+    """
+
+    __slots__ = ("task_id", "status", "output", "error", "execution_time", "_artifacts")
+
+    def __init__(
+        self,
+        task_id: str,
+        status: TaskStatus,
+        output: Optional[Dict[str, Any]] = None,
+        error: Optional[str] = None,
+        execution_time: float = 0.0,
+        artifacts: Optional[Dict[str, str]] = None
+    ):
+        self.task_id = task_id
+        self.status = status
+        self.output = output
+        self.error = error
+        self.execution_time = execution_time
+        self._artifacts = artifacts or None
+
+    @property
+    def artifacts(self) -> Dict[str, str]:
+        if self._artifacts is None:
+            self._artifacts = {}
+        return self._artifacts
+
+    @artifacts.setter
+    def artifacts(self, value: Dict[str, str]) -> None:
+        self._artifacts = value
+
+    @classmethod
+    def from_result(cls, result: TaskResult) -> "CompactTaskResult":
+        """Convert a ``TaskResult``."""
+        return cls(
+            result.task_id, result.status, result.output,
+            result.error, result.execution_time, result.artifacts
+        )
+
+    def to_result(self) -> TaskResult:
+        """Convert back to a ``TaskResult``."""
+        return TaskResult(
+            task_id=self.task_id,
+            status=self.status,
+            output=self.output,
+            error=self.error,
+            execution_time=self.execution_time,
+            artifacts=self.artifacts,
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the result to the same dictionary as ``TaskResult.to_dict``."""
+        return {
+            "task_id": self.task_id,
+            "status": self.status.value,
+            "output": self.output,
+            "error": self.error,
+            "execution_time": self.execution_time,
+            "artifacts": self._artifacts or {},
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CompactTaskResult":
+        """Rebuild a result from the output of ``to_dict``."""
+        return cls(
+            task_id=data["task_id"],
+            status=TaskStatus(data["status"]),
+            output=data.get("output"),
+            error=data.get("error"),
+            execution_time=data.get("execution_time", 0.0),
+            artifacts=data.get("artifacts"),
+        )
+
+    def pack(self) -> bytes:
+        """Serialize the result to a compact binary record."""
+        fixed = (_RESULT_MAGIC, _VERSION, _STATUS_CODES[self.status], self.execution_time)
+        return _pack(_RESULT_HEADER, fixed, [
+            _text(self.task_id),
+            _text(self.error),
+            _dump(self.output),
+            _dump(self._artifacts),
+        ])
+
+    @classmethod
+    def unpack(cls, data: Union[bytes, bytearray, memoryview]) -> "CompactTaskResult":
+        """Rebuild a result from the output of ``pack``."""
+        (status, execution_time), (task_id, error, output, artifacts) = _unpack(
+            _RESULT_HEADER, _RESULT_MAGIC, data, 4
+        )
+        return cls(
+            task_id=_untext(task_id),
+            status=_STATUSES[status],
+            output=_load(output),
+            error=_untext(error),
+            execution_time=execution_time,
+            artifacts=_load(artifacts),
+        )
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, (CompactTaskResult, TaskResult)):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return (
+            f"CompactTaskResult(task_id={self.task_id!r}, status={self.status}, "
+            f"execution_time={self.execution_time!r})"
+        )
+
+
+def pack_result(result: Union[TaskResult, CompactTaskResult]) -> bytes:
+    """Serialize either result class to a compact binary record."""
+    if not isinstance(result, CompactTaskResult):
+        result = CompactTaskResult.from_result(result)
+    return result.pack()
+
+
+def pack_context(context: Union[TaskContext, CompactTaskContext]) -> bytes:
+    """Serialize either context class to a compact binary record."""
+    if not isinstance(context, CompactTaskContext):
+        context = CompactTaskContext.from_context(context)
+    return context.pack()
@@ -6,64 +6,45 @@ workflows and executing code generation tasks.
 """
 
 import asyncio
+import copy
 import json
 import logging
-from datetime import datetime
-from enum import Enum
-from typing import Any, Callable, Dict, List, Optional, Protocol, Union
-from dataclasses import dataclass, field
+import time
+from collections import deque
+from datetime import datetime, timedelta
+from typing import (
+    Any, AsyncIterable, AsyncIterator, Awaitable, Callable, Deque, Dict, Iterable, Iterator,
+    List, Optional, Protocol, Set, Tuple, Union
+)
 from pathlib import Path
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
+from .backends import BACKENDS, ExecutionBackend
+from .batching import MicroBatcher
+from .cache import ResultCache, task_key
+from .checkpoint import CheckpointStore
+from .history import TaskHistory
+from .limits import LIMIT_ALGORITHMS, AdaptiveLimiter, ConcurrencyLimiter, LimitAlgorithm
+from .log import configure_logging, get_logger, shutdown_logging
+from .metrics import NULL_TRACER, MetricsRegistry, NullTracer, Tracer
+from .pipeline import Pipeline, PipelineBuilder  # noqa: F401  (re-exported)
+from .retry import NO_RETRY, CircuitBreaker, RetryPolicy
+from .routing import AgentStats, CapabilityIndex, LatencyEWMAPolicy, RoutingPolicy
+from .task_queue import PriorityTaskQueue, TaskHandle
+from .tasks import TaskContext, TaskResult, TaskStatus, TaskType
 
-
-class TaskStatus(Enum):
-    """Enumeration of possible task statuses."""
-    PENDING = "pending"
-    RUNNING = "running"
-    COMPLETED = "completed"
-    FAILED = "failed"
-    CANCELLED = "cancelled"
-
-
-class TaskType(Enum):
-    """Enumeration of supported task types."""
-    CODE_GENERATION = "code_generation"
-    CODE_REVIEW = "code_review"
-    REFACTORING = "refactoring"
-    TEST_GENERATION = "test_generation"
-    DOCUMENTATION = "documentation"
-    ANALYSIS = "analysis"
-    ORCHESTRATION = "orchestration"
-
-
-@dataclass
-class TaskContext:
-    """Context information for a task execution."""
-    task_id: str
-    task_type: TaskType
-    input_data: Dict[str, Any]
-    user_id: Optional[str] = None
-    project_path: Optional[str] = None
-    metadata: Dict[str, Any] = field(default_factory=dict)
-    created_at: datetime = field(default_factory=datetime.now)
-
-
-@dataclass
-class TaskResult:
-    """Result from a task execution."""
-    task_id: str
-    status: TaskStatus
-    output: Optional[Dict[str, Any]] = None
-    error: Optional[str] = None
-    execution_time: float = 0.0
-    artifacts: Dict[str, str] = field(default_factory=dict)
+# Named explicitly so records stay under the package logger when this
+# module is run as __main__
+logger = get_logger("blender_engine.engine")
 
 
 class AgentProtocol(Protocol):
-    """Protocol defining the interface for agents in the system."""
+    """
+    Protocol defining the interface for agents in the system.
+    
+    Agents may also implement ``async execute_batch(contexts)``, returning
+    one TaskResult per context. When registered with ``max_batch_size``,
+    such agents receive queued tasks of the same type in batches.
+    """
     
     async def execute(self, context: TaskContext) -> TaskResult:
         """Execute the agent's core functionality."""
@@ -88,21 +69,189 @@ class BlenderEngine:
     handling task distribution, status tracking, and result aggregation.
     """
     
-    def __init__(self):
+    def __init__(
+        self,
+        max_concurrency: Optional[int] = None,
+        routing_policy: Optional[RoutingPolicy] = None,
+        history: Optional[TaskHistory] = None,
+        result_cache: Optional[ResultCache] = None,
+        coalesce: bool = False,
+        queue_path: Optional[Union[str, Path]] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        breaker_threshold: Optional[int] = None,
+        breaker_recovery_timeout: float = 30.0,
+        metrics: Optional[MetricsRegistry] = None,
+        tracer: Optional[Tracer] = None,
+        checkpoint_path: Optional[Union[str, Path]] = None
+    ):
+        """
+        Initialize the engine.
+        
+        Args:
+            max_concurrency: Optional engine-wide cap on concurrently
+                executing agent calls
+            routing_policy: Policy choosing among agents that share a
+                capability (defaults to LatencyEWMAPolicy)
+            history: Store for executed task results (defaults to an
+                unbounded TaskHistory)
+            result_cache: Optional cache consulted for agents registered
+                with ``cacheable=True``
+            coalesce: Whether concurrent tasks with identical content
+                share one agent call (single-flight)
+            queue_path: Optional SQLite file that persists tasks queued
+                with ``submit`` across restarts
+            retry_policy: Default retry policy for failed attempts (no
+                retries unless given)
+            breaker_threshold: Consecutive failures after which an agent's
+                circuit opens and routing skips it; None disables breakers
+            breaker_recovery_timeout: Seconds an open circuit waits before
+                admitting a probe call
+            metrics: Optional registry receiving throughput, error and
+                latency metrics
+            tracer: Optional tracer recording queue wait, agent selection,
+                agent execution and result storage spans
+            checkpoint_path: Optional SQLite file recording the completed
+                tasks of workflows run with a ``workflow_id``, so they can
+                be resumed
+        """
         self.agents: Dict[str, AgentProtocol] = {}
-        self.task_history: List[TaskResult] = []
-        self.active_tasks: Dict[str, asyncio.Task] = {}
+        self.task_history = history if history is not None else TaskHistory()
+        self.active_tasks: Dict[str, asyncio.Future] = {}
+        self.max_concurrency = max_concurrency
+        self._engine_limiter = ConcurrencyLimiter(max_in_flight=max_concurrency)
+        self._agent_limiters: Dict[str, Union[ConcurrencyLimiter, AdaptiveLimiter]] = {}
+        self.routing_policy = routing_policy or LatencyEWMAPolicy()
+        self._capabilities = CapabilityIndex()
+        self._agent_stats: Dict[str, AgentStats] = {}
+        self.result_cache = result_cache
+        self._cacheable_agents: Set[str] = set()
+        self.coalesce = coalesce
+        self._in_flight: Dict[str, asyncio.Future] = {}
+        self._coalesced_count = 0
+        self.task_queue = PriorityTaskQueue(persist_path=queue_path)
+        self.checkpoints = CheckpointStore(checkpoint_path) if checkpoint_path else None
+        self._handles: Dict[str, TaskHandle] = {}
+        self._workers: List[asyncio.Task] = []
+        self._cancel_requested: Set[str] = set()
+        self._backends: Dict[str, ExecutionBackend] = {}
+        self._agent_backends: Dict[str, ExecutionBackend] = {}
+        self._agent_timeouts: Dict[str, Optional[float]] = {}
+        self.retry_policy = retry_policy or NO_RETRY
+        self._agent_retry_policies: Dict[str, RetryPolicy] = {}
+        self.breaker_threshold = breaker_threshold
+        self.breaker_recovery_timeout = breaker_recovery_timeout
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._batchers: Dict[str, MicroBatcher] = {}
+        self.metrics = metrics
+        self.tracer: Union[Tracer, NullTracer] = tracer or NULL_TRACER
         
-    def register_agent(self, agent: AgentProtocol) -> None:
-        """Register an agent with the engine."""
+    def register_agent(
+        self,
+        agent: AgentProtocol,
+        max_in_flight: Optional[int] = None,
+        rate_limit: Optional[float] = None,
+        burst: Optional[float] = None,
+        cacheable: bool = False,
+        backend: Union[str, ExecutionBackend] = "inline",
+        timeout: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        max_batch_size: Optional[int] = None,
+        max_batch_wait: float = 0.01,
+        adaptive_concurrency: Optional[Union[str, LimitAlgorithm]] = None
+    ) -> None:
+        """
+        Register an agent with the engine.
+        
+        Args:
+            agent: The agent to register
+            max_in_flight: Optional cap on concurrent calls to this agent
+            rate_limit: Optional sustained calls per second for this agent
+            burst: Calls allowed back-to-back before ``rate_limit`` applies
+                (defaults to ``rate_limit``)
+            cacheable: Whether this agent's results may be served from the
+                engine's result cache; only set for idempotent agents
+            backend: Where the agent runs: "inline" on the event loop,
+                "thread" on a thread pool, "process" on a process pool for
+                CPU-bound agents, or a custom ExecutionBackend instance
+            timeout: Default seconds a task may run on this agent, used
+                when the task context sets no timeout of its own
+            retry_policy: Retry policy overriding the engine default for
+                failures on this agent
+            max_batch_size: For agents implementing ``execute_batch``, the
+                most same-type tasks sent in one batch; None disables batching
+            max_batch_wait: Seconds a partial batch waits for more tasks
+                before it is sent
+            adaptive_concurrency: Adjust this agent's in-flight limit from
+                the latency and errors of its calls (engine queueing
+                excluded): "aimd", "gradient" or a
+                LimitAlgorithm instance. ``max_in_flight`` then caps the
+                adaptive limit instead of fixing it
+        """
+        if isinstance(backend, str):
+            backend = self._get_backend(backend)
+        if isinstance(adaptive_concurrency, str):
+            if adaptive_concurrency not in LIMIT_ALGORITHMS:
+                raise ValueError(
+                    f"Unknown adaptive concurrency algorithm '{adaptive_concurrency}'; "
+                    f"expected one of {sorted(LIMIT_ALGORITHMS)}"
+                )
+            bounds = {"initial": min(10, max_in_flight), "max_limit": max_in_flight} if max_in_flight else {}
+            adaptive_concurrency = LIMIT_ALGORITHMS[adaptive_concurrency](**bounds)
+        if agent.name in self.agents:
+            self._capabilities.remove(agent.name)
         self.agents[agent.name] = agent
-        logger.info(f"Registered agent: {agent.name}")
+        self._capabilities.add(agent.name, agent.capabilities)
+        self._agent_stats.setdefault(agent.name, AgentStats())
+        if adaptive_concurrency is not None:
+            self._agent_limiters[agent.name] = AdaptiveLimiter(
+                adaptive_concurrency,
+                rate_limit=rate_limit,
+                burst=burst
+            )
+        else:
+            self._agent_limiters[agent.name] = ConcurrencyLimiter(
+                max_in_flight=max_in_flight,
+                rate_limit=rate_limit,
+                burst=burst
+            )
+        if cacheable:
+            self._cacheable_agents.add(agent.name)
+        else:
+            self._cacheable_agents.discard(agent.name)
+        backend.prepare(agent)
+        self._agent_backends[agent.name] = backend
+        self._agent_timeouts[agent.name] = timeout
+        if retry_policy is not None:
+            self._agent_retry_policies[agent.name] = retry_policy
+        else:
+            self._agent_retry_policies.pop(agent.name, None)
+        if max_batch_size is not None:
+            if not hasattr(agent, "execute_batch"):
+                raise ValueError(f"Agent '{agent.name}' does not implement execute_batch")
+            self._batchers[agent.name] = MicroBatcher(agent, max_batch_size, max_batch_wait)
+        else:
+            self._batchers.pop(agent.name, None)
+        if self.breaker_threshold is not None:
+            self._breakers[agent.name] = CircuitBreaker(
+                failure_threshold=self.breaker_threshold,
+                recovery_timeout=self.breaker_recovery_timeout
+            )
+        logger.info("agent.registered", "Registered agent: %s", agent.name, agent=agent.name)
     
     def unregister_agent(self, agent_name: str) -> None:
         """Unregister an agent from the engine."""
         if agent_name in self.agents:
             del self.agents[agent_name]
-            logger.info(f"Unregistered agent: {agent_name}")
+            self._agent_limiters.pop(agent_name, None)
+            self._agent_stats.pop(agent_name, None)
+            self._capabilities.remove(agent_name)
+            self._cacheable_agents.discard(agent_name)
+            self._agent_backends.pop(agent_name, None)
+            self._agent_timeouts.pop(agent_name, None)
+            self._agent_retry_policies.pop(agent_name, None)
+            self._breakers.pop(agent_name, None)
+            self._batchers.pop(agent_name, None)
+            logger.info("agent.unregistered", "Unregistered agent: %s", agent_name, agent=agent_name)
     
     async def execute_task(
         self, 
@@ -114,81 +263,394 @@ class BlenderEngine:
         
         Args:
             context: The task context containing all necessary information
-            agent_name: Optional specific agent to use, otherwise auto-select
+            agent_name: Optional specific agent to use, otherwise the
+                context's ``agent_name``, otherwise auto-select
             
+        When the engine was created with ``coalesce=True``, a task whose
+        content key matches one already in flight waits for that execution
+        instead of calling the agent again, and receives a copy of its
+        result under its own task ID. If that execution is cancelled, the
+        waiting duplicates run the task again instead.
+        
         Returns:
             TaskResult containing the execution outcome
         """
-        start_time = datetime.now()
+        agent_name = agent_name or context.agent_name
+        if not self.coalesce:
+            return await self._execute_task(context, agent_name)
+        
+        key = task_key(context, agent_name)
+        leader = self._in_flight.get(key)
+        if leader is not None:
+            task_id = context.task_id
+            # Tracked like a running task, so cancel_task can stop the wait
+            # without cancelling the leader
+            waiter = asyncio.shield(leader)
+            self.active_tasks[task_id] = waiter
+            try:
+                shared = await waiter
+            except asyncio.CancelledError:
+                if task_id in self._cancel_requested:
+                    result = TaskResult(
+                        task_id=task_id,
+                        status=TaskStatus.CANCELLED,
+                        error="Cancelled while running"
+                    )
+                    self.task_history.append(result)
+                    logger.task(
+                        logging.WARNING, "task.cancelled", task_id,
+                        "Task %s cancelled while waiting for an in-flight duplicate", task_id
+                    )
+                    return result
+                if not leader.cancelled():
+                    raise
+                shared = None
+            finally:
+                if self.active_tasks.get(task_id) is waiter:
+                    del self.active_tasks[task_id]
+                self._cancel_requested.discard(task_id)
+            if shared is None or shared.status == TaskStatus.CANCELLED:
+                # The leader was cancelled, by its caller, cancel_task or its
+                # own deadline; none of that applies to this task, so run it
+                # again. The first follower back becomes the new leader.
+                return await self.execute_task(context, agent_name)
+            result = copy.deepcopy(shared)
+            result.task_id = context.task_id
+            self._coalesced_count += 1
+            self.task_history.append(result)
+            logger.task(
+                logging.INFO, "task.coalesced", context.task_id,
+                "Task %s coalesced with an in-flight duplicate", context.task_id
+            )
+            return result
+        
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        try:
+            result = await self._execute_task(context, agent_name)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark the exception retrieved; followers re-raise it themselves
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._in_flight[key]
+    
+    async def _execute_task(
+        self,
+        context: TaskContext,
+        agent_name: Optional[str] = None
+    ) -> TaskResult:
+        """Run a task with retries, without coalescing, and record its result."""
+        start_time = time.perf_counter()
         task_id = context.task_id
         
-        logger.info(f"Starting task {task_id} of type {context.task_type.value}")
+        logger.task(
+            logging.INFO, "task.started", task_id,
+            "Starting task %s of type %s", task_id, context.task_type.value
+        )
         
-        # Select agent
-        if agent_name:
-            if agent_name not in self.agents:
-                return TaskResult(
+        if context.deadline is not None and context.deadline <= datetime.now():
+            result = TaskResult(
+                task_id=task_id,
+                status=TaskStatus.CANCELLED,
+                error="Deadline exceeded before start"
+            )
+            self.task_history.append(result)
+            logger.task(
+                logging.WARNING, "task.deadline_exceeded", task_id,
+                "Task %s cancelled: deadline exceeded before start", task_id
+            )
+            return result
+        
+        # Run every attempt inside one tracked task, so cancel_task can
+        # stop the task whether it is executing or backing off
+        with self.tracer.span("task", task_id=task_id, task_type=context.task_type.value):
+            run = asyncio.create_task(self._attempt_task(context, agent_name, start_time))
+            self.active_tasks[task_id] = run
+            try:
+                result = await run
+            except asyncio.CancelledError:
+                if task_id not in self._cancel_requested:
+                    raise
+                execution_time = time.perf_counter() - start_time
+                result = TaskResult(
                     task_id=task_id,
-                    status=TaskStatus.FAILED,
-                    error=f"Agent '{agent_name}' not registered"
+                    status=TaskStatus.CANCELLED,
+                    error="Cancelled while running",
+                    execution_time=execution_time
                 )
-            agent = self.agents[agent_name]
-        else:
-            agent = self._select_agent(context.task_type)
-            if not agent:
+                logger.task(
+                    logging.WARNING, "task.cancelled", task_id,
+                    "Task %s cancelled after %.2fs", task_id, execution_time,
+                    execution_time=execution_time
+                )
+            finally:
+                if self.active_tasks.get(task_id) is run:
+                    del self.active_tasks[task_id]
+                self._cancel_requested.discard(task_id)
+            
+            # Store result
+            with self.tracer.span("result_storage", task_id=task_id):
+                self.task_history.append(result)
+        
+        if self.metrics is not None:
+            self.metrics.counter(
+                "blender_engine_tasks_total", "Tasks finished, by final status"
+            ).inc(status=result.status.value)
+            self.metrics.histogram(
+                "blender_engine_task_duration_seconds", "End-to-end task duration"
+            ).observe(result.execution_time)
+        
+        return result
+    
+    async def _attempt_task(
+        self,
+        context: TaskContext,
+        agent_name: Optional[str],
+        start_time: float
+    ) -> TaskResult:
+        """Attempt a task until it succeeds or its retry policy gives up."""
+        task_id = context.task_id
+        failed_agents: Set[str] = set()
+        attempt = 0
+        while True:
+            attempt += 1
+            
+            # Select agent, failing over away from agents that already failed
+            if agent_name:
+                if agent_name not in self.agents:
+                    return TaskResult(
+                        task_id=task_id,
+                        status=TaskStatus.FAILED,
+                        error=f"Agent '{agent_name}' not registered"
+                    )
+                breaker = self._breakers.get(agent_name)
+                if breaker is not None and not breaker.available():
+                    return TaskResult(
+                        task_id=task_id,
+                        status=TaskStatus.FAILED,
+                        error=f"Circuit open for agent '{agent_name}'"
+                    )
+                agent = self.agents[agent_name]
+            else:
+                with self.tracer.span("agent_selection", task_id=task_id):
+                    agent = self._select_agent(context.task_type, exclude=failed_agents)
+                if not agent:
+                    return TaskResult(
+                        task_id=task_id,
+                        status=TaskStatus.FAILED,
+                        error=f"No agent available for task type: {context.task_type.value}"
+                    )
+            
+            result, error = await self._attempt_once(agent, context, start_time)
+            if error is None:
+                return result
+            
+            policy = self._agent_retry_policies.get(agent.name) or self.retry_policy
+            if not policy.should_retry(attempt, error):
+                return result
+            delay = policy.delay(attempt)
+            if context.deadline is not None and (
+                datetime.now() + timedelta(seconds=delay) >= context.deadline
+            ):
+                return result
+            
+            failed_agents.add(agent.name)
+            logger.task(
+                logging.WARNING, "task.retry", task_id,
+                "Task %s attempt %d failed on %s; retrying in %.2fs",
+                task_id, attempt, agent.name, delay,
+                attempt=attempt, agent=agent.name, delay=delay
+            )
+            await asyncio.sleep(delay)
+    
+    async def _attempt_once(
+        self,
+        agent: AgentProtocol,
+        context: TaskContext,
+        start_time: float
+    ) -> Tuple[TaskResult, Optional[Exception]]:
+        """
+        Make one attempt at a task on ``agent``.
+        
+        Returns:
+            The attempt's result, and the exception that failed it if the
+            failure is one a retry could fix
+        """
+        task_id = context.task_id
+        
+        # Serve repeats of idempotent tasks from the cache
+        cache_key = None
+        if self.result_cache is not None and agent.name in self._cacheable_agents:
+            cache_key = task_key(context, agent.name)
+            cached = self.result_cache.get(cache_key)
+            if cached is not None:
+                cached.task_id = task_id
+                cached.execution_time = time.perf_counter() - start_time
+                logger.task(logging.INFO, "task.cache_hit", task_id, "Task %s served from cache", task_id)
+                return cached, None
+        
+        # Work out how long the agent may run: the tighter of the task's
+        # (or agent's default) timeout and the time left before the deadline
+        timeout = context.timeout
+        if timeout is None:
+            timeout = self._agent_timeouts.get(agent.name)
+        remaining = None
+        if context.deadline is not None:
+            remaining = (context.deadline - datetime.now()).total_seconds()
+            if remaining <= 0:
                 return TaskResult(
                     task_id=task_id,
-                    status=TaskStatus.FAILED,
-                    error=f"No agent available for task type: {context.task_type.value}"
-                )
+                    status=TaskStatus.CANCELLED,
+                    error="Deadline exceeded",
+                    execution_time=time.perf_counter() - start_time
+                ), None
+        bounds = [t for t in (timeout, remaining) if t is not None]
+        limit = min(bounds) if bounds else None
         
-        # Execute task
+        stats = self._agent_stats.setdefault(agent.name, AgentStats())
+        breaker = self._breakers.get(agent.name)
+        stats.started()
+        if breaker is not None:
+            breaker.on_dispatch()
+        attempt_start = time.perf_counter()
+        error: Optional[Exception] = None
         try:
-            result = await agent.execute(context)
-            execution_time = (datetime.now() - start_time).total_seconds()
-            result.execution_time = execution_time
+            with self.tracer.span("agent_execution", task_id=task_id, agent=agent.name):
+                result = await asyncio.wait_for(self._run_agent(agent, context), limit)
             result.status = TaskStatus.COMPLETED
             
-            logger.info(f"Task {task_id} completed in {execution_time:.2f}s")
+        except asyncio.TimeoutError as e:
+            if remaining is not None and limit == remaining:
+                result = TaskResult(
+                    task_id=task_id,
+                    status=TaskStatus.CANCELLED,
+                    error="Deadline exceeded"
+                )
+            else:
+                error = e
+                result = TaskResult(
+                    task_id=task_id,
+                    status=TaskStatus.FAILED,
+                    error=f"Task timed out after {limit:.2f}s"
+                )
             
         except Exception as e:
-            execution_time = (datetime.now() - start_time).total_seconds()
+            error = e
             result = TaskResult(
                 task_id=task_id,
                 status=TaskStatus.FAILED,
-                error=str(e),
-                execution_time=execution_time
+                error=str(e)
             )
-            logger.error(f"Task {task_id} failed: {e}")
+            
+        except asyncio.CancelledError:
+            stats.finished(time.perf_counter() - attempt_start, success=False)
+            if breaker is not None:
+                breaker.release()
+            raise
         
-        # Store result
-        self.task_history.append(result)
+        latency = time.perf_counter() - attempt_start
+        stats.finished(latency, success=result.status == TaskStatus.COMPLETED)
+        if self.metrics is not None:
+            self.metrics.histogram(
+                "blender_engine_agent_latency_seconds", "Agent call latency per attempt"
+            ).observe(latency, agent=agent.name)
+            if error is not None:
+                self.metrics.counter(
+                    "blender_engine_agent_errors_total", "Failed agent attempts"
+                ).inc(agent=agent.name)
+        if breaker is not None:
+            if error is not None:
+                breaker.record_failure()
+            elif result.status == TaskStatus.COMPLETED:
+                breaker.record_success()
+            else:
+                breaker.release()
         
-        return result
+        execution_time = time.perf_counter() - start_time
+        result.execution_time = execution_time
+        if result.status == TaskStatus.COMPLETED:
+            if cache_key is not None:
+                with self.tracer.span("result_storage", task_id=task_id, tier="cache"):
+                    self.result_cache.put(cache_key, result)
+            logger.task(
+                logging.INFO, "task.completed", task_id,
+                "Task %s completed in %.2fs", task_id, execution_time,
+                agent=agent.name, execution_time=execution_time
+            )
+        else:
+            logger.task(
+                logging.ERROR, "task.failed", task_id,
+                "Task %s %s on %s: %s", task_id, result.status.value, agent.name, result.error,
+                status=result.status.value, agent=agent.name
+            )
+        return result, error
     
     async def execute_workflow(
         self,
         tasks: List[TaskContext],
-        parallel: bool = False
+        parallel: bool = False,
+        deadline: Optional[datetime] = None,
+        timeout: Optional[float] = None,
+        workflow_id: Optional[str] = None
     ) -> List[TaskResult]:
         """
         Execute a workflow consisting of multiple tasks.
         
+        Tasks that declare ``depends_on`` are scheduled as a dependency
+        graph (see ``execute_dag``) regardless of ``parallel``.
+        
         Args:
             tasks: List of task contexts to execute
             parallel: Whether to execute tasks in parallel
+            deadline: Optional time by which the whole workflow must finish;
+                applied to every task that has no earlier deadline. The
+                given contexts are not modified, so they can be run again
+            timeout: Optional seconds from now, an alternative to ``deadline``
+            workflow_id: Optional ID under which the workflow is
+                checkpointed. Each completed task is recorded as it
+                finishes, and tasks already recorded under this ID are
+                not run again (see ``resume``)
             
         Returns:
             List of TaskResult objects for all tasks
+            
+        Raises:
+            ValueError: If ``workflow_id`` is given but the engine has no
+                checkpoint store
         """
-        logger.info(f"Executing workflow with {len(tasks)} tasks")
+        logger.info("workflow.started", "Executing workflow with %d tasks", len(tasks), tasks=len(tasks))
+        
+        run = self.execute_task
+        if workflow_id is not None:
+            if self.checkpoints is None:
+                raise ValueError("Checkpointed workflows require an engine created with checkpoint_path")
+            self.checkpoints.save_manifest(workflow_id, tasks, parallel)
+            run = self._checkpointed(workflow_id)
+        
+        if timeout is not None:
+            by_timeout = datetime.now() + timedelta(seconds=timeout)
+            deadline = min(deadline, by_timeout) if deadline else by_timeout
+        if deadline is not None:
+            # Per-run copies: the caller's contexts may be executed again later
+            tasks = [
+                _with_deadline(ctx, deadline) if ctx.deadline is None or ctx.deadline > deadline else ctx
+                for ctx in tasks
+            ]
+        
+        if any(ctx.depends_on for ctx in tasks):
+            processed_results = await self._execute_dag(tasks, run)
         
-        if parallel:
+        elif parallel:
             # Execute all tasks concurrently
-            async def run_task(ctx: TaskContext) -> TaskResult:
-                return await self.execute_task(ctx)
-            
-            task_coroutines = [run_task(ctx) for ctx in tasks]
+            task_coroutines = [run(ctx) for ctx in tasks]
             results = await asyncio.gather(*task_coroutines, return_exceptions=True)
             
             # Handle exceptions
@@ -202,75 +664,652 @@ class BlenderEngine:
                     ))
                 else:
                     processed_results.append(result)
-                    
-            return processed_results
             
         else:
-            # Execute tasks sequentially
-            results = []
-            for task_ctx in tasks:
-                result = await self.execute_task(task_ctx)
-                results.append(result)
+            # Execute tasks sequentially, stopping on failure
+            processed_results = [result async for result in self._stream_sequential(tasks, run)]
+        
+        if workflow_id is not None:
+            finished = len(processed_results) == len(tasks) and all(
+                r.status == TaskStatus.COMPLETED for r in processed_results
+            )
+            self.checkpoints.set_status(workflow_id, "completed" if finished else "incomplete")
+        return processed_results
+    
+    async def resume(
+        self,
+        workflow_id: str,
+        deadline: Optional[datetime] = None,
+        timeout: Optional[float] = None
+    ) -> List[TaskResult]:
+        """
+        Resume a checkpointed workflow.
+        
+        Tasks that completed in an earlier run return their recorded
+        results without running again; execution restarts from the first
+        unfinished task (or, for dependency graphs, every unfinished node
+        whose dependencies are recorded).
+        
+        Raises:
+            ValueError: If the engine has no checkpoint store
+            KeyError: If no workflow was checkpointed under ``workflow_id``
+        """
+        if self.checkpoints is None:
+            raise ValueError("Checkpointed workflows require an engine created with checkpoint_path")
+        manifest = self.checkpoints.load_manifest(workflow_id)
+        if manifest is None:
+            raise KeyError(f"No checkpointed workflow '{workflow_id}'")
+        tasks, parallel = manifest
+        return await self.execute_workflow(
+            tasks, parallel, deadline=deadline, timeout=timeout, workflow_id=workflow_id
+        )
+    
+    def _checkpointed(self, workflow_id: str) -> Callable[[TaskContext], Awaitable[TaskResult]]:
+        """Return a task runner that skips and records checkpointed tasks."""
+        completed = self.checkpoints.completed(workflow_id)
+        
+        async def run(ctx: TaskContext) -> TaskResult:
+            restored = completed.get(ctx.task_id)
+            if restored is not None:
+                logger.task(
+                    logging.INFO, "task.restored", ctx.task_id,
+                    "Task %s restored from checkpoint %s", ctx.task_id, workflow_id,
+                    workflow_id=workflow_id
+                )
+                return copy.deepcopy(restored)
+            result = await self.execute_task(ctx)
+            if result.status == TaskStatus.COMPLETED:
+                self.checkpoints.record(workflow_id, result)
+            return result
+        
+        return run
+    
+    async def execute_dag(self, tasks: List[TaskContext]) -> List[TaskResult]:
+        """
+        Execute tasks as a dependency graph.
+        
+        Each task starts as soon as every task listed in its ``depends_on``
+        has completed, and receives their outputs in ``upstream_outputs``.
+        A failed task cancels only the tasks downstream of it; independent
+        branches keep running.
+        
+        Args:
+            tasks: List of task contexts, in any order
+            
+        Returns:
+            List of TaskResult objects, in the same order as ``tasks``
+            
+        Raises:
+            ValueError: If task IDs are duplicated, a dependency is unknown,
+                or the graph contains a cycle
+        """
+        return await self._execute_dag(tasks, self.execute_task)
+    
+    async def _execute_dag(
+        self,
+        tasks: List[TaskContext],
+        run: Callable[[TaskContext], Awaitable[TaskResult]]
+    ) -> List[TaskResult]:
+        self._build_graph(tasks)
+        logger.info("dag.started", "Executing DAG workflow with %d tasks", len(tasks), tasks=len(tasks))
+        
+        results: Dict[str, TaskResult] = {}
+        async for result in self._stream_dag(tasks, run):
+            results[result.task_id] = result
+        return [results[ctx.task_id] for ctx in tasks]
+    
+    async def as_completed(
+        self,
+        tasks: Union[Iterable[TaskContext], AsyncIterable[TaskContext]],
+        mode: str = "parallel",
+        max_pending: Optional[int] = 1000
+    ) -> AsyncIterator[TaskResult]:
+        """
+        Execute tasks and yield each result as soon as it is available.
+        
+        ``tasks`` may be a list or any (async) iterable; it is consumed
+        lazily, so very large workflows can be streamed in.
+        
+        Args:
+            tasks: Task contexts to execute
+            mode: "parallel" runs tasks concurrently; "sequential" runs them
+                in order and stops after the first failure; "dag" starts
+                each task once its ``depends_on`` tasks have completed.
+                In "dag" mode a dependency may arrive after its dependents,
+                and tasks whose dependencies never complete are reported
+                as FAILED once the input is exhausted.
+            max_pending: In parallel mode, the most tasks pulled from the
+                input and not yet yielded at any one time (None for no cap)
+                
+        Yields:
+            TaskResult objects in completion order
+        """
+        if mode == "parallel":
+            stream = self._stream_parallel(tasks, max_pending)
+        elif mode == "sequential":
+            stream = self._stream_sequential(tasks)
+        elif mode == "dag":
+            stream = self._stream_dag(tasks)
+        else:
+            raise ValueError(f"Unknown workflow mode '{mode}'; expected parallel, sequential or dag")
+        
+        async for result in stream:
+            yield result
+    
+    async def _stream_sequential(
+        self,
+        tasks: Union[Iterable[TaskContext], AsyncIterable[TaskContext]],
+        run: Optional[Callable[[TaskContext], Awaitable[TaskResult]]] = None
+    ) -> AsyncIterator[TaskResult]:
+        """Run tasks one at a time, stopping after the first failure."""
+        run = run or self.execute_task
+        feed = _TaskFeed(tasks)
+        try:
+            while True:
+                ctx = await feed.next()
+                if ctx is None:
+                    return
+                result = await run(ctx)
+                yield result
+                if result.status in (TaskStatus.FAILED, TaskStatus.CANCELLED):
+                    logger.warning(
+                        "workflow.stopped", "Workflow stopped due to task failure: %s", ctx.task_id,
+                        task_id=ctx.task_id
+                    )
+                    return
+        finally:
+            feed.close()
+    
+    async def _stream_parallel(
+        self,
+        tasks: Union[Iterable[TaskContext], AsyncIterable[TaskContext]],
+        max_pending: Optional[int]
+    ) -> AsyncIterator[TaskResult]:
+        """Run tasks concurrently, pulling new input as results are yielded."""
+        feed = _TaskFeed(tasks)
+        running: Dict[asyncio.Task, str] = {}
+        try:
+            while True:
+                while not feed.exhausted and feed.pending is None and (
+                    max_pending is None or len(running) < max_pending
+                ):
+                    ctx = feed.request()
+                    if ctx is not None:
+                        running[asyncio.create_task(self.execute_task(ctx))] = ctx.task_id
+                
+                if not running and feed.pending is None:
+                    return
+                
+                waitables = set(running)
+                if feed.pending is not None:
+                    waitables.add(feed.pending)
+                done, _ = await asyncio.wait(waitables, return_when=asyncio.FIRST_COMPLETED)
+                for finished in done:
+                    if finished is feed.pending:
+                        ctx = feed.collect()
+                        if ctx is not None:
+                            running[asyncio.create_task(self.execute_task(ctx))] = ctx.task_id
+                    else:
+                        yield _task_outcome(finished, running.pop(finished))
+        finally:
+            feed.close()
+            for pending in running:
+                pending.cancel()
+    
+    async def _stream_dag(
+        self,
+        tasks: Union[Iterable[TaskContext], AsyncIterable[TaskContext]],
+        run: Optional[Callable[[TaskContext], Awaitable[TaskResult]]] = None
+    ) -> AsyncIterator[TaskResult]:
+        """Run tasks as a dependency graph that may still be arriving."""
+        run = run or self.execute_task
+        feed = _TaskFeed(tasks)
+        seen: Set[str] = set()
+        outcomes: Dict[str, TaskStatus] = {}
+        outputs: Dict[str, Any] = {}
+        waiting: Dict[str, TaskContext] = {}
+        unfinished_inputs: Dict[str, int] = {}
+        dependents: Dict[str, List[str]] = {}
+        running: Dict[asyncio.Task, str] = {}
+        cancelled: Deque[TaskResult] = deque()
+        
+        def launch(ctx: TaskContext) -> None:
+            ctx.upstream_outputs = {dep: outputs[dep] for dep in ctx.depends_on}
+            running[asyncio.create_task(run(ctx))] = ctx.task_id
+        
+        def cancel_downstream(task_id: str, failed_id: str) -> None:
+            stack = [(task_id, failed_id)]
+            while stack:
+                child, upstream = stack.pop()
+                waiting.pop(child, None)
+                unfinished_inputs.pop(child, None)
+                result = TaskResult(
+                    task_id=child,
+                    status=TaskStatus.CANCELLED,
+                    error=f"Upstream task '{upstream}' did not complete"
+                )
+                outcomes[child] = result.status
+                self.task_history.append(result)
+                cancelled.append(result)
+                for grandchild in dependents.pop(child, []):
+                    if grandchild in waiting:
+                        stack.append((grandchild, child))
+        
+        def admit(ctx: TaskContext) -> None:
+            if ctx.task_id in seen:
+                raise ValueError(f"Duplicate task ID in workflow: {ctx.task_id}")
+            seen.add(ctx.task_id)
+            pending_inputs = 0
+            for dep in dict.fromkeys(ctx.depends_on):
+                if dep in outcomes:
+                    if outcomes[dep] != TaskStatus.COMPLETED:
+                        cancel_downstream(ctx.task_id, dep)
+                        return
+                else:
+                    pending_inputs += 1
+                    dependents.setdefault(dep, []).append(ctx.task_id)
+            if pending_inputs:
+                waiting[ctx.task_id] = ctx
+                unfinished_inputs[ctx.task_id] = pending_inputs
+            else:
+                launch(ctx)
+        
+        def settle(task_id: str, result: TaskResult) -> None:
+            outcomes[task_id] = result.status
+            outputs[task_id] = result.output
+            children = [child for child in dependents.pop(task_id, []) if child in waiting]
+            if result.status != TaskStatus.COMPLETED:
+                if children:
+                    logger.warning(
+                        "dag.cancel_downstream", "Cancelling tasks downstream of failed task: %s", task_id,
+                        task_id=task_id
+                    )
+                for child in children:
+                    if child in waiting:
+                        cancel_downstream(child, task_id)
+                return
+            for child in children:
+                unfinished_inputs[child] -= 1
+                if unfinished_inputs[child] == 0:
+                    del unfinished_inputs[child]
+                    launch(waiting.pop(child))
+        
+        try:
+            while True:
+                while not feed.exhausted and feed.pending is None:
+                    ctx = feed.request()
+                    if ctx is not None:
+                        admit(ctx)
+                while cancelled:
+                    yield cancelled.popleft()
                 
-                # Stop on failure if tasks are sequential
-                if result.status == TaskStatus.FAILED:
-                    logger.warning(f"Workflow stopped due to task failure: {task_ctx.task_id}")
+                if not running and feed.pending is None:
                     break
-                    
-            return results
-    
-    def _select_agent(self, task_type: TaskType) -> Optional[AgentProtocol]:
-        """Select an appropriate agent for the given task type."""
-        for agent in self.agents.values():
-            if task_type in agent.capabilities:
-                return agent
-        return None
+                
+                waitables = set(running)
+                if feed.pending is not None:
+                    waitables.add(feed.pending)
+                done, _ = await asyncio.wait(waitables, return_when=asyncio.FIRST_COMPLETED)
+                for finished in done:
+                    if finished is feed.pending:
+                        ctx = feed.collect()
+                        if ctx is not None:
+                            admit(ctx)
+                    else:
+                        task_id = running.pop(finished)
+                        result = _task_outcome(finished, task_id)
+                        settle(task_id, result)
+                        yield result
+            
+            # Whatever is still waiting depends on tasks that never arrived
+            # or on each other
+            for task_id, ctx in waiting.items():
+                unresolved = sorted(dep for dep in ctx.depends_on if dep not in outcomes)
+                result = TaskResult(
+                    task_id=task_id,
+                    status=TaskStatus.FAILED,
+                    error=f"Unresolved dependencies: {unresolved}"
+                )
+                self.task_history.append(result)
+                yield result
+        finally:
+            feed.close()
+            for pending in running:
+                pending.cancel()
+    
+    def _build_graph(self, tasks: List[TaskContext]) -> Dict[str, TaskContext]:
+        """Index tasks by ID and validate their dependency edges."""
+        nodes: Dict[str, TaskContext] = {}
+        for ctx in tasks:
+            if ctx.task_id in nodes:
+                raise ValueError(f"Duplicate task ID in workflow: {ctx.task_id}")
+            nodes[ctx.task_id] = ctx
+        
+        for ctx in tasks:
+            for dep in ctx.depends_on:
+                if dep not in nodes:
+                    raise ValueError(
+                        f"Task '{ctx.task_id}' depends on unknown task '{dep}'"
+                    )
+        
+        # Kahn's algorithm: anything left unvisited sits on a cycle
+        in_degree = {task_id: len(set(ctx.depends_on)) for task_id, ctx in nodes.items()}
+        children: Dict[str, List[str]] = {task_id: [] for task_id in nodes}
+        for ctx in tasks:
+            for dep in set(ctx.depends_on):
+                children[dep].append(ctx.task_id)
+        ready = [task_id for task_id, degree in in_degree.items() if degree == 0]
+        visited = 0
+        while ready:
+            task_id = ready.pop()
+            visited += 1
+            for child in children[task_id]:
+                in_degree[child] -= 1
+                if in_degree[child] == 0:
+                    ready.append(child)
+        if visited != len(nodes):
+            cyclic = sorted(task_id for task_id, degree in in_degree.items() if degree)
+            raise ValueError(f"Workflow contains a dependency cycle: {cyclic}")
+        
+        return nodes
+    
+    async def _run_agent(self, agent: AgentProtocol, context: TaskContext) -> TaskResult:
+        """
+        Run the agent on its backend once admitted by its limits.
+        
+        An adaptive agent limit is fed the time of the backend (or batch)
+        call alone, measured after engine admission, so queueing for an
+        engine slot never reads as the agent slowing down.
+        """
+        # Agent limits come first so a saturated agent never holds engine
+        # slots that other agents could use
+        agent_limiter = self._agent_limiters.get(agent.name) or ConcurrencyLimiter()
+        await agent_limiter.acquire()
+        try:
+            async with self._engine_limiter:
+                started = time.monotonic()
+                dropped = True
+                try:
+                    batcher = self._batchers.get(agent.name)
+                    if batcher is not None:
+                        # Batches run on the event loop, whatever the backend
+                        result = await batcher.submit(context)
+                    else:
+                        backend = self._agent_backends.get(agent.name) or self._get_backend("inline")
+                        result = await backend.run(agent, context)
+                    dropped = False
+                    return result
+                finally:
+                    if isinstance(agent_limiter, AdaptiveLimiter):
+                        agent_limiter.record(time.monotonic() - started, dropped)
+        finally:
+            agent_limiter.release()
+    
+    def _get_backend(self, name: str) -> ExecutionBackend:
+        """Return the engine's shared backend instance for ``name``."""
+        if name not in self._backends:
+            if name not in BACKENDS:
+                raise ValueError(
+                    f"Unknown execution backend '{name}'; "
+                    f"expected one of {sorted(BACKENDS)}"
+                )
+            self._backends[name] = BACKENDS[name]()
+        return self._backends[name]
+    
+    def shutdown(self) -> None:
+        """Shut down backend pools and close the queue, history spill and checkpoint stores."""
+        for backend in set(self._backends.values()) | set(self._agent_backends.values()):
+            backend.shutdown()
+        self.task_queue.close()
+        self.task_history.close()
+        if self.checkpoints is not None:
+            self.checkpoints.close()
+    
+    def submit(
+        self,
+        context: TaskContext,
+        priority: int = 0,
+        agent_name: Optional[str] = None
+    ) -> TaskHandle:
+        """
+        Queue a task for the worker pool.
+        
+        Args:
+            context: The task context to execute
+            priority: Higher priorities run first; ties run in submit order
+            agent_name: Optional specific agent to use, otherwise auto-select
+            
+        Returns:
+            TaskHandle for polling, awaiting or cancelling the task
+        """
+        self.task_queue.put(context, priority, agent_name)
+        handle = TaskHandle(context.task_id, priority)
+        self._handles[context.task_id] = handle
+        logger.task(
+            logging.INFO, "task.queued", context.task_id,
+            "Queued task %s with priority %d", context.task_id, priority, priority=priority
+        )
+        return handle
+    
+    def get_task_handle(self, task_id: str) -> Optional[TaskHandle]:
+        """Return the handle of a queued or running task."""
+        return self._handles.get(task_id)
+    
+    def start_workers(self, count: int = 4) -> None:
+        """Start ``count`` workers draining the task queue on the running loop."""
+        for _ in range(count):
+            self._workers.append(asyncio.create_task(self._worker()))
+        logger.info("workers.started", "Started %d workers", count, workers=count)
+    
+    async def stop_workers(self, drain: bool = False) -> None:
+        """
+        Stop the worker pool.
+        
+        Args:
+            drain: Wait for every queued task to finish first. Otherwise
+                running tasks are interrupted and put back in the queue.
+        """
+        if drain:
+            await self.task_queue.join()
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers.clear()
+        logger.info("workers.stopped", "Stopped workers")
+    
+    def cancel_task(self, task_id: str) -> bool:
+        """
+        Cancel a queued or running task.
+        
+        Returns:
+            True if the task was found and cancelled
+        """
+        entry = self.task_queue.remove(task_id)
+        if entry is not None:
+            result = TaskResult(
+                task_id=task_id,
+                status=TaskStatus.CANCELLED,
+                error="Cancelled before start"
+            )
+            self.task_history.append(result)
+            handle = self._handles.pop(task_id, None)
+            if handle is not None:
+                handle._resolve(result)
+            return True
+        
+        task = self.active_tasks.get(task_id)
+        if task is not None and not task.done():
+            self._cancel_requested.add(task_id)
+            task.cancel()
+            return True
+        return False
+    
+    async def _worker(self) -> None:
+        """Run queued tasks until cancelled."""
+        while True:
+            entry = await self.task_queue.get()
+            task_id = entry.task_id
+            handle = self._handles.setdefault(task_id, TaskHandle(task_id, entry.priority))
+            handle.status = TaskStatus.RUNNING
+            queue_wait = time.monotonic() - entry.enqueued_at
+            self.tracer.record("queue_wait", queue_wait, task_id=task_id)
+            if self.metrics is not None:
+                self.metrics.histogram(
+                    "blender_engine_queue_wait_seconds", "Time tasks spent queued"
+                ).observe(queue_wait)
+            try:
+                # Cancellation through cancel_task comes back as a CANCELLED
+                # result; a CancelledError here means the worker is stopping
+                result = await self.execute_task(entry.context, entry.agent_name)
+            except asyncio.CancelledError:
+                handle.status = TaskStatus.PENDING
+                self.task_queue.requeue(entry)
+                raise
+            
+            self.task_queue.task_done(task_id)
+            self._handles.pop(task_id, None)
+            handle._resolve(result)
+    
+    def _select_agent(
+        self,
+        task_type: TaskType,
+        exclude: Optional[Set[str]] = None
+    ) -> Optional[AgentProtocol]:
+        """
+        Select the agent for the given task type using the routing policy.
+        
+        Agents whose circuit is open are skipped. Agents in ``exclude`` are
+        skipped too, unless no other agent is available.
+        """
+        candidates = self._capabilities.candidates(task_type)
+        if self._breakers:
+            candidates = [
+                name for name in candidates
+                if name not in self._breakers or self._breakers[name].available()
+            ]
+        if exclude:
+            candidates = [name for name in candidates if name not in exclude] or candidates
+        if not candidates:
+            return None
+        if len(candidates) == 1:
+            return self.agents[candidates[0]]
+        return self.agents[self.routing_policy.choose(candidates, self._agent_stats)]
     
     def get_engine_status(self) -> Dict[str, Any]:
         """Get the current status of the engine."""
         return {
             "registered_agents": list(self.agents.keys()),
+            "agent_load": {
+                name: stats.to_dict() for name, stats in self._agent_stats.items()
+            },
+            "concurrency_limits": {
+                name: limiter.to_dict() for name, limiter in self._agent_limiters.items()
+            },
             "active_tasks": len(self.active_tasks),
-            "completed_tasks": len([r for r in self.task_history 
-                                  if r.status == TaskStatus.COMPLETED]),
-            "failed_tasks": len([r for r in self.task_history 
-                                if r.status == TaskStatus.FAILED]),
+            "queued_tasks": len(self.task_queue),
+            "workers": len(self._workers),
+            "completed_tasks": self.task_history.count(TaskStatus.COMPLETED),
+            "failed_tasks": self.task_history.count(TaskStatus.FAILED),
+            "cancelled_tasks": self.task_history.count(TaskStatus.CANCELLED),
+            "retained_results": len(self.task_history),
+            "coalesced_tasks": self._coalesced_count,
+            "batching": {
+                name: batcher.stats() for name, batcher in self._batchers.items()
+            },
+            "latency": self._latency_summary(),
+            "circuit_breakers": {
+                name: breaker.state for name, breaker in self._breakers.items()
+            },
+            "cache": self.result_cache.stats() if self.result_cache is not None else None,
+        }
+    
+    def _latency_summary(self) -> Optional[Dict[str, Dict[str, Optional[float]]]]:
+        """Per-agent latency percentiles, when metrics are enabled."""
+        if self.metrics is None:
+            return None
+        histogram = self.metrics.histogram(
+            "blender_engine_agent_latency_seconds", "Agent call latency per attempt"
+        )
+        return {
+            labels["agent"]: histogram.summary(**labels)
+            for labels in histogram.label_sets()
         }
     
     def get_task_history(self, task_id: Optional[str] = None) -> List[TaskResult]:
         """Get task execution history, optionally filtered by task ID."""
         if task_id:
-            return [r for r in self.task_history if r.task_id == task_id]
-        return self.task_history
+            return self.task_history.get(task_id)
+        return list(self.task_history)
 
 
-class PipelineBuilder:
-    """Builder class for constructing task pipelines."""
+class _TaskFeed:
+    """Pulls task contexts on demand from a sync or async iterable."""
     
-    def __init__(self, engine: BlenderEngine):
-        self.engine = engine
-        self.pipeline: List[TaskContext] = []
+    def __init__(self, tasks: Union[Iterable[TaskContext], AsyncIterable[TaskContext]]):
+        if hasattr(tasks, "__aiter__"):
+            self._async_source: Optional[AsyncIterator[TaskContext]] = tasks.__aiter__()
+            self._sync_source: Optional[Iterator[TaskContext]] = None
+        else:
+            self._async_source = None
+            self._sync_source = iter(tasks)
+        self.pending: Optional[asyncio.Future] = None
+        self.exhausted = False
     
-    def add_task(
-        self,
-        task_type: TaskType,
-        input_data: Dict[str, Any],
-        agent_name: Optional[str] = None
-    ) -> "PipelineBuilder":
-        """Add a task to the pipeline."""
-        import uuid
-        context = TaskContext(
-            task_id=str(uuid.uuid4()),
-            task_type=task_type,
-            input_data=input_data,
-            agent_name=agent_name  # This should be part of TaskContext or handled separately
-        )
-        self.pipeline.append(context)
-        return self
+    def request(self) -> Optional[TaskContext]:
+        """
+        Return the next context if it is available right away.
+        
+        For async sources this starts fetching it instead; wait on
+        ``pending`` and then call ``collect``.
+        """
+        if self._sync_source is not None:
+            try:
+                return next(self._sync_source)
+            except StopIteration:
+                self.exhausted = True
+                return None
+        if self.pending is None:
+            self.pending = asyncio.ensure_future(self._async_source.__anext__())
+        return None
+    
+    def collect(self) -> Optional[TaskContext]:
+        """Return the context fetched by a completed ``pending`` future."""
+        fetched, self.pending = self.pending, None
+        try:
+            return fetched.result()
+        except StopAsyncIteration:
+            self.exhausted = True
+            return None
     
-    def execute(self, parallel: bool = False) -> List[TaskResult]:
-        """Execute the constructed pipeline."""
-        return asyncio.run(self.engine.execute_workflow(self.pipeline, parallel))
+    async def next(self) -> Optional[TaskContext]:
+        """Wait for the next context, or None once the source is exhausted."""
+        ctx = self.request()
+        if ctx is not None or self.pending is None:
+            return ctx
+        await asyncio.wait([self.pending])
+        return self.collect()
+    
+    def close(self) -> None:
+        if self.pending is not None:
+            self.pending.cancel()
+            self.pending = None
+
+
+def _with_deadline(context: TaskContext, deadline: datetime) -> TaskContext:
+    """Return a shallow copy of ``context`` with ``deadline`` set."""
+    # copy.copy rather than dataclasses.replace, so CompactTaskContext works too
+    context = copy.copy(context)
+    context.deadline = deadline
+    return context
+
+
+def _task_outcome(task: asyncio.Task, task_id: str) -> TaskResult:
+    """Return the result of a finished execute_task task, even if it raised."""
+    if task.cancelled():
+        return TaskResult(task_id=task_id, status=TaskStatus.CANCELLED, error="Cancelled")
+    if task.exception() is not None:
+        return TaskResult(task_id=task_id, status=TaskStatus.FAILED, error=str(task.exception()))
+    return task.result()
 
 
 # Example usage and simple agent implementation
@@ -294,6 +1333,15 @@ class ExampleAgent:
         # Simple example: echo back with processing
         await asyncio.sleep(0.1)  # Simulate work
         
+        return self._echo(context)
+    
+    async def execute_batch(self, contexts: List[TaskContext]) -> List[TaskResult]:
+        """Execute several tasks for the cost of one round trip."""
+        await asyncio.sleep(0.1)  # Simulate work
+        
+        return [self._echo(context) for context in contexts]
+    
+    def _echo(self, context: TaskContext) -> TaskResult:
         return TaskResult(
             task_id=context.task_id,
             status=TaskStatus.COMPLETED,
@@ -307,6 +1355,8 @@ class ExampleAgent:
 
 async def main():
     """Main entry point for demonstration."""
+    configure_logging()
+    
     # Create engine
     engine = BlenderEngine()
     
@@ -331,6 +1381,7 @@ async def main():
     
     # Get engine status
     print(f"Engine status: {engine.get_engine_status()}")
+    shutdown_logging()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,124 @@
+"""
+Blender Engine History Module
+Bounded, indexed storage for task results with optional on-disk spill.
+"""
+
+import json
+import time
+from collections import deque
+from pathlib import Path
+from typing import Deque, Dict, IO, Iterator, List, Optional, Tuple, Union
+
+from .compact import CompactTaskResult
+from .tasks import TaskResult, TaskStatus
+
+
+class TaskHistory:
+    """
+    Store of executed task results.
+
+    Results are indexed by task ID and counted per status as they are
+    recorded, so lookups and status counts do not scan the history.
+    Retention is bounded by ``max_entries`` (ring buffer), ``max_age``
+    (seconds), or both; with neither, every result is kept. Evicted
+    results can be appended to a JSON-lines log at ``spill_path`` and
+    read back with ``query_spill``. With ``compact``, results are kept as
+    slotted ``CompactTaskResult`` objects, which use far less memory.
+    """
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        max_age: Optional[float] = None,
+        spill_path: Optional[Union[str, Path]] = None,
+        compact: bool = False
+    ):
+        if max_entries is not None and max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self.max_age = max_age
+        self.spill_path = Path(spill_path) if spill_path else None
+        self.compact = compact
+        self._entries: Deque[Tuple[float, TaskResult]] = deque()
+        self._index: Dict[str, List[TaskResult]] = {}
+        self._counts: Dict[TaskStatus, int] = {status: 0 for status in TaskStatus}
+        self._spill_file: Optional[IO[str]] = None
+        self.evicted = 0
+
+    def append(self, result: TaskResult) -> None:
+        """Record a result, evicting old entries if retention requires it."""
+        if self.compact and not isinstance(result, CompactTaskResult):
+            result = CompactTaskResult.from_result(result)
+        self._entries.append((time.time(), result))
+        self._index.setdefault(result.task_id, []).append(result)
+        self._counts[result.status] += 1
+        self._prune()
+
+    def get(self, task_id: str) -> List[TaskResult]:
+        """Return the retained results recorded for ``task_id``, oldest first."""
+        self._prune()
+        return list(self._index.get(task_id, ()))
+
+    def count(self, status: TaskStatus) -> int:
+        """Return how many results with ``status`` were ever recorded."""
+        return self._counts[status]
+
+    def _prune(self) -> None:
+        cutoff = time.time() - self.max_age if self.max_age is not None else None
+        while self._entries and (
+            (self.max_entries is not None and len(self._entries) > self.max_entries)
+            or (cutoff is not None and self._entries[0][0] < cutoff)
+        ):
+            recorded_at, result = self._entries.popleft()
+            # Entries leave in insertion order, so the oldest result for
+            # this task ID is always first in its index list
+            same_id = self._index[result.task_id]
+            same_id.pop(0)
+            if not same_id:
+                del self._index[result.task_id]
+            self.evicted += 1
+            if self.spill_path is not None:
+                self._spill(recorded_at, result)
+
+    def _spill(self, recorded_at: float, result: TaskResult) -> None:
+        if self._spill_file is None:
+            self.spill_path.parent.mkdir(parents=True, exist_ok=True)
+            self._spill_file = open(self.spill_path, "a", encoding="utf-8")
+        record = result.to_dict()
+        record["recorded_at"] = recorded_at
+        self._spill_file.write(json.dumps(record, default=str) + "\n")
+
+    def query_spill(
+        self,
+        task_id: Optional[str] = None,
+        status: Optional[TaskStatus] = None
+    ) -> Iterator[TaskResult]:
+        """Yield spilled results, optionally filtered by task ID and status."""
+        if self.spill_path is None or not self.spill_path.exists():
+            return
+        if self._spill_file is not None:
+            self._spill_file.flush()
+        with open(self.spill_path, "r", encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                if task_id is not None and record["task_id"] != task_id:
+                    continue
+                if status is not None and record["status"] != status.value:
+                    continue
+                yield TaskResult.from_dict(record)
+
+    def close(self) -> None:
+        """Close the spill log if it is open."""
+        if self._spill_file is not None:
+            self._spill_file.close()
+            self._spill_file = None
+
+    def __len__(self) -> int:
+        self._prune()
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[TaskResult]:
+        self._prune()
+        return iter([result for _, result in self._entries])
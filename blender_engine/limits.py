@@ -0,0 +1,320 @@
+"""
+Blender Engine Limits Module
+Admission control for agent execution: in-flight caps, rate limits and
+adaptive concurrency limits.
+"""
+
+import asyncio
+import math
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+
+
+class RateLimiter:
+    """
+    Token bucket rate limiter.
+
+    Tokens refill continuously at ``rate`` per second up to ``burst``.
+    Waiters are served in arrival order, so a steady stream of callers
+    cannot starve one that arrived earlier.
+    """
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = burst if burst is not None else max(rate, 1.0)
+        if self.burst < 1:
+            raise ValueError("burst must be at least 1")
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and consume it."""
+        async with self._lock:
+            self._refill()
+            while self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= 1
+
+
+class ConcurrencyLimiter:
+    """
+    Combined in-flight cap and rate limit.
+
+    Usable as an async context manager around a single call. Either
+    limit may be omitted; a limiter with neither admits immediately.
+    """
+
+    def __init__(
+        self,
+        max_in_flight: Optional[int] = None,
+        rate_limit: Optional[float] = None,
+        burst: Optional[float] = None
+    ):
+        if max_in_flight is not None and max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1")
+        self.max_in_flight = max_in_flight
+        self._slots = asyncio.Semaphore(max_in_flight) if max_in_flight else None
+        self._rate = RateLimiter(rate_limit, burst) if rate_limit else None
+        self.in_flight = 0
+        self.waiting = 0
+
+    async def acquire(self) -> None:
+        """Wait for admission."""
+        self.waiting += 1
+        try:
+            if self._slots is not None:
+                await self._slots.acquire()
+            if self._rate is not None:
+                try:
+                    await self._rate.acquire()
+                except BaseException:
+                    if self._slots is not None:
+                        self._slots.release()
+                    raise
+        finally:
+            self.waiting -= 1
+        self.in_flight += 1
+
+    def release(self) -> None:
+        """Release a slot taken by ``acquire``."""
+        self.in_flight -= 1
+        if self._slots is not None:
+            self._slots.release()
+
+    async def __aenter__(self) -> "ConcurrencyLimiter":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        self.release()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "algorithm": "static",
+            "limit": self.max_in_flight,
+            "in_flight": self.in_flight,
+            "waiting": self.waiting,
+        }
+
+
+class LimitAlgorithm:
+    """Base class for algorithms that adjust a concurrency limit from samples."""
+
+    name = "base"
+
+    def __init__(self, initial: int, min_limit: int, max_limit: int):
+        if not 1 <= min_limit <= initial <= max_limit:
+            raise ValueError("limits must satisfy 1 <= min_limit <= initial <= max_limit")
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self._limit = float(initial)
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    def update(self, rtt: float, in_flight: int, dropped: bool) -> int:
+        """Fold in one call's round-trip time and outcome; return the new limit."""
+        raise NotImplementedError
+
+    def _clamp(self, value: float) -> float:
+        return min(float(self.max_limit), max(float(self.min_limit), value))
+
+
+class AIMDLimit(LimitAlgorithm):
+    """
+    Additive increase, multiplicative decrease.
+
+    The limit grows by one for each successful call made while at least
+    half of it was in use, and is multiplied by ``backoff_ratio`` when a
+    call fails or takes longer than ``timeout``.
+    """
+
+    name = "aimd"
+
+    def __init__(
+        self,
+        initial: int = 10,
+        min_limit: int = 1,
+        max_limit: int = 200,
+        backoff_ratio: float = 0.9,
+        timeout: Optional[float] = None
+    ):
+        super().__init__(initial, min_limit, max_limit)
+        if not 0 < backoff_ratio < 1:
+            raise ValueError("backoff_ratio must be between 0 and 1")
+        self.backoff_ratio = backoff_ratio
+        self.timeout = timeout
+
+    def update(self, rtt: float, in_flight: int, dropped: bool) -> int:
+        if dropped or (self.timeout is not None and rtt > self.timeout):
+            self._limit = self._clamp(self._limit * self.backoff_ratio)
+        elif in_flight * 2 >= self._limit:
+            self._limit = self._clamp(self._limit + 1)
+        return self.limit
+
+
+class GradientLimit(LimitAlgorithm):
+    """
+    Latency-gradient limit, after Netflix's Gradient2.
+
+    Compares a long-term average round-trip time with the latest sample.
+    While latency stays within ``tolerance`` of the baseline the limit
+    grows by a queue allowance of ``sqrt(limit)``; as latency rises the
+    gradient drops below one and shrinks the limit in proportion. Failed
+    calls back off multiplicatively.
+    """
+
+    name = "gradient"
+
+    def __init__(
+        self,
+        initial: int = 10,
+        min_limit: int = 1,
+        max_limit: int = 200,
+        tolerance: float = 1.5,
+        smoothing: float = 0.2,
+        long_window: int = 600,
+        backoff_ratio: float = 0.9
+    ):
+        super().__init__(initial, min_limit, max_limit)
+        self.tolerance = tolerance
+        self.smoothing = smoothing
+        self.backoff_ratio = backoff_ratio
+        self._long_alpha = 2.0 / (long_window + 1)
+        self.long_rtt: Optional[float] = None
+        self.short_rtt: Optional[float] = None
+
+    def update(self, rtt: float, in_flight: int, dropped: bool) -> int:
+        if dropped:
+            self._limit = self._clamp(self._limit * self.backoff_ratio)
+            return self.limit
+        self.short_rtt = rtt
+        if self.long_rtt is None:
+            self.long_rtt = rtt
+        else:
+            self.long_rtt += self._long_alpha * (rtt - self.long_rtt)
+            # Recover quickly from a baseline inflated by a past overload
+            if rtt > 0 and self.long_rtt / rtt > 2:
+                self.long_rtt *= 0.95
+        # Calls far below the limit say nothing about whether it is too low
+        if in_flight * 2 < self._limit:
+            return self.limit
+        gradient = max(0.5, min(1.0, self.tolerance * self.long_rtt / rtt if rtt > 0 else 1.0))
+        target = self._limit * gradient + math.sqrt(self._limit)
+        self._limit = self._clamp(self._limit * (1 - self.smoothing) + target * self.smoothing)
+        return self.limit
+
+
+LIMIT_ALGORITHMS = {
+    AIMDLimit.name: AIMDLimit,
+    GradientLimit.name: GradientLimit,
+}
+
+
+class AdaptiveLimiter:
+    """
+    In-flight limiter whose limit is set by a ``LimitAlgorithm``.
+
+    Used with ``async with``, each call's round-trip time is measured from
+    admission to release (queueing time excluded) and fed to the
+    algorithm, together with whether the call raised. Callers that wait
+    for other resources after admission should instead pair ``acquire``
+    and ``release`` and time the call itself with ``record``. Waiters are
+    admitted in arrival order as the limit and the in-flight count allow.
+    Drop-in for ``ConcurrencyLimiter``.
+    """
+
+    def __init__(
+        self,
+        algorithm: LimitAlgorithm,
+        rate_limit: Optional[float] = None,
+        burst: Optional[float] = None
+    ):
+        self.algorithm = algorithm
+        self._rate = RateLimiter(rate_limit, burst) if rate_limit else None
+        self._waiters: Deque[asyncio.Future] = deque()
+        self.in_flight = 0
+        self.dropped = 0
+        # Admission times of calls made through ``async with``, by task
+        self._started: Dict[Optional[asyncio.Task], float] = {}
+
+    @property
+    def max_in_flight(self) -> int:
+        return self.algorithm.limit
+
+    @property
+    def waiting(self) -> int:
+        return len(self._waiters)
+
+    async def acquire(self) -> None:
+        """Wait for admission."""
+        if self._waiters or self.in_flight >= self.algorithm.limit:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except BaseException:
+                if waiter.done() and not waiter.cancelled():
+                    # Admitted just as we were cancelled; pass the slot on
+                    self.in_flight -= 1
+                    self._wake()
+                else:
+                    self._waiters.remove(waiter)
+                raise
+        else:
+            self.in_flight += 1
+        if self._rate is not None:
+            try:
+                await self._rate.acquire()
+            except BaseException:
+                self.release()
+                raise
+
+    def release(self) -> None:
+        """Release a slot taken by ``acquire``."""
+        self.in_flight -= 1
+        self._wake()
+
+    def record(self, rtt: float, dropped: bool) -> None:
+        """Feed one call's outcome to the algorithm."""
+        if dropped:
+            self.dropped += 1
+        self.algorithm.update(rtt, self.in_flight, dropped)
+        self._wake()
+
+    def _wake(self) -> None:
+        while self._waiters and self.in_flight < self.algorithm.limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self.in_flight += 1
+                waiter.set_result(None)
+
+    async def __aenter__(self) -> "AdaptiveLimiter":
+        await self.acquire()
+        self._started[asyncio.current_task()] = time.monotonic()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        rtt = time.monotonic() - self._started.pop(asyncio.current_task())
+        self.record(rtt, dropped=exc_type is not None)
+        self.release()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "algorithm": self.algorithm.name,
+            "limit": self.algorithm.limit,
+            "in_flight": self.in_flight,
+            "waiting": self.waiting,
+            "dropped": self.dropped,
+        }
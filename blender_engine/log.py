@@ -0,0 +1,198 @@
+"""
+Blender Engine Logging Module
+Structured, lazily formatted event logging with a non-blocking queue sink
+and sampling of per-task events.
+
+The package never configures the root logger. Applications opt in with
+``configure_logging``, or attach their own handlers to the
+``blender_engine`` logger.
+"""
+
+import copy
+import json
+import logging
+import queue
+import sys
+import zlib
+from logging.handlers import QueueHandler, QueueListener
+from typing import IO, Any, Dict, Optional
+
+ROOT_LOGGER_NAME = "blender_engine"
+
+logging.getLogger(ROOT_LOGGER_NAME).addHandler(logging.NullHandler())
+
+_SAMPLE_SCALE = 10_000
+
+
+class EventLogger:
+    """
+    Wrapper around a ``logging.Logger`` that emits structured events.
+
+    Every call checks ``isEnabledFor`` before doing any work, and messages
+    use %-style arguments so they are only formatted if a handler writes
+    them. Each record carries ``event`` (a dotted event name) and
+    ``fields`` (a dict of structured values) as extra attributes.
+
+    Per-task events logged through ``task`` below WARNING are sampled by
+    task ID, so either all or none of a task's routine events are kept.
+    """
+
+    def __init__(self, logger: logging.Logger, task_sample_rate: float = 1.0):
+        self.logger = logger
+        self.task_sample_rate = task_sample_rate
+
+    @property
+    def task_sample_rate(self) -> float:
+        return self._threshold / _SAMPLE_SCALE
+
+    @task_sample_rate.setter
+    def task_sample_rate(self, rate: float) -> None:
+        if not 0.0 <= rate <= 1.0:
+            raise ValueError("task_sample_rate must be between 0 and 1")
+        self._threshold = int(rate * _SAMPLE_SCALE)
+
+    def _log(self, level: int, event: str, msg: str, args: tuple, fields: Dict[str, Any]) -> None:
+        self.logger.log(level, msg, *args, extra={"event": event, "fields": fields}, stacklevel=3)
+
+    def debug(self, event: str, msg: str, *args: Any, **fields: Any) -> None:
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self._log(logging.DEBUG, event, msg, args, fields)
+
+    def info(self, event: str, msg: str, *args: Any, **fields: Any) -> None:
+        if self.logger.isEnabledFor(logging.INFO):
+            self._log(logging.INFO, event, msg, args, fields)
+
+    def warning(self, event: str, msg: str, *args: Any, **fields: Any) -> None:
+        if self.logger.isEnabledFor(logging.WARNING):
+            self._log(logging.WARNING, event, msg, args, fields)
+
+    def error(self, event: str, msg: str, *args: Any, **fields: Any) -> None:
+        if self.logger.isEnabledFor(logging.ERROR):
+            self._log(logging.ERROR, event, msg, args, fields)
+
+    def task(self, level: int, event: str, task_id: str, msg: str, *args: Any, **fields: Any) -> None:
+        """Log a per-task event, subject to sampling below WARNING."""
+        if not self.logger.isEnabledFor(level):
+            return
+        if level < logging.WARNING and self._threshold < _SAMPLE_SCALE:
+            if zlib.crc32(task_id.encode("utf-8")) % _SAMPLE_SCALE >= self._threshold:
+                return
+        fields["task_id"] = task_id
+        self._log(level, event, msg, args, fields)
+
+
+_event_loggers: Dict[str, EventLogger] = {}
+
+
+def get_logger(name: str) -> EventLogger:
+    """Return the shared ``EventLogger`` for ``name``."""
+    event_logger = _event_loggers.get(name)
+    if event_logger is None:
+        event_logger = _event_loggers[name] = EventLogger(logging.getLogger(name))
+    return event_logger
+
+
+def set_task_sample_rate(rate: float) -> None:
+    """Set the fraction (0-1) of tasks whose routine events are logged."""
+    for event_logger in _event_loggers.values():
+        event_logger.task_sample_rate = rate
+
+
+class StructuredFormatter(logging.Formatter):
+    """
+    Formats records with their structured fields.
+
+    As text, fields are appended as ``key=value`` pairs; with
+    ``json_output`` each record becomes one JSON object per line.
+    """
+
+    def __init__(self, json_output: bool = False):
+        super().__init__("%(asctime)s %(levelname)s %(name)s: %(message)s")
+        self.json_output = json_output
+
+    def format(self, record: logging.LogRecord) -> str:
+        fields = getattr(record, "fields", None) or {}
+        if not self.json_output:
+            text = super().format(record)
+            if fields:
+                text += " " + " ".join(f"{key}={value}" for key, value in fields.items())
+            return text
+        document = {
+            "ts": record.created,
+            "level": record.levelname,
+            "logger": record.name,
+            "event": getattr(record, "event", None),
+            "message": record.getMessage(),
+            **fields,
+        }
+        if record.exc_info:
+            document["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(document, default=str)
+
+
+class _DeferredQueueHandler(QueueHandler):
+    """
+    ``QueueHandler`` that leaves formatting to the listener thread.
+
+    The stock handler formats each record before enqueueing it, which
+    would put the formatting cost back on the caller. Records stay in
+    this process, so they do not need to be made picklable.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return copy.copy(record)
+
+
+_listener: Optional[QueueListener] = None
+
+
+def configure_logging(
+    level: int = logging.INFO,
+    stream: Optional[IO[str]] = None,
+    json_output: bool = False,
+    async_sink: bool = True,
+    task_sample_rate: float = 1.0
+) -> logging.Logger:
+    """
+    Attach a handler to the ``blender_engine`` logger.
+
+    Args:
+        level: Minimum level to log
+        stream: Output stream (defaults to stderr)
+        json_output: Write one JSON object per record instead of text
+        async_sink: Format and write records on a background thread, so
+            logging calls only enqueue the record
+        task_sample_rate: Fraction (0-1) of tasks whose routine events
+            are logged
+
+    Returns:
+        The configured package logger
+    """
+    shutdown_logging()
+    package_logger = logging.getLogger(ROOT_LOGGER_NAME)
+    for handler in list(package_logger.handlers):
+        if not isinstance(handler, logging.NullHandler):
+            package_logger.removeHandler(handler)
+
+    handler: logging.Handler = logging.StreamHandler(stream or sys.stderr)
+    handler.setFormatter(StructuredFormatter(json_output))
+    if async_sink:
+        global _listener
+        records: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+        _listener = QueueListener(records, handler, respect_handler_level=True)
+        _listener.start()
+        handler = _DeferredQueueHandler(records)
+
+    package_logger.addHandler(handler)
+    package_logger.setLevel(level)
+    package_logger.propagate = False
+    set_task_sample_rate(task_sample_rate)
+    return package_logger
+
+
+def shutdown_logging() -> None:
+    """Flush and stop the background sink started by ``configure_logging``."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
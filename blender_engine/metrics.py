@@ -0,0 +1,335 @@
+"""
+Blender Engine Metrics Module
+In-process counters, latency histograms and tracing spans, with Prometheus
+text and OpenTelemetry-compatible JSON export.
+"""
+
+import bisect
+import contextvars
+import json
+import os
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional, Sequence, Tuple, Union
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+DEFAULT_BUCKETS = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+    1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0
+)
+
+
+def _label_key(labels: Dict[str, Any]) -> LabelKey:
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def _format_labels(key: LabelKey, extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = list(key) + ([extra] if extra else [])
+    if not pairs:
+        return ""
+    body = ",".join(
+        '{}="{}"'.format(k, v.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+        for k, v in pairs
+    )
+    return "{" + body + "}"
+
+
+class Counter:
+    """Monotonically increasing count, one series per label set."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, help: str = ""):
+        self.name = name
+        self.help = help
+        self._values: Dict[LabelKey, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        key = _label_key(labels)
+        self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: Any) -> float:
+        return self._values.get(_label_key(labels), 0.0)
+
+    def render(self) -> List[str]:
+        return [
+            f"{self.name}{_format_labels(key)} {value:g}"
+            for key, value in sorted(self._values.items())
+        ]
+
+
+class _Series:
+    __slots__ = ("counts", "total", "count")
+
+    def __init__(self, buckets: int):
+        self.counts = [0] * (buckets + 1)
+        self.total = 0.0
+        self.count = 0
+
+
+class Histogram:
+    """
+    Fixed-bucket histogram, one series per label set.
+
+    Quantiles are estimated by linear interpolation within the bucket that
+    contains them, which is accurate to the bucket resolution.
+    """
+
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str = "", buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.name = name
+        self.help = help
+        self.buckets = tuple(sorted(buckets))
+        self._series: Dict[LabelKey, _Series] = {}
+
+    def observe(self, value: float, **labels: Any) -> None:
+        key = _label_key(labels)
+        series = self._series.get(key)
+        if series is None:
+            series = self._series[key] = _Series(len(self.buckets))
+        series.counts[bisect.bisect_left(self.buckets, value)] += 1
+        series.total += value
+        series.count += 1
+
+    def quantile(self, q: float, **labels: Any) -> Optional[float]:
+        """Estimate the ``q`` quantile (0-1) of a series, or None if empty."""
+        series = self._series.get(_label_key(labels))
+        if series is None or series.count == 0:
+            return None
+        rank = q * series.count
+        seen = 0
+        for i, bucket_count in enumerate(series.counts):
+            if bucket_count and seen + bucket_count >= rank:
+                lower = self.buckets[i - 1] if i > 0 else 0.0
+                if i == len(self.buckets):
+                    return lower
+                upper = self.buckets[i]
+                return lower + (upper - lower) * (rank - seen) / bucket_count
+            seen += bucket_count
+        return self.buckets[-1]
+
+    def summary(self, **labels: Any) -> Dict[str, Optional[float]]:
+        """Return count, mean and p50/p95/p99 for a series."""
+        series = self._series.get(_label_key(labels))
+        count = series.count if series else 0
+        return {
+            "count": count,
+            "mean": series.total / count if count else None,
+            "p50": self.quantile(0.50, **labels),
+            "p95": self.quantile(0.95, **labels),
+            "p99": self.quantile(0.99, **labels),
+        }
+
+    def label_sets(self) -> List[Dict[str, str]]:
+        return [dict(key) for key in self._series]
+
+    def render(self) -> List[str]:
+        lines = []
+        for key, series in sorted(self._series.items()):
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, series.counts):
+                cumulative += bucket_count
+                lines.append(f"{self.name}_bucket{_format_labels(key, ('le', f'{bound:g}'))} {cumulative}")
+            lines.append(f"{self.name}_bucket{_format_labels(key, ('le', '+Inf'))} {series.count}")
+            lines.append(f"{self.name}_sum{_format_labels(key)} {series.total:g}")
+            lines.append(f"{self.name}_count{_format_labels(key)} {series.count}")
+        return lines
+
+
+class MetricsRegistry:
+    """Registry of named metrics that can be dumped in Prometheus text format."""
+
+    def __init__(self):
+        self._metrics: Dict[str, Union[Counter, Histogram]] = {}
+
+    def counter(self, name: str, help: str = "") -> Counter:
+        """Return the counter called ``name``, creating it if needed."""
+        metric = self._metrics.get(name)
+        if metric is None:
+            metric = self._metrics[name] = Counter(name, help)
+        return metric
+
+    def histogram(self, name: str, help: str = "", buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        """Return the histogram called ``name``, creating it if needed."""
+        metric = self._metrics.get(name)
+        if metric is None:
+            metric = self._metrics[name] = Histogram(name, help, buckets)
+        return metric
+
+    def render_prometheus(self) -> str:
+        """Render every metric in the Prometheus text exposition format."""
+        lines = []
+        for name, metric in sorted(self._metrics.items()):
+            if metric.help:
+                lines.append(f"# HELP {name} {metric.help}")
+            lines.append(f"# TYPE {name} {metric.kind}")
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+class Span:
+    """A timed operation; durations use the monotonic high-resolution clock."""
+
+    __slots__ = (
+        "name", "trace_id", "span_id", "parent_id", "attributes",
+        "start_unix_ns", "start_ns", "end_ns", "status"
+    )
+
+    def __init__(self, name: str, trace_id: str, parent_id: Optional[str], attributes: Dict[str, Any]):
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = os.urandom(8).hex()
+        self.parent_id = parent_id
+        self.attributes = attributes
+        self.start_unix_ns = time.time_ns()
+        self.start_ns = time.perf_counter_ns()
+        self.end_ns: Optional[int] = None
+        self.status = "ok"
+
+    @property
+    def duration(self) -> float:
+        """Duration in seconds (zero while the span is open)."""
+        return ((self.end_ns or self.start_ns) - self.start_ns) / 1e9
+
+    def to_otel(self) -> Dict[str, Any]:
+        end_unix_ns = self.start_unix_ns + ((self.end_ns or self.start_ns) - self.start_ns)
+        span = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": 1,
+            "startTimeUnixNano": str(self.start_unix_ns),
+            "endTimeUnixNano": str(end_unix_ns),
+            "attributes": [
+                {"key": key, "value": {"stringValue": str(value)}}
+                for key, value in self.attributes.items()
+            ],
+            "status": {"code": 1 if self.status == "ok" else 2},
+        }
+        if self.parent_id:
+            span["parentSpanId"] = self.parent_id
+        return span
+
+
+_current_span: contextvars.ContextVar[Optional[Span]] = contextvars.ContextVar(
+    "blender_engine_span", default=None
+)
+
+
+class _SpanScope:
+    __slots__ = ("_tracer", "_span", "_token")
+
+    def __init__(self, tracer: "Tracer", span: Span):
+        self._tracer = tracer
+        self._span = span
+        self._token = None
+
+    def __enter__(self) -> Span:
+        self._token = _current_span.set(self._span)
+        return self._span
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._span.end_ns = time.perf_counter_ns()
+        if exc_type is not None:
+            self._span.status = "error"
+        _current_span.reset(self._token)
+        self._tracer._finished.append(self._span)
+
+
+class Tracer:
+    """
+    Records spans in a bounded in-memory buffer.
+
+    Spans opened inside another span (including across ``asyncio`` tasks
+    created within it) become its children and share its trace ID.
+    """
+
+    enabled = True
+
+    def __init__(self, max_spans: int = 100_000, service_name: str = "blender-engine"):
+        self.service_name = service_name
+        self._finished: Deque[Span] = deque(maxlen=max_spans)
+
+    def span(self, name: str, **attributes: Any) -> _SpanScope:
+        """Open a span; use as a context manager."""
+        parent = _current_span.get()
+        trace_id = parent.trace_id if parent else os.urandom(16).hex()
+        return _SpanScope(self, Span(name, trace_id, parent.span_id if parent else None, attributes))
+
+    def record(self, name: str, duration: float, **attributes: Any) -> None:
+        """Record a span that already ended, lasting ``duration`` seconds until now."""
+        parent = _current_span.get()
+        trace_id = parent.trace_id if parent else os.urandom(16).hex()
+        span = Span(name, trace_id, parent.span_id if parent else None, attributes)
+        offset = int(duration * 1e9)
+        span.end_ns = span.start_ns
+        span.start_ns -= offset
+        span.start_unix_ns -= offset
+        self._finished.append(span)
+
+    def spans(self) -> List[Span]:
+        return list(self._finished)
+
+    def export(self, path: Union[str, Path], clear: bool = True) -> int:
+        """
+        Append finished spans to ``path`` as one OTLP/JSON document per line.
+
+        Returns:
+            Number of spans written
+        """
+        spans = list(self._finished)
+        if clear:
+            self._finished.clear()
+        if not spans:
+            return 0
+        document = {
+            "resourceSpans": [{
+                "resource": {"attributes": [
+                    {"key": "service.name", "value": {"stringValue": self.service_name}}
+                ]},
+                "scopeSpans": [{
+                    "scope": {"name": "blender_engine"},
+                    "spans": [span.to_otel() for span in spans],
+                }],
+            }]
+        }
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(document) + "\n")
+        return len(spans)
+
+
+class _NullScope:
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        return None
+
+
+class NullTracer:
+    """Tracer used when tracing is disabled; every call is a no-op."""
+
+    enabled = False
+    _scope = _NullScope()
+
+    def span(self, name: str, **attributes: Any) -> _NullScope:
+        return self._scope
+
+    def record(self, name: str, duration: float, **attributes: Any) -> None:
+        pass
+
+    def spans(self) -> List[Span]:
+        return []
+
+    def export(self, path: Union[str, Path], clear: bool = True) -> int:
+        return 0
+
+
+NULL_TRACER = NullTracer()
@@ -0,0 +1,283 @@
+"""
+Blender Engine Pipeline Module
+Compile task pipelines once into validated, immutable plans and run them
+many times with different inputs.
+"""
+
+import asyncio
+import copy
+import uuid
+from dataclasses import dataclass, field, replace
+from datetime import datetime
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from .tasks import TaskContext, TaskResult, TaskType
+
+if TYPE_CHECKING:
+    from .engine import BlenderEngine
+
+
+@dataclass(frozen=True)
+class Stage:
+    """
+    One step of a compiled pipeline.
+
+    A stage with ``for_each`` is a fan-out template: at run time it becomes
+    one task per item of the run input named by ``for_each``, with the item
+    stored in the task's input under ``item_key``. ``candidates`` are the
+    agents that could run the stage when the pipeline was compiled; a run
+    fails fast if none of them is still registered.
+    """
+    name: str
+    task_type: TaskType
+    input_data: Mapping[str, Any]
+    agent_name: Optional[str] = None
+    depends_on: Tuple[str, ...] = ()
+    inputs: Optional[Tuple[str, ...]] = None
+    timeout: Optional[float] = None
+    for_each: Optional[str] = None
+    item_key: str = "item"
+    candidates: Tuple[str, ...] = field(default=(), compare=False)
+
+
+class Pipeline:
+    """
+    Immutable, validated pipeline plan produced by ``PipelineBuilder.compile``.
+
+    Stages are stored in dependency order with their agents resolved. Each
+    ``run`` instantiates fresh task contexts, so one plan can be executed
+    any number of times, concurrently, from a running event loop.
+    """
+
+    __slots__ = ("engine", "stages", "parallel")
+
+    def __init__(self, engine: "BlenderEngine", stages: Tuple[Stage, ...], parallel: bool):
+        object.__setattr__(self, "engine", engine)
+        object.__setattr__(self, "stages", stages)
+        object.__setattr__(self, "parallel", parallel)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("Pipeline is immutable")
+
+    @property
+    def edges(self) -> List[Tuple[str, str]]:
+        """Dependency edges as (upstream, downstream) stage names."""
+        return [(dep, stage.name) for stage in self.stages for dep in stage.depends_on]
+
+    def instantiate(
+        self,
+        inputs: Optional[Dict[str, Any]] = None,
+        run_id: Optional[str] = None
+    ) -> List[TaskContext]:
+        """
+        Build the task contexts for one run.
+
+        Task IDs are ``<run_id>:<stage>``, or ``<run_id>:<stage>[<i>]`` for
+        fan-out tasks. Each task's input is the stage's ``input_data``
+        updated with the run inputs the stage selects.
+
+        Raises:
+            KeyError: If a fan-out stage's input is missing
+        """
+        inputs = inputs or {}
+        run_id = run_id or uuid.uuid4().hex[:12]
+        task_ids: Dict[str, List[str]] = {}
+        contexts = []
+        for stage in self.stages:
+            if stage.inputs is None:
+                selected = inputs
+            else:
+                selected = {key: inputs[key] for key in stage.inputs if key in inputs}
+            base = {**copy.deepcopy(dict(stage.input_data)), **selected}
+            depends_on = [task_id for dep in stage.depends_on for task_id in task_ids[dep]]
+
+            if stage.for_each is None:
+                items: Sequence[Tuple[str, Dict[str, Any]]] = [(f"{run_id}:{stage.name}", base)]
+            else:
+                if stage.for_each not in inputs:
+                    raise KeyError(f"Stage '{stage.name}' fans out over missing input '{stage.for_each}'")
+                items = [
+                    (f"{run_id}:{stage.name}[{i}]", {**base, stage.item_key: item})
+                    for i, item in enumerate(inputs[stage.for_each])
+                ]
+
+            task_ids[stage.name] = [task_id for task_id, _ in items]
+            for task_id, input_data in items:
+                contexts.append(TaskContext(
+                    task_id=task_id,
+                    task_type=stage.task_type,
+                    input_data=input_data,
+                    metadata={"pipeline_run": run_id, "stage": stage.name},
+                    depends_on=list(depends_on),
+                    timeout=stage.timeout,
+                    agent_name=stage.agent_name,
+                ))
+        return contexts
+
+    async def run(
+        self,
+        inputs: Optional[Dict[str, Any]] = None,
+        run_id: Optional[str] = None,
+        deadline: Optional[datetime] = None,
+        timeout: Optional[float] = None
+    ) -> List[TaskResult]:
+        """
+        Execute the pipeline once.
+
+        Args:
+            inputs: Run inputs merged into each stage's input data
+            run_id: Prefix for this run's task IDs (random by default)
+            deadline: Optional wall-clock deadline for the whole run
+            timeout: Optional seconds the whole run may take
+
+        Returns:
+            List of TaskResult objects
+
+        Raises:
+            ValueError: If every agent resolved for a stage at compile time
+                has since been unregistered
+        """
+        self.check_agents()
+        contexts = self.instantiate(inputs, run_id)
+        return await self.engine.execute_workflow(
+            contexts, parallel=self.parallel, deadline=deadline, timeout=timeout
+        )
+
+    def check_agents(self) -> None:
+        """
+        Verify that each stage still has one of its compiled agents registered.
+
+        Raises:
+            ValueError: Naming the first stage whose agents are all gone
+        """
+        for stage in self.stages:
+            if not any(name in self.engine.agents for name in stage.candidates):
+                raise ValueError(
+                    f"Stage '{stage.name}': resolved agent(s) {list(stage.candidates)} are no "
+                    f"longer registered; recompile the pipeline"
+                )
+
+    def run_sync(self, inputs: Optional[Dict[str, Any]] = None, **kwargs: Any) -> List[TaskResult]:
+        """Run the pipeline from synchronous code (not from a running event loop)."""
+        return asyncio.run(self.run(inputs, **kwargs))
+
+    def __repr__(self) -> str:
+        return f"Pipeline(stages={[stage.name for stage in self.stages]}, parallel={self.parallel})"
+
+
+class PipelineBuilder:
+    """Builder class for constructing task pipelines."""
+
+    def __init__(self, engine: "BlenderEngine"):
+        self.engine = engine
+        self._stages: List[Stage] = []
+
+    def add_task(
+        self,
+        task_type: TaskType,
+        input_data: Optional[Dict[str, Any]] = None,
+        agent_name: Optional[str] = None,
+        name: Optional[str] = None,
+        depends_on: Sequence[str] = (),
+        inputs: Optional[Sequence[str]] = None,
+        timeout: Optional[float] = None
+    ) -> "PipelineBuilder":
+        """
+        Add a task to the pipeline.
+
+        Args:
+            task_type: Type of task
+            input_data: Fixed input for the task
+            agent_name: Optional agent the task is pinned to
+            name: Stage name (defaults to ``stage-<n>``)
+            depends_on: Names of stages that must complete first
+            inputs: Run inputs copied into the task input (all by default)
+            timeout: Optional seconds the task may run
+        """
+        self._stages.append(Stage(
+            name=name or f"stage-{len(self._stages)}",
+            task_type=task_type,
+            input_data=MappingProxyType(copy.deepcopy(input_data or {})),
+            agent_name=agent_name,
+            depends_on=tuple(depends_on),
+            inputs=tuple(inputs) if inputs is not None else None,
+            timeout=timeout,
+        ))
+        return self
+
+    def for_each(
+        self,
+        over: str,
+        task_type: TaskType,
+        input_data: Optional[Dict[str, Any]] = None,
+        item_key: str = "item",
+        **kwargs: Any
+    ) -> "PipelineBuilder":
+        """
+        Add a fan-out stage that runs once per item of the run input ``over``.
+
+        Each task receives its item under ``item_key``. Stages that depend
+        on a fan-out stage wait for all of its tasks. Other keyword
+        arguments are as for ``add_task``.
+        """
+        self.add_task(task_type, input_data, **kwargs)
+        stage = self._stages.pop()
+        self._stages.append(replace(stage, for_each=over, item_key=item_key))
+        return self
+
+    def compile(self, parallel: bool = False) -> Pipeline:
+        """
+        Validate the stages and produce an immutable plan.
+
+        Args:
+            parallel: Run stages without dependencies concurrently
+
+        Raises:
+            ValueError: On duplicate stage names, unknown dependencies,
+                cycles, unregistered pinned agents or task types no agent
+                can handle
+        """
+        by_name: Dict[str, Stage] = {}
+        for stage in self._stages:
+            if stage.name in by_name:
+                raise ValueError(f"Duplicate stage name: {stage.name}")
+            by_name[stage.name] = stage
+
+        resolved: Dict[str, Stage] = {}
+        for stage in self._stages:
+            unknown = [dep for dep in stage.depends_on if dep not in by_name]
+            if unknown:
+                raise ValueError(f"Stage '{stage.name}' depends on unknown stage(s): {unknown}")
+            if stage.agent_name is not None:
+                if stage.agent_name not in self.engine.agents:
+                    raise ValueError(f"Stage '{stage.name}' pins unregistered agent '{stage.agent_name}'")
+                candidates: Tuple[str, ...] = (stage.agent_name,)
+            else:
+                candidates = tuple(self.engine._capabilities.candidates(stage.task_type))
+                if not candidates:
+                    raise ValueError(
+                        f"Stage '{stage.name}': no agent available for task type: {stage.task_type.value}"
+                    )
+            resolved[stage.name] = replace(stage, candidates=candidates)
+
+        # Order stages so that every stage follows its dependencies
+        ordered: List[Stage] = []
+        placed: set = set()
+        remaining = list(self._stages)
+        while remaining:
+            ready = [stage for stage in remaining if all(dep in placed for dep in stage.depends_on)]
+            if not ready:
+                raise ValueError(
+                    f"Dependency cycle among stages: {sorted(stage.name for stage in remaining)}"
+                )
+            for stage in ready:
+                ordered.append(resolved[stage.name])
+                placed.add(stage.name)
+            remaining = [stage for stage in remaining if stage.name not in placed]
+
+        return Pipeline(self.engine, tuple(ordered), parallel)
+
+    def execute(self, parallel: bool = False) -> List[TaskResult]:
+        """Compile and execute the pipeline once from synchronous code."""
+        return self.compile(parallel).run_sync()
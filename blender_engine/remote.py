@@ -0,0 +1,422 @@
+#!/usr/bin/env python3
+"""
+Blender Engine Remote Module
+Run agents in worker daemons on other hosts (or other local processes) and
+dispatch to them from a ``BlenderEngine`` through proxy agents.
+
+Protocol: every message is a frame of a 4-byte big-endian length followed
+by a UTF-8 JSON object. A connection carries one request at a time; the
+client keeps a small pool of connections per worker for concurrency.
+
+    {"op": "hello"}                        -> {"ok": true, "agents": [...]}
+    {"op": "ping"}                         -> {"ok": true, "in_flight": n}
+    {"op": "execute", "agent", "context"}  -> {"ok": true, "result": {...}}
+
+Failed requests answer ``{"ok": false, "error": "..."}``.
+
+Usage:
+    python -m blender_engine.remote --listen tcp://0.0.0.0:7400
+    python -m blender_engine.remote --listen unix:///tmp/agents.sock --agent mypkg.agents:build
+"""
+
+import argparse
+import asyncio
+import importlib
+import json
+import os
+import struct
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from .log import configure_logging, get_logger
+from .tasks import TaskContext, TaskResult, TaskType
+
+logger = get_logger("blender_engine.remote")
+
+_FRAME_HEADER = struct.Struct("!I")
+MAX_FRAME_SIZE = 64 * 1024 * 1024
+
+Connection = Tuple[asyncio.StreamReader, asyncio.StreamWriter]
+
+
+class RemoteAgentError(RuntimeError):
+    """A remote worker could not be reached or rejected a request."""
+
+
+async def read_frame(reader: asyncio.StreamReader) -> Dict[str, Any]:
+    """Read one framed message; raises ``asyncio.IncompleteReadError`` at EOF."""
+    (length,) = _FRAME_HEADER.unpack(await reader.readexactly(_FRAME_HEADER.size))
+    if length > MAX_FRAME_SIZE:
+        raise RemoteAgentError(f"Frame of {length} bytes exceeds the {MAX_FRAME_SIZE} byte limit")
+    return json.loads(await reader.readexactly(length))
+
+
+async def write_frame(writer: asyncio.StreamWriter, message: Dict[str, Any]) -> None:
+    """Write one framed message and wait for the transport to drain."""
+    body = json.dumps(message, separators=(",", ":"), default=str).encode("utf-8")
+    writer.write(_FRAME_HEADER.pack(len(body)) + body)
+    await writer.drain()
+
+
+def parse_address(address: str) -> Tuple[str, Any]:
+    """
+    Parse ``tcp://host:port`` or ``unix:///path`` (a bare ``host:port`` is TCP).
+
+    Returns:
+        ("tcp", (host, port)) or ("unix", path)
+    """
+    if address.startswith("unix://"):
+        return "unix", address[len("unix://"):]
+    if address.startswith("tcp://"):
+        address = address[len("tcp://"):]
+    host, sep, port = address.rpartition(":")
+    if not sep or not port.isdigit():
+        raise ValueError(f"Invalid worker address: {address!r}")
+    return "tcp", (host.strip("[]") or "127.0.0.1", int(port))
+
+
+async def open_connection(address: str) -> Connection:
+    kind, target = parse_address(address)
+    if kind == "unix":
+        return await asyncio.open_unix_connection(target)
+    return await asyncio.open_connection(*target)
+
+
+class AgentWorker:
+    """
+    Daemon that hosts agents and executes tasks for remote engines.
+
+    Args:
+        agents: Agents to host, advertised by name and capabilities
+        address: ``tcp://host:port`` (port 0 picks a free port) or
+            ``unix:///path``
+    """
+
+    def __init__(self, agents: List[Any], address: str = "tcp://127.0.0.1:0"):
+        self.agents: Dict[str, Any] = {agent.name: agent for agent in agents}
+        self.address = address
+        self.in_flight = 0
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._connections: Set[asyncio.StreamWriter] = set()
+
+    async def start(self) -> str:
+        """
+        Start listening.
+
+        Returns:
+            The bound address, with the actual port for TCP
+        """
+        kind, target = parse_address(self.address)
+        if kind == "unix":
+            if os.path.exists(target):
+                os.unlink(target)
+            self._server = await asyncio.start_unix_server(self._handle, path=target)
+        else:
+            self._server = await asyncio.start_server(self._handle, *target)
+            host, port = self._server.sockets[0].getsockname()[:2]
+            self.address = f"tcp://{host}:{port}"
+        logger.info(
+            "worker.started", "Worker listening on %s with agents %s",
+            self.address, sorted(self.agents), address=self.address
+        )
+        return self.address
+
+    async def serve_forever(self) -> None:
+        if self._server is None:
+            await self.start()
+        await self._server.serve_forever()
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            # wait_closed also waits for open client connections (3.12+)
+            for writer in list(self._connections):
+                writer.close()
+            await self._server.wait_closed()
+            self._server = None
+        kind, target = parse_address(self.address)
+        if kind == "unix" and os.path.exists(target):
+            os.unlink(target)
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self._connections.add(writer)
+        try:
+            while True:
+                try:
+                    message = await read_frame(reader)
+                except asyncio.IncompleteReadError:
+                    return
+                await write_frame(writer, await self._dispatch(message))
+        except (ConnectionError, RemoteAgentError) as e:
+            logger.warning("worker.connection_error", "Dropping connection: %s", e)
+        finally:
+            self._connections.discard(writer)
+            writer.close()
+
+    async def _dispatch(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        op = message.get("op")
+        if op == "ping":
+            return {"ok": True, "in_flight": self.in_flight}
+        if op == "hello":
+            return {"ok": True, "agents": [
+                {"name": name, "capabilities": [t.value for t in agent.capabilities]}
+                for name, agent in self.agents.items()
+            ]}
+        if op == "execute":
+            agent = self.agents.get(message.get("agent"))
+            if agent is None:
+                return {"ok": False, "error": f"Unknown agent: {message.get('agent')}"}
+            self.in_flight += 1
+            try:
+                result = await agent.execute(TaskContext.from_dict(message["context"]))
+            except Exception as e:
+                return {"ok": False, "error": f"{type(e).__name__}: {e}"}
+            finally:
+                self.in_flight -= 1
+            return {"ok": True, "result": result.to_dict()}
+        return {"ok": False, "error": f"Unknown op: {op}"}
+
+
+class WorkerClient:
+    """
+    Connection pool and heartbeat for one remote worker.
+
+    Up to ``pool_size`` requests run concurrently, each on its own pooled
+    connection. A background heartbeat pings the worker every
+    ``heartbeat_interval`` seconds on a connection of its own, so a pool
+    busy with long tasks does not delay it. ``healthy`` reports whether the
+    last heartbeat or request got an answer; it is informational, and
+    requests are always attempted. A worker that cannot be reached fails
+    them with ``RemoteAgentError``, so the engine's retries and circuit
+    breakers route around it.
+    """
+
+    def __init__(
+        self,
+        address: str,
+        pool_size: int = 4,
+        connect_timeout: float = 5.0,
+        heartbeat_interval: float = 5.0,
+        heartbeat_timeout: float = 2.0
+    ):
+        if pool_size < 1:
+            raise ValueError("pool_size must be at least 1")
+        self.address = address
+        self.pool_size = pool_size
+        self.connect_timeout = connect_timeout
+        self.heartbeat_interval = heartbeat_interval
+        self.heartbeat_timeout = heartbeat_timeout
+        self.healthy = True
+        self.agents: List["RemoteAgent"] = []
+        self._idle: List[Connection] = []
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._heartbeat: Optional[asyncio.Task] = None
+        # Kept out of the pool, for pings only
+        self._ping_conn: Optional[Connection] = None
+        self._ping_lock: Optional[asyncio.Lock] = None
+        self._closed = False
+
+    async def connect(self) -> List["RemoteAgent"]:
+        """
+        Fetch the worker's agents and start the heartbeat.
+
+        Returns:
+            One proxy agent per agent hosted by the worker
+        """
+        reply = await self.request({"op": "hello"})
+        self.agents = [
+            RemoteAgent(self, spec["name"], [TaskType(value) for value in spec["capabilities"]])
+            for spec in reply["agents"]
+        ]
+        if self.heartbeat_interval and self._heartbeat is None:
+            self._heartbeat = asyncio.create_task(self._heartbeat_loop())
+        return self.agents
+
+    async def request(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        """Send one request on a pooled connection and return the reply."""
+        if self._closed:
+            raise RemoteAgentError(f"Client for {self.address} is closed")
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.pool_size)
+        async with self._slots:
+            conn = await self._acquire()
+            try:
+                await write_frame(conn[1], message)
+                reply = await read_frame(conn[0])
+            except BaseException as e:
+                # The connection may be mid-frame; never reuse it
+                self._discard(conn)
+                if isinstance(e, (ConnectionError, asyncio.IncompleteReadError)):
+                    self.healthy = False
+                    raise RemoteAgentError(f"Lost connection to {self.address}: {e}") from e
+                raise
+            self._idle.append(conn)
+        self.healthy = True
+        if not reply.get("ok"):
+            raise RemoteAgentError(reply.get("error") or "Remote request failed")
+        return reply
+
+    async def ping(self) -> bool:
+        """
+        Return whether the worker answers a ping within ``heartbeat_timeout``.
+
+        Pings use a dedicated connection rather than the request pool, so
+        they are not held up behind running tasks.
+        """
+        if self._closed:
+            return False
+        if self._ping_lock is None:
+            self._ping_lock = asyncio.Lock()
+        async with self._ping_lock:
+            try:
+                await asyncio.wait_for(self._ping_once(), self.heartbeat_timeout)
+            except (RemoteAgentError, asyncio.TimeoutError, OSError, asyncio.IncompleteReadError):
+                if self._ping_conn is not None:
+                    self._discard(self._ping_conn)
+                    self._ping_conn = None
+                return False
+        return True
+
+    async def _ping_once(self) -> None:
+        if self._ping_conn is None:
+            self._ping_conn = await open_connection(self.address)
+        await write_frame(self._ping_conn[1], {"op": "ping"})
+        reply = await read_frame(self._ping_conn[0])
+        if not reply.get("ok"):
+            raise RemoteAgentError(reply.get("error") or "Ping failed")
+
+    async def _acquire(self) -> Connection:
+        if self._idle:
+            return self._idle.pop()
+        try:
+            conn = await asyncio.wait_for(open_connection(self.address), self.connect_timeout)
+        except (OSError, asyncio.TimeoutError) as e:
+            self.healthy = False
+            raise RemoteAgentError(f"Cannot connect to {self.address}: {e}") from e
+        return conn
+
+    def _discard(self, conn: Connection) -> None:
+        conn[1].close()
+
+    async def _heartbeat_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.heartbeat_interval)
+            healthy = await self.ping()
+            if healthy != self.healthy:
+                if healthy:
+                    logger.info("worker.recovered", "Worker %s is healthy again", self.address)
+                else:
+                    logger.warning("worker.unhealthy", "Worker %s missed a heartbeat", self.address)
+            self.healthy = healthy
+
+    async def close(self) -> None:
+        """Stop the heartbeat and close pooled connections."""
+        self._closed = True
+        if self._heartbeat is not None:
+            self._heartbeat.cancel()
+            await asyncio.gather(self._heartbeat, return_exceptions=True)
+            self._heartbeat = None
+        while self._idle:
+            self._discard(self._idle.pop())
+        if self._ping_conn is not None:
+            self._discard(self._ping_conn)
+            self._ping_conn = None
+
+
+class RemoteAgent:
+    """Proxy that runs tasks on an agent hosted by a remote worker."""
+
+    def __init__(self, client: WorkerClient, remote_name: str, capabilities: List[TaskType]):
+        self.client = client
+        self.remote_name = remote_name
+        self._name = f"{remote_name}@{client.address}"
+        self._capabilities = capabilities
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def capabilities(self) -> List[TaskType]:
+        return self._capabilities
+
+    async def execute(self, context: TaskContext) -> TaskResult:
+        reply = await self.client.request({
+            "op": "execute",
+            "agent": self.remote_name,
+            "context": context.to_dict(),
+        })
+        return TaskResult.from_dict(reply["result"])
+
+
+async def register_remote_agents(
+    engine: Any,
+    address: str,
+    pool_size: int = 4,
+    heartbeat_interval: float = 5.0,
+    **register_kwargs: Any
+) -> WorkerClient:
+    """
+    Connect to a worker and register its agents with ``engine``.
+
+    Each proxy is registered as ``<agent>@<address>``, so the same agent
+    hosted by several workers becomes several routable agents. Extra
+    keyword arguments are passed to ``engine.register_agent``.
+
+    Returns:
+        The worker client; close it when the agents are unregistered
+    """
+    client = WorkerClient(address, pool_size=pool_size, heartbeat_interval=heartbeat_interval)
+    for agent in await client.connect():
+        engine.register_agent(agent, **register_kwargs)
+    return client
+
+
+def load_agents(spec: str) -> List[Any]:
+    """
+    Load agents from ``module:attribute``.
+
+    The attribute may be an agent, a list of agents, or a callable taking
+    no arguments that returns either.
+    """
+    module_name, _, attr = spec.partition(":")
+    if not attr:
+        raise ValueError(f"Agent spec must be module:attribute, got {spec!r}")
+    target = getattr(importlib.import_module(module_name), attr)
+    if callable(target) and not hasattr(target, "execute"):
+        target = target()
+    return list(target) if isinstance(target, (list, tuple)) else [target]
+
+
+async def _serve(address: str, agent_specs: List[str]) -> None:
+    if agent_specs:
+        agents = [agent for spec in agent_specs for agent in load_agents(spec)]
+    else:
+        from .engine import ExampleAgent
+        agents = [ExampleAgent("example-agent", list(TaskType))]
+    worker = AgentWorker(agents, address)
+    await worker.start()
+    print(f"Worker listening on {worker.address}", flush=True)
+    try:
+        await worker.serve_forever()
+    finally:
+        await worker.close()
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Blender Engine remote agent worker")
+    parser.add_argument("--listen", default="tcp://127.0.0.1:7400",
+                        help="Address to listen on: tcp://host:port or unix:///path")
+    parser.add_argument("--agent", action="append", default=[], metavar="MODULE:ATTR",
+                        help="Agent(s) to host (repeatable; defaults to the example agent)")
+    args = parser.parse_args()
+
+    configure_logging()
+    try:
+        asyncio.run(_serve(args.listen, args.agent))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
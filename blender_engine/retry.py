@@ -0,0 +1,106 @@
+"""
+Blender Engine Retry Module
+Retry policies with exponential backoff and per-agent circuit breakers.
+"""
+
+import random
+import time
+from typing import Tuple, Type
+
+
+class RetryPolicy:
+    """
+    Decides whether and when a failed task attempt is retried.
+
+    Delays grow exponentially from ``base_delay`` by ``multiplier`` per
+    attempt, capped at ``max_delay``. With ``jitter`` the delay is drawn
+    uniformly from zero up to that value ("full jitter"), which keeps
+    retries from many tasks from arriving in lockstep.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay: float = 0.1,
+        max_delay: float = 10.0,
+        multiplier: float = 2.0,
+        jitter: bool = True,
+        retry_on: Tuple[Type[BaseException], ...] = (Exception,)
+    ):
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.multiplier = multiplier
+        self.jitter = jitter
+        self.retry_on = retry_on
+
+    def should_retry(self, attempt: int, error: BaseException) -> bool:
+        """Return whether to retry after ``attempt`` failed with ``error``."""
+        return attempt < self.max_attempts and isinstance(error, self.retry_on)
+
+    def delay(self, attempt: int) -> float:
+        """Return the seconds to wait after failed attempt number ``attempt``."""
+        ceiling = min(self.max_delay, self.base_delay * self.multiplier ** (attempt - 1))
+        return random.uniform(0, ceiling) if self.jitter else ceiling
+
+
+NO_RETRY = RetryPolicy(max_attempts=1)
+
+
+class CircuitBreaker:
+    """
+    Per-agent circuit breaker.
+
+    After ``failure_threshold`` consecutive failures the circuit opens and
+    the agent is skipped by routing. Once ``recovery_timeout`` seconds
+    have passed it becomes half-open and admits a single probe: success
+    closes the circuit, failure opens it again.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: float = 30.0):
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be at least 1")
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+
+    def available(self) -> bool:
+        """Return whether a call may be routed to the agent right now."""
+        if self.state == self.CLOSED:
+            return True
+        if self.state == self.OPEN:
+            return time.monotonic() - self._opened_at >= self.recovery_timeout
+        return not self._probing
+
+    def on_dispatch(self) -> None:
+        """Record that a call is being routed to the agent."""
+        if self.state == self.OPEN and self.available():
+            self.state = self.HALF_OPEN
+        if self.state == self.HALF_OPEN:
+            self._probing = True
+
+    def record_success(self) -> None:
+        self.state = self.CLOSED
+        self.failures = 0
+        self._probing = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+            self.state = self.OPEN
+            self._opened_at = time.monotonic()
+        self._probing = False
+
+    def release(self) -> None:
+        """Release a half-open probe that ended without an outcome."""
+        self._probing = False
+
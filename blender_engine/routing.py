@@ -0,0 +1,124 @@
+"""
+Blender Engine Routing Module
+Capability index and load-aware agent selection policies.
+"""
+
+from typing import Dict, Hashable, List, Mapping, Optional, Sequence, Tuple
+
+
+class AgentStats:
+    """Load and latency statistics tracked per registered agent."""
+
+    def __init__(self, alpha: float = 0.2):
+        self.alpha = alpha
+        self.in_flight = 0
+        self.completed = 0
+        self.failed = 0
+        self.latency_ewma: Optional[float] = None
+
+    def started(self) -> None:
+        """Record that a task has been routed to the agent."""
+        self.in_flight += 1
+
+    def finished(self, latency: float, success: bool) -> None:
+        """Record the outcome of a task routed to the agent."""
+        self.in_flight -= 1
+        if success:
+            self.completed += 1
+        else:
+            self.failed += 1
+        if self.latency_ewma is None:
+            self.latency_ewma = latency
+        else:
+            self.latency_ewma += self.alpha * (latency - self.latency_ewma)
+
+    def to_dict(self) -> Dict[str, Optional[float]]:
+        return {
+            "in_flight": self.in_flight,
+            "completed": self.completed,
+            "failed": self.failed,
+            "latency_ewma": self.latency_ewma,
+        }
+
+
+class CapabilityIndex:
+    """Maps each task type to the names of agents that can handle it."""
+
+    def __init__(self):
+        self._by_capability: Dict[Hashable, List[str]] = {}
+
+    def add(self, agent_name: str, capabilities: Sequence[Hashable]) -> None:
+        """Index an agent under each of its capabilities."""
+        for capability in dict.fromkeys(capabilities):
+            names = self._by_capability.setdefault(capability, [])
+            if agent_name not in names:
+                names.append(agent_name)
+
+    def remove(self, agent_name: str) -> None:
+        """Drop an agent from every capability it was indexed under."""
+        for capability, names in list(self._by_capability.items()):
+            if agent_name in names:
+                names.remove(agent_name)
+            if not names:
+                del self._by_capability[capability]
+
+    def candidates(self, capability: Hashable) -> List[str]:
+        """Return the agents able to handle ``capability``, in registration order."""
+        return self._by_capability.get(capability, [])
+
+
+class RoutingPolicy:
+    """Base class for agent selection policies."""
+
+    def choose(self, candidates: Sequence[str], stats: Mapping[str, AgentStats]) -> str:
+        """Pick one agent name out of a non-empty list of candidates."""
+        raise NotImplementedError
+
+
+class RoundRobinPolicy(RoutingPolicy):
+    """Cycle through candidates regardless of load."""
+
+    def __init__(self):
+        self._cursor = 0
+
+    def choose(self, candidates: Sequence[str], stats: Mapping[str, AgentStats]) -> str:
+        name = candidates[self._cursor % len(candidates)]
+        self._cursor += 1
+        return name
+
+
+class LeastOutstandingPolicy(RoutingPolicy):
+    """Pick the candidate with the fewest in-flight tasks."""
+
+    def __init__(self):
+        # Rotating the scan start spreads ties instead of always
+        # favouring the first registered agent
+        self._offset = 0
+
+    def _rotated(self, candidates: Sequence[str]) -> List[str]:
+        start = self._offset % len(candidates)
+        self._offset += 1
+        return list(candidates[start:]) + list(candidates[:start])
+
+    def _score(self, agent_stats: Optional[AgentStats]) -> Tuple[float, ...]:
+        return (agent_stats.in_flight if agent_stats else 0,)
+
+    def choose(self, candidates: Sequence[str], stats: Mapping[str, AgentStats]) -> str:
+        return min(self._rotated(candidates), key=lambda name: self._score(stats.get(name)))
+
+
+class LatencyEWMAPolicy(LeastOutstandingPolicy):
+    """
+    Pick the candidate with the lowest expected completion time.
+
+    The score is ``(in_flight + 1) * latency_ewma``, so a fast agent is
+    preferred until its queue grows. Agents without samples score zero
+    and are tried first, least loaded first.
+    """
+
+    def _score(self, agent_stats: Optional[AgentStats]) -> Tuple[float, ...]:
+        if agent_stats is None:
+            return (0.0, 0)
+        if agent_stats.latency_ewma is None:
+            return (0.0, agent_stats.in_flight)
+        return ((agent_stats.in_flight + 1) * agent_stats.latency_ewma, agent_stats.in_flight)
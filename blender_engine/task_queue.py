@@ -0,0 +1,215 @@
+"""
+Blender Engine Task Queue Module
+Priority queue of submitted tasks with optional SQLite persistence.
+"""
+
+import asyncio
+import heapq
+import itertools
+import json
+import sqlite3
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Deque, Dict, List, Optional, Tuple, Union
+
+from .tasks import TaskContext, TaskResult, TaskStatus
+
+
+@dataclass
+class QueueEntry:
+    """A task waiting in the queue."""
+    context: TaskContext
+    priority: int = 0
+    agent_name: Optional[str] = None
+    enqueued_at: float = field(default_factory=time.monotonic)
+    seq: int = -1
+
+    @property
+    def task_id(self) -> str:
+        return self.context.task_id
+
+
+class TaskHandle:
+    """Handle for polling or awaiting a submitted task."""
+
+    def __init__(self, task_id: str, priority: int = 0):
+        self.task_id = task_id
+        self.priority = priority
+        self.status = TaskStatus.PENDING
+        self._result: Optional[TaskResult] = None
+        self._done = asyncio.Event()
+
+    def done(self) -> bool:
+        """Return whether the task has finished, failed or been cancelled."""
+        return self._result is not None
+
+    def result(self) -> Optional[TaskResult]:
+        """Return the task result, or None while it is still pending."""
+        return self._result
+
+    async def wait(self) -> TaskResult:
+        """Wait for the task to finish and return its result."""
+        await self._done.wait()
+        return self._result
+
+    def __await__(self):
+        return self.wait().__await__()
+
+    def _resolve(self, result: TaskResult) -> None:
+        if self._result is None:
+            self._result = result
+            self.status = result.status
+            self._done.set()
+
+
+class PriorityTaskQueue:
+    """
+    Priority queue of task contexts.
+
+    Higher priorities are dequeued first; equal priorities are FIFO. With
+    ``persist_path`` set, every entry is mirrored to a SQLite table until
+    it is marked done, so queued work survives a restart. An entry that
+    was running when the process died is queued again on restart.
+    """
+
+    def __init__(self, persist_path: Optional[Union[str, Path]] = None):
+        self._heap: List[Tuple[int, int, str]] = []
+        self._entries: Dict[str, QueueEntry] = {}
+        self._seq = itertools.count()
+        self._getters: Deque[asyncio.Future] = deque()
+        self._unfinished = 0
+        self._finished = asyncio.Event()
+        self._finished.set()
+        self._db: Optional[sqlite3.Connection] = None
+        if persist_path is not None:
+            self._open(Path(persist_path))
+
+    def _open(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(path))
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS queue ("
+            "task_id TEXT PRIMARY KEY, priority INTEGER, seq INTEGER, "
+            "agent_name TEXT, context TEXT)"
+        )
+        self._db.commit()
+        rows = self._db.execute(
+            "SELECT task_id, priority, seq, agent_name, context FROM queue ORDER BY seq"
+        ).fetchall()
+        last_seq = -1
+        for task_id, priority, seq, agent_name, context in rows:
+            entry = QueueEntry(TaskContext.from_dict(json.loads(context)), priority, agent_name)
+            entry.seq = seq
+            self._push(entry)
+            last_seq = max(last_seq, seq)
+        self._seq = itertools.count(last_seq + 1)
+
+    def _push(self, entry: QueueEntry) -> None:
+        self._entries[entry.task_id] = entry
+        heapq.heappush(self._heap, (-entry.priority, entry.seq, entry.task_id))
+        self._unfinished += 1
+        self._finished.clear()
+        self._wake_getter()
+
+    def _wake_getter(self) -> None:
+        while self._getters:
+            getter = self._getters.popleft()
+            if not getter.done():
+                getter.set_result(None)
+                break
+
+    def put(
+        self,
+        context: TaskContext,
+        priority: int = 0,
+        agent_name: Optional[str] = None
+    ) -> QueueEntry:
+        """Queue a task context."""
+        if context.task_id in self._entries:
+            raise ValueError(f"Task '{context.task_id}' is already queued")
+        entry = QueueEntry(context, priority, agent_name, seq=next(self._seq))
+        if self._db is not None:
+            self._db.execute(
+                "INSERT OR REPLACE INTO queue VALUES (?, ?, ?, ?, ?)",
+                (entry.task_id, priority, entry.seq, agent_name,
+                 json.dumps(context.to_dict(), default=str))
+            )
+            self._db.commit()
+        self._push(entry)
+        return entry
+
+    def requeue(self, entry: QueueEntry) -> None:
+        """Put back an entry that was dequeued but never finished."""
+        self._unfinished -= 1
+        self._push(entry)
+
+    def _pop(self) -> Optional[QueueEntry]:
+        while self._heap:
+            _, seq, task_id = heapq.heappop(self._heap)
+            entry = self._entries.get(task_id)
+            # Skip heap slots left behind by remove()
+            if entry is not None and entry.seq == seq:
+                del self._entries[task_id]
+                return entry
+        return None
+
+    async def get(self) -> QueueEntry:
+        """Wait for and remove the highest-priority entry."""
+        while True:
+            entry = self._pop()
+            if entry is not None:
+                return entry
+            getter = asyncio.get_running_loop().create_future()
+            self._getters.append(getter)
+            try:
+                await getter
+            except asyncio.CancelledError:
+                getter.cancel()
+                # Pass on a wakeup this getter may have consumed
+                if self._entries:
+                    self._wake_getter()
+                raise
+
+    def remove(self, task_id: str) -> Optional[QueueEntry]:
+        """Remove a still-queued entry, returning it if it was queued."""
+        entry = self._entries.pop(task_id, None)
+        if entry is not None:
+            # The heap slot is skipped lazily by _pop
+            self.task_done(task_id)
+        return entry
+
+    def task_done(self, task_id: str) -> None:
+        """Mark a dequeued entry as finished and drop it from persistence."""
+        if self._db is not None:
+            self._db.execute("DELETE FROM queue WHERE task_id = ?", (task_id,))
+            self._db.commit()
+        self._unfinished -= 1
+        if self._unfinished <= 0:
+            self._unfinished = 0
+            self._finished.set()
+
+    async def join(self) -> None:
+        """Wait until every queued entry has been marked done."""
+        await self._finished.wait()
+
+    def queued(self) -> List[QueueEntry]:
+        """Return the entries still waiting, highest priority first."""
+        return [
+            self._entries[task_id]
+            for _, seq, task_id in sorted(self._heap)
+            if task_id in self._entries and self._entries[task_id].seq == seq
+        ]
+
+    def close(self) -> None:
+        """Close the persistence database, if any."""
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    def __contains__(self, task_id: str) -> bool:
+        return task_id in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
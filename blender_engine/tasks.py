@@ -0,0 +1,120 @@
+"""
+Blender Engine Tasks Module
+Core task types shared by the engine and its subsystems.
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, List, Optional
+
+
+class TaskStatus(Enum):
+    """Enumeration of possible task statuses."""
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+class TaskType(Enum):
+    """Enumeration of supported task types."""
+    CODE_GENERATION = "code_generation"
+    CODE_REVIEW = "code_review"
+    REFACTORING = "refactoring"
+    TEST_GENERATION = "test_generation"
+    DOCUMENTATION = "documentation"
+    ANALYSIS = "analysis"
+    ORCHESTRATION = "orchestration"
+
+
+@dataclass
+class TaskContext:
+    """
+    Context information for a task execution.
+    
+    ``agent_name`` pins the task to one registered agent instead of
+    letting the routing policy choose.
+    """
+    task_id: str
+    task_type: TaskType
+    input_data: Dict[str, Any]
+    user_id: Optional[str] = None
+    project_path: Optional[str] = None
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    created_at: datetime = field(default_factory=datetime.now)
+    depends_on: List[str] = field(default_factory=list)
+    upstream_outputs: Dict[str, Any] = field(default_factory=dict)
+    timeout: Optional[float] = None
+    deadline: Optional[datetime] = None
+    agent_name: Optional[str] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the context to a JSON-serializable dictionary."""
+        return {
+            "task_id": self.task_id,
+            "task_type": self.task_type.value,
+            "input_data": self.input_data,
+            "user_id": self.user_id,
+            "project_path": self.project_path,
+            "metadata": self.metadata,
+            "created_at": self.created_at.isoformat(),
+            "depends_on": self.depends_on,
+            "upstream_outputs": self.upstream_outputs,
+            "timeout": self.timeout,
+            "deadline": self.deadline.isoformat() if self.deadline else None,
+            "agent_name": self.agent_name,
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "TaskContext":
+        """Rebuild a context from the output of ``to_dict``."""
+        return cls(
+            task_id=data["task_id"],
+            task_type=TaskType(data["task_type"]),
+            input_data=data.get("input_data", {}),
+            user_id=data.get("user_id"),
+            project_path=data.get("project_path"),
+            metadata=data.get("metadata", {}),
+            created_at=datetime.fromisoformat(data["created_at"]) if data.get("created_at") else datetime.now(),
+            depends_on=data.get("depends_on", []),
+            upstream_outputs=data.get("upstream_outputs", {}),
+            timeout=data.get("timeout"),
+            deadline=datetime.fromisoformat(data["deadline"]) if data.get("deadline") else None,
+            agent_name=data.get("agent_name"),
+        )
+
+
+@dataclass
+class TaskResult:
+    """Result from a task execution."""
+    task_id: str
+    status: TaskStatus
+    output: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    execution_time: float = 0.0
+    artifacts: Dict[str, str] = field(default_factory=dict)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the result to a JSON-serializable dictionary."""
+        return {
+            "task_id": self.task_id,
+            "status": self.status.value,
+            "output": self.output,
+            "error": self.error,
+            "execution_time": self.execution_time,
+            "artifacts": self.artifacts,
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "TaskResult":
+        """Rebuild a result from the output of ``to_dict``."""
+        return cls(
+            task_id=data["task_id"],
+            status=TaskStatus(data["status"]),
+            output=data.get("output"),
+            error=data.get("error"),
+            execution_time=data.get("execution_time", 0.0),
+            artifacts=data.get("artifacts", {}),
+        )
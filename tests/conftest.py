@@ -0,0 +1,11 @@
+import os
+
+import pytest
+
+STUB_BLENDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'stub_blender', 'blender')
+
+
+@pytest.fixture
+def stub_blender():
+    """Path of an executable that stands in for Blender."""
+    return STUB_BLENDER
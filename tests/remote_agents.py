@@ -0,0 +1,26 @@
+"""Agents hosted by the worker processes started in test_remote."""
+
+import asyncio
+import os
+
+from blender_engine.tasks import TaskContext, TaskResult, TaskStatus, TaskType
+
+
+class PidAgent:
+    """Reports which worker process ran the task."""
+
+    name = "pid"
+    capabilities = [TaskType.ANALYSIS]
+
+    async def execute(self, context: TaskContext) -> TaskResult:
+        await asyncio.sleep(context.input_data.get("sleep", 0.02))
+        if context.input_data.get("fail"):
+            raise RuntimeError("requested failure")
+        return TaskResult(
+            task_id=context.task_id,
+            status=TaskStatus.COMPLETED,
+            output={"pid": os.getpid(), "upstream": sorted(context.upstream_outputs)}
+        )
+
+
+agents = [PidAgent()]
@@ -0,0 +1,33 @@
+"""Minimal fake ``bpy`` for the stub Blender: the scene is a list of object names."""
+
+import json
+import types
+
+app = types.SimpleNamespace(threads=0)
+data = types.SimpleNamespace(objects=[])
+
+
+def _open_mainfile(filepath):
+    with open(filepath) as f:
+        data.objects[:] = json.load(f)
+
+
+def _read_homefile(**kwargs):
+    data.objects[:] = []
+
+
+def _save_as_mainfile(filepath, **kwargs):
+    with open(filepath, 'w') as f:
+        json.dump(data.objects, f)
+
+
+ops = types.SimpleNamespace(
+    wm=types.SimpleNamespace(
+        open_mainfile=_open_mainfile,
+        read_homefile=_read_homefile,
+        save_as_mainfile=_save_as_mainfile
+    )
+)
+context = types.SimpleNamespace(
+    preferences=types.SimpleNamespace(filepaths=types.SimpleNamespace(save_version=1))
+)
@@ -0,0 +1,99 @@
+"""Tests for execution backends."""
+
+import asyncio
+
+from blender_engine.backends import ProcessBackend
+from blender_engine.engine import BlenderEngine
+from blender_engine.tasks import TaskContext, TaskResult, TaskStatus, TaskType
+
+
+class ScaleAgent:
+    """Multiplies its input by a factor fixed when the agent is built."""
+
+    capabilities = [TaskType.ANALYSIS]
+
+    def __init__(self, name: str, factor: int):
+        self.name = name
+        self.factor = factor
+        # Padding that would dominate each call if the agent were resent
+        self.table = bytes(64 * 1024)
+
+    async def execute(self, context: TaskContext) -> TaskResult:
+        return TaskResult(
+            task_id=context.task_id,
+            status=TaskStatus.COMPLETED,
+            output={"value": context.input_data["value"] * self.factor}
+        )
+
+
+def record_submits(backend: ProcessBackend):
+    """Wrap the backend's pool so the arguments of each submitted call are kept."""
+    submitted = []
+    submit = backend._pool.submit
+
+    def recording_submit(fn, *args, **kwargs):
+        submitted.append(args)
+        return submit(fn, *args, **kwargs)
+
+    backend._pool.submit = recording_submit
+    return submitted
+
+
+def test_process_backend_sends_agents_once():
+    async def main():
+        backend = ProcessBackend(max_workers=2)
+        engine = BlenderEngine()
+        engine.register_agent(ScaleAgent("double", 2), backend=backend)
+        engine.register_agent(ScaleAgent("triple", 3), backend=backend)
+        try:
+            first = await engine.execute_task(
+                TaskContext("warm", TaskType.ANALYSIS, {"value": 1}), agent_name="double"
+            )
+            assert first.output == {"value": 2}
+            submitted = record_submits(backend)
+            results = await asyncio.gather(*(
+                engine.execute_task(
+                    TaskContext(f"t{i}", TaskType.ANALYSIS, {"value": i}),
+                    agent_name="double" if i % 2 else "triple"
+                )
+                for i in range(20)
+            ))
+        finally:
+            engine.shutdown()
+        return results, submitted
+
+    results, submitted = asyncio.run(main())
+    assert [r.output["value"] for r in results] == [i * (2 if i % 2 else 3) for i in range(20)]
+    assert len(submitted) == 20
+    # Registered before the pool started: only the key and the context go across
+    assert all(len(args) == 2 and isinstance(args[0], str) for args in submitted)
+
+
+def test_process_backend_agent_registered_after_pool_started():
+    async def main():
+        backend = ProcessBackend(max_workers=2)
+        engine = BlenderEngine()
+        engine.register_agent(ScaleAgent("double", 2), backend=backend)
+        try:
+            await engine.execute_task(
+                TaskContext("warm", TaskType.ANALYSIS, {"value": 1}), agent_name="double"
+            )
+            engine.register_agent(ScaleAgent("late", 5), backend=backend)
+            submitted = record_submits(backend)
+            results = await asyncio.gather(*(
+                engine.execute_task(
+                    TaskContext(f"t{i}", TaskType.ANALYSIS, {"value": i}), agent_name="late"
+                )
+                for i in range(10)
+            ))
+        finally:
+            engine.shutdown()
+        return results, submitted
+
+    results, submitted = asyncio.run(main())
+    assert all(r.status == TaskStatus.COMPLETED for r in results)
+    assert [r.output["value"] for r in results] == [i * 5 for i in range(10)]
+    # Only calls that reached a worker without the agent were resent with it
+    resent = [args for args in submitted if len(args) == 3]
+    assert 1 <= len(resent) <= 10
+    assert len(submitted) == 10 + len(resent)
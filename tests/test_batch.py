@@ -0,0 +1,72 @@
+"""Tests for BlenderBatch and the batch CLI against a stub Blender executable."""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from blender_engine.blender_tool import BlenderBatch, BlenderTool
+
+TOOL = os.path.join(os.path.dirname(__file__), '..', 'blender_engine', 'blender_tool.py')
+
+SPEC = [
+    {"op": "python", "code": "print('first')"},
+    {"op": "python", "code": "raise ValueError('second failed')"},
+    {"op": "python", "code": "print('third')"},
+]
+
+
+@pytest.mark.parametrize('use_worker', [False, True])
+def test_batch_stops_at_first_failure(stub_blender, use_worker):
+    tool = BlenderTool(use_worker=use_worker, blender_executable=stub_blender)
+    try:
+        results = BlenderBatch.from_spec(tool, SPEC).run(timeout=60)
+    finally:
+        tool.close()
+    assert [r['status'] for r in results] == ['completed', 'failed', 'skipped']
+    assert results[0]['output'].strip() == 'first'
+    assert 'second failed' in results[1]['error']
+
+
+@pytest.mark.parametrize('use_worker', [False, True])
+def test_batch_keep_going_runs_every_step(stub_blender, use_worker):
+    tool = BlenderTool(use_worker=use_worker, blender_executable=stub_blender)
+    try:
+        results = BlenderBatch.from_spec(tool, {"steps": SPEC, "stop_on_error": False}).run(timeout=60)
+    finally:
+        tool.close()
+    assert [r['status'] for r in results] == ['completed', 'failed', 'completed']
+    assert results[2]['output'].strip() == 'third'
+
+
+def test_batch_rejects_unknown_operations(stub_blender):
+    tool = BlenderTool(blender_executable=stub_blender)
+    with pytest.raises(ValueError):
+        BlenderBatch.from_spec(tool, [{"op": "close"}])
+
+
+def _cli(stub_blender, spec_path, *options):
+    return subprocess.run(
+        [sys.executable, TOOL, 'batch', '--spec', str(spec_path), '--blender', stub_blender, *options],
+        capture_output=True, text=True, timeout=60
+    )
+
+
+def test_batch_cli_reports_steps(stub_blender, tmp_path):
+    spec = tmp_path / "batch.json"
+    spec.write_text(json.dumps(SPEC))
+
+    proc = _cli(stub_blender, spec, '--keep-going')
+    assert proc.returncode == 1
+    assert "Batch: 2/3 steps completed" in proc.stdout
+
+
+def test_batch_cli_applies_timeout(stub_blender, tmp_path):
+    spec = tmp_path / "batch.json"
+    spec.write_text(json.dumps([{"op": "python", "code": "import time; time.sleep(30)"}]))
+
+    proc = _cli(stub_blender, spec, '--timeout', '0.5')
+    assert proc.returncode == 1
+    assert "timed out after 0.5s" in proc.stdout
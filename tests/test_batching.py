@@ -0,0 +1,69 @@
+"""Tests for micro-batching of tasks into execute_batch calls."""
+
+import asyncio
+
+import pytest
+
+from blender_engine.engine import BlenderEngine
+from blender_engine.tasks import TaskContext, TaskResult, TaskStatus, TaskType
+
+
+class BatchAgent:
+    name = "batch"
+    capabilities = list(TaskType)
+
+    def __init__(self, reply=None):
+        # Called with the contexts of a batch; returns what execute_batch returns
+        self.reply = reply
+        self.batches = []
+
+    async def execute(self, context: TaskContext) -> TaskResult:
+        raise AssertionError("batched agents are called through execute_batch")
+
+    async def execute_batch(self, contexts):
+        self.batches.append([ctx.task_id for ctx in contexts])
+        if self.reply is not None:
+            return self.reply(contexts)
+        return [
+            TaskResult(task_id=ctx.task_id, status=TaskStatus.COMPLETED, output=ctx.input_data)
+            for ctx in reversed(contexts)
+        ]
+
+
+def _run(agent, count):
+    engine = BlenderEngine()
+    engine.register_agent(agent, max_batch_size=4, max_batch_wait=0.01)
+    tasks = [TaskContext(f"t{i}", TaskType.ANALYSIS, {"i": i}) for i in range(count)]
+    return asyncio.run(asyncio.wait_for(engine.execute_workflow(tasks, parallel=True), timeout=5))
+
+
+def test_results_are_matched_by_task_id():
+    agent = BatchAgent()
+    results = _run(agent, 10)
+    assert [r.output["i"] for r in results] == list(range(10))
+    assert sorted(len(batch) for batch in agent.batches) == [2, 4, 4]
+
+
+@pytest.mark.parametrize("reply", [
+    lambda contexts: None,
+    lambda contexts: 42,
+    lambda contexts: ["not a result"] * len(contexts),
+])
+def test_malformed_batch_fails_every_task(reply):
+    results = _run(BatchAgent(reply), 6)
+    assert [r.status for r in results] == [TaskStatus.FAILED] * 6
+    assert all("invalid batch" in r.error for r in results)
+
+
+def test_missing_results_fail_only_their_tasks():
+    def reply(contexts):
+        return [
+            TaskResult(task_id=ctx.task_id, status=TaskStatus.COMPLETED)
+            for ctx in contexts if ctx.task_id != "t1"
+        ]
+
+    results = _run(BatchAgent(reply), 4)
+    assert [r.status for r in results] == [
+        TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.COMPLETED, TaskStatus.COMPLETED
+    ]
+    assert "no result for task 't1'" in results[1].error
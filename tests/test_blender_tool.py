@@ -0,0 +1,98 @@
+"""Tests for BlenderTool against a stub Blender executable."""
+
+import asyncio
+import os
+
+import pytest
+
+from blender_engine.blender_tool import BlenderTool
+
+
+def test_run_code_async_reports_script_errors(stub_blender):
+    tool = BlenderTool(blender_executable=stub_blender)
+    result = asyncio.run(tool.run_code_async("raise ValueError('render failed')"))
+    assert not result.ok
+    assert result.returncode == 1
+    assert "ValueError: render failed" in result.stderr
+
+
+def test_run_code_async_streams_output(stub_blender):
+    tool = BlenderTool(blender_executable=stub_blender)
+    lines = []
+    code = "import sys\nprint('one')\nprint('two')\nprint('oops', file=sys.stderr)"
+    result = asyncio.run(tool.run_code_async(code, on_output=lambda stream, line: lines.append((stream, line))))
+    assert result.ok
+    assert result.stdout == "one\ntwo\n"
+    assert ("stdout", "one") in lines and ("stderr", "oops") in lines
+
+
+def test_run_code_async_timeout_stops_blender(stub_blender):
+    tool = BlenderTool(blender_executable=stub_blender)
+    result = asyncio.run(tool.run_code_async("import time; time.sleep(10)", timeout=0.3))
+    assert result.timed_out
+    assert not result.ok
+    assert result.duration < 5
+
+
+def test_run_code_async_cancellation_stops_blender(stub_blender, tmp_path):
+    tool = BlenderTool(blender_executable=stub_blender)
+    pid_file = tmp_path / "pid"
+
+    async def main():
+        code = f"import os, time\nopen({str(pid_file)!r}, 'w').write(str(os.getpid()))\ntime.sleep(10)"
+        task = asyncio.ensure_future(tool.run_code_async(code))
+        while not pid_file.exists() or not pid_file.read_text():
+            await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(main())
+    pid = int(pid_file.read_text())
+    with pytest.raises(ProcessLookupError):
+        os.kill(pid, 0)
+
+
+def test_snippet_rejects_unknown_operations(stub_blender):
+    tool = BlenderTool(blender_executable=stub_blender)
+    assert "import bpy" in tool.snippet('render', engine='eevee')
+    for name in ('close', '_run_code', 'snippet', 'nonexistent'):
+        with pytest.raises(ValueError):
+            tool.snippet(name)
+    with pytest.raises(ValueError):
+        asyncio.run(tool.run_async('close'))
+
+
+ADD_OBJECT = "import bpy; bpy.data.objects.append({!r})"
+FAIL_AFTER_EDIT = "import bpy; bpy.data.objects.append('partial'); raise ValueError('boom')"
+SHOW_OBJECTS = "import bpy; print('objects', bpy.data.objects)"
+
+
+@pytest.mark.parametrize('use_worker', [False, True])
+def test_session_keeps_scene_and_drops_failed_edits(stub_blender, tmp_path, capsys, use_worker):
+    session = str(tmp_path / "scene.blend")
+    tool = BlenderTool(use_worker=use_worker, session=session, blender_executable=stub_blender)
+    try:
+        tool._run_code(ADD_OBJECT.format('cube'))
+        tool._run_code(FAIL_AFTER_EDIT)
+        tool._run_code(ADD_OBJECT.format('light'))
+        tool._run_code(SHOW_OBJECTS)
+    finally:
+        tool.close()
+    assert "objects ['cube', 'light']" in capsys.readouterr().out
+
+    # A new tool reopens the saved scene
+    tool = BlenderTool(session=session, blender_executable=stub_blender)
+    tool._run_code(SHOW_OBJECTS)
+    assert "objects ['cube', 'light']" in capsys.readouterr().out
+
+
+def test_worker_session_failed_first_command_is_discarded(stub_blender, tmp_path, capsys):
+    tool = BlenderTool(use_worker=True, session=str(tmp_path / "new.blend"), blender_executable=stub_blender)
+    try:
+        tool._run_code(FAIL_AFTER_EDIT)
+        tool._run_code(ADD_OBJECT.format('cube'))
+        tool._run_code(SHOW_OBJECTS)
+    finally:
+        tool.close()
+    assert "objects ['cube']" in capsys.readouterr().out
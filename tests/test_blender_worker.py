@@ -0,0 +1,85 @@
+"""Tests for the persistent Blender worker, run against the stub Blender executable."""
+
+import os
+
+import pytest
+
+from blender_engine.blender_tool import BlenderTool, BlenderWorker, BlenderWorkerError
+
+PID = "import os; print(os.getpid())"
+COUNT = "import sys; sys.calls = getattr(sys, 'calls', 0) + 1; print(sys.calls)"
+
+
+@pytest.fixture
+def worker(stub_blender):
+    worker = BlenderWorker(stub_blender, startup_timeout=20, command_timeout=20)
+    yield worker
+    worker.stop()
+
+
+def _out(reply):
+    assert reply['ok'], reply['error']
+    return reply['stdout'].strip()
+
+
+def test_commands_share_one_process(worker):
+    pid = _out(worker.execute(PID))
+    assert [_out(worker.execute(COUNT)) for _ in range(3)] == ['1', '2', '3']
+    assert _out(worker.execute(PID)) == pid
+    assert worker.restarts == 0
+
+
+def test_failed_command_keeps_the_worker(worker):
+    pid = _out(worker.execute(PID))
+    reply = worker.execute("raise ValueError('bad scene')")
+    assert not reply['ok']
+    assert "ValueError: bad scene" in reply['error']
+    assert _out(worker.execute(PID)) == pid
+
+
+def test_crash_restarts_the_worker(worker):
+    pid = _out(worker.execute(PID))
+    with pytest.raises(BlenderWorkerError, match="crashed"):
+        worker.execute("import os; os._exit(3)")
+    assert worker.restarts == 1
+    assert _out(worker.execute(PID)) != pid
+
+
+def test_timeout_restarts_the_worker(worker):
+    with pytest.raises(BlenderWorkerError, match="timed out"):
+        worker.execute("import time; time.sleep(30)", timeout=0.5)
+    assert worker.restarts == 1
+    assert _out(worker.execute(COUNT)) == '1'
+
+
+def test_dead_worker_is_restarted_before_the_next_command(worker, capsys):
+    pid = int(_out(worker.execute(PID)))
+    worker.process.kill()
+    worker.process.wait()
+    assert not worker.ping()
+    assert int(_out(worker.execute(PID))) != pid
+    assert "restarting" in capsys.readouterr().out
+
+
+def test_startup_code_runs_after_every_start(stub_blender):
+    worker = BlenderWorker(stub_blender, startup_timeout=20, startup_code="import sys; sys.ready = True")
+    try:
+        assert _out(worker.execute("import sys; print(sys.ready)")) == 'True'
+        worker.restart()
+        assert _out(worker.execute("import sys; print(sys.ready)")) == 'True'
+    finally:
+        worker.stop()
+    assert not os.path.exists(worker.log_path)
+
+
+def test_tool_reuses_the_worker_across_commands(stub_blender, capsys):
+    tool = BlenderTool(use_worker=True, blender_executable=stub_blender)
+    try:
+        for _ in range(3):
+            tool._run_code(COUNT)
+        process = tool.worker.process
+    finally:
+        tool.close()
+    counts = [line.strip() for line in capsys.readouterr().out.splitlines() if line.strip().isdigit()]
+    assert counts == ['1', '2', '3']
+    assert process.poll() is not None
@@ -0,0 +1,99 @@
+"""Tests for the result cache."""
+
+import asyncio
+
+from blender_engine.cache import ResultCache, task_key
+from blender_engine.engine import BlenderEngine
+from blender_engine.tasks import TaskContext, TaskResult, TaskStatus, TaskType
+
+
+class UpstreamAgent:
+    name = "upstream"
+    capabilities = list(TaskType)
+
+    def __init__(self):
+        self.seen = []
+
+    async def execute(self, context: TaskContext) -> TaskResult:
+        self.seen.append((context.task_id, context.upstream_outputs))
+        return TaskResult(
+            task_id=context.task_id,
+            status=TaskStatus.COMPLETED,
+            output={"input": context.input_data, "upstream": context.upstream_outputs}
+        )
+
+
+def test_task_key_ignores_id_and_metadata():
+    a = TaskContext("a", TaskType.ANALYSIS, {"x": 1, "y": 2}, metadata={"m": 1})
+    b = TaskContext("b", TaskType.ANALYSIS, {"y": 2, "x": 1})
+    assert task_key(a, "agent") == task_key(b, "agent")
+    assert task_key(a, "agent") != task_key(a, "other")
+
+
+def test_task_key_covers_upstream_outputs():
+    a = TaskContext("a", TaskType.ANALYSIS, {"x": 1}, upstream_outputs={"up": {"v": 1}})
+    b = TaskContext("b", TaskType.ANALYSIS, {"x": 1}, upstream_outputs={"up": {"v": 2}})
+    c = TaskContext("c", TaskType.ANALYSIS, {"x": 1}, upstream_outputs={"up": {"v": 1}})
+    assert task_key(a) != task_key(b)
+    assert task_key(a) == task_key(c)
+
+
+def test_cached_dag_node_reruns_when_upstream_changes():
+    engine = BlenderEngine(result_cache=ResultCache())
+    agent = UpstreamAgent()
+    engine.register_agent(agent, cacheable=True)
+
+    def dag(value):
+        return [
+            TaskContext("root", TaskType.ANALYSIS, {"value": value}),
+            TaskContext("leaf", TaskType.ANALYSIS, {"same": True}, depends_on=["root"]),
+        ]
+
+    asyncio.run(engine.execute_workflow(dag(1)))
+    results = asyncio.run(engine.execute_workflow(dag(2)))
+    assert results[1].output["upstream"]["root"]["input"] == {"value": 2}
+    assert [task_id for task_id, _ in agent.seen] == ["root", "leaf", "root", "leaf"]
+
+    # Identical upstream results are still served from the cache
+    asyncio.run(engine.execute_workflow(dag(2)))
+    assert len(agent.seen) == 4
+
+
+def _result(task_id):
+    return TaskResult(task_id=task_id, status=TaskStatus.COMPLETED, output={"id": task_id})
+
+
+def test_disk_tier_evicts_oldest_writes(tmp_path):
+    cache = ResultCache(max_entries=1, disk_path=tmp_path, max_disk_entries=3)
+    for i in range(5):
+        cache.put(f"k{i}", _result(f"t{i}"))
+    # Rewriting a key makes it the newest
+    cache.put("k2", _result("t2"))
+    cache.put("k5", _result("t5"))
+
+    assert sorted(p.stem for p in tmp_path.glob("*.json")) == ["k2", "k4", "k5"]
+    assert cache.get("k3") is None
+    assert cache.get("k4").output == {"id": "t4"}
+
+
+def test_disk_tier_bound_applies_to_files_from_earlier_runs(tmp_path):
+    first = ResultCache(disk_path=tmp_path)
+    for i in range(4):
+        first.put(f"old{i}", _result(f"old{i}"))
+
+    second = ResultCache(max_entries=1, disk_path=tmp_path, max_disk_entries=4)
+    second.put("new", _result("new"))
+    assert sorted(p.stem for p in tmp_path.glob("*.json")) == ["new", "old1", "old2", "old3"]
+    assert second.get("old3").output == {"id": "old3"}
+
+
+def test_disk_writes_do_not_rescan_the_directory(tmp_path, monkeypatch):
+    cache = ResultCache(max_entries=1, disk_path=tmp_path, max_disk_entries=2)
+
+    def glob(self, pattern):
+        raise AssertionError("put rescanned the disk cache")
+
+    monkeypatch.setattr(type(tmp_path), "glob", glob)
+    for i in range(5):
+        cache.put(f"k{i}", _result(f"t{i}"))
+    assert len(list(tmp_path.iterdir())) == 2
@@ -0,0 +1,89 @@
+"""Tests for checkpointed workflows and resume."""
+
+import asyncio
+from datetime import datetime, timedelta
+
+from blender_engine.engine import BlenderEngine
+from blender_engine.tasks import TaskContext, TaskResult, TaskStatus, TaskType
+
+
+class FlakyAgent:
+    name = "flaky"
+    capabilities = list(TaskType)
+
+    def __init__(self, fail_on=None):
+        self.fail_on = fail_on
+        self.calls = []
+
+    async def execute(self, context: TaskContext) -> TaskResult:
+        self.calls.append(context.task_id)
+        if context.task_id == self.fail_on:
+            raise RuntimeError("boom")
+        return TaskResult(
+            task_id=context.task_id,
+            status=TaskStatus.COMPLETED,
+            output={"upstream": sorted(context.upstream_outputs)}
+        )
+
+
+def _run(db, agent, coro_factory):
+    engine = BlenderEngine(checkpoint_path=db)
+    engine.register_agent(agent)
+    try:
+        return asyncio.run(coro_factory(engine))
+    finally:
+        engine.shutdown()
+
+
+def test_resume_skips_completed_tasks(tmp_path):
+    db = tmp_path / "checkpoints.db"
+    tasks = [TaskContext(f"s{i}", TaskType.ANALYSIS, {}) for i in range(4)]
+
+    first = FlakyAgent(fail_on="s2")
+    results = _run(db, first, lambda e: e.execute_workflow(tasks, workflow_id="wf"))
+    assert [r.status for r in results] == [TaskStatus.COMPLETED] * 2 + [TaskStatus.FAILED]
+
+    second = FlakyAgent()
+    results = _run(db, second, lambda e: e.resume("wf"))
+    assert [r.status for r in results] == [TaskStatus.COMPLETED] * 4
+    assert second.calls == ["s2", "s3"]
+
+
+def test_resume_dag_restores_upstream_outputs(tmp_path):
+    db = tmp_path / "checkpoints.db"
+    tasks = [
+        TaskContext("a", TaskType.ANALYSIS, {}),
+        TaskContext("b", TaskType.ANALYSIS, {}, depends_on=["a"]),
+        TaskContext("c", TaskType.ANALYSIS, {}, depends_on=["a", "b"]),
+    ]
+    _run(db, FlakyAgent(fail_on="b"), lambda e: e.execute_workflow(tasks, workflow_id="dag"))
+
+    agent = FlakyAgent()
+    results = _run(db, agent, lambda e: e.resume("dag"))
+    assert agent.calls == ["b", "c"]
+    assert results[-1].output == {"upstream": ["a", "b"]}
+
+
+def test_resume_after_deadline_bearing_run(tmp_path):
+    db = tmp_path / "checkpoints.db"
+
+    class SlowSecond(FlakyAgent):
+        async def execute(self, context):
+            if context.task_id == "t1":
+                await asyncio.sleep(1)
+            return await super().execute(context)
+
+    tasks = [TaskContext("t0", TaskType.ANALYSIS, {}), TaskContext("t1", TaskType.ANALYSIS, {})]
+    results = _run(db, SlowSecond(), lambda e: e.execute_workflow(tasks, timeout=0.3, workflow_id="wf"))
+    assert results[0].status == TaskStatus.COMPLETED
+    assert results[1].status != TaskStatus.COMPLETED
+
+    # Contexts that carry their own (now expired) deadline must not store it
+    expired = datetime.now() - timedelta(seconds=1)
+    rerun = [TaskContext(ctx.task_id, ctx.task_type, {}, deadline=expired) for ctx in tasks]
+    _run(db, FlakyAgent(), lambda e: e.execute_workflow(rerun, workflow_id="wf"))
+
+    agent = FlakyAgent()
+    results = _run(db, agent, lambda e: e.resume("wf"))
+    assert [(r.status, r.error) for r in results] == [(TaskStatus.COMPLETED, None)] * 2
+    assert agent.calls == ["t1"]
@@ -0,0 +1,94 @@
+"""Tests for single-flight coalescing of duplicate tasks."""
+
+import asyncio
+
+from blender_engine.engine import BlenderEngine
+from blender_engine.tasks import TaskContext, TaskResult, TaskStatus, TaskType
+
+
+class SlowAgent:
+    name = "slow"
+    capabilities = list(TaskType)
+
+    def __init__(self):
+        self.calls = 0
+
+    async def execute(self, context: TaskContext) -> TaskResult:
+        self.calls += 1
+        await asyncio.sleep(0.2)
+        return TaskResult(
+            task_id=context.task_id,
+            status=TaskStatus.COMPLETED,
+            output={"input": context.input_data, "upstream": context.upstream_outputs}
+        )
+
+
+def test_duplicates_share_one_call():
+    engine = BlenderEngine(coalesce=True)
+    agent = SlowAgent()
+    engine.register_agent(agent)
+    tasks = [TaskContext(f"t{i}", TaskType.ANALYSIS, {"same": 1}) for i in range(3)]
+
+    results = asyncio.run(engine.execute_workflow(tasks, parallel=True))
+    assert agent.calls == 1
+    assert [r.task_id for r in results] == ["t0", "t1", "t2"]
+    assert all(r.status == TaskStatus.COMPLETED for r in results)
+
+
+def test_different_upstream_outputs_are_not_coalesced():
+    engine = BlenderEngine(coalesce=True)
+    agent = SlowAgent()
+    engine.register_agent(agent)
+    a = TaskContext("a", TaskType.ANALYSIS, {"same": 1}, upstream_outputs={"up": 1})
+    b = TaskContext("b", TaskType.ANALYSIS, {"same": 1}, upstream_outputs={"up": 2})
+
+    async def main():
+        return await asyncio.gather(engine.execute_task(a), engine.execute_task(b))
+
+    first, second = asyncio.run(main())
+    assert agent.calls == 2
+    assert first.output["upstream"] == {"up": 1}
+    assert second.output["upstream"] == {"up": 2}
+
+
+def test_cancel_follower_leaves_leader_running():
+    engine = BlenderEngine(coalesce=True)
+    agent = SlowAgent()
+    engine.register_agent(agent)
+    leader = TaskContext("leader", TaskType.ANALYSIS, {"same": 1})
+    follower = TaskContext("follower", TaskType.ANALYSIS, {"same": 1})
+
+    async def main():
+        lead = asyncio.ensure_future(engine.execute_task(leader))
+        follow = asyncio.ensure_future(engine.execute_task(follower))
+        await asyncio.sleep(0.05)
+        assert engine.cancel_task("follower")
+        return await lead, await follow
+
+    lead_result, follow_result = asyncio.run(main())
+    assert lead_result.status == TaskStatus.COMPLETED
+    assert follow_result.status == TaskStatus.CANCELLED
+    assert agent.calls == 1
+    assert "follower" not in engine.active_tasks
+
+
+def test_cancel_leader_reruns_followers():
+    engine = BlenderEngine(coalesce=True)
+    agent = SlowAgent()
+    engine.register_agent(agent)
+    leader = TaskContext("leader", TaskType.ANALYSIS, {"same": 1})
+    followers = [TaskContext(f"f{i}", TaskType.ANALYSIS, {"same": 1}) for i in range(2)]
+
+    async def main():
+        lead = asyncio.ensure_future(engine.execute_task(leader))
+        follow = [asyncio.ensure_future(engine.execute_task(ctx)) for ctx in followers]
+        await asyncio.sleep(0.05)
+        assert engine.cancel_task("leader")
+        return await lead, await asyncio.gather(*follow)
+
+    lead_result, follow_results = asyncio.run(main())
+    assert lead_result.status == TaskStatus.CANCELLED
+    assert [r.status for r in follow_results] == [TaskStatus.COMPLETED] * 2
+    assert [r.task_id for r in follow_results] == ["f0", "f1"]
+    # One follower took over as leader; the other coalesced onto it
+    assert agent.calls == 2
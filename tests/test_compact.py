@@ -0,0 +1,49 @@
+"""Tests for compact task contexts and results."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from blender_engine.compact import CompactTaskContext, CompactTaskResult, pack_context, pack_result
+from blender_engine.tasks import TaskContext, TaskResult, TaskStatus, TaskType
+
+
+def test_result_pack_roundtrip():
+    result = TaskResult(
+        task_id="t1",
+        status=TaskStatus.FAILED,
+        output={"frames": [1, 2, 3], "name": "café"},
+        error="boom",
+        execution_time=1.25,
+        artifacts={"render": "/tmp/r.png"},
+    )
+    packed = pack_result(result)
+    assert CompactTaskResult.unpack(packed) == result
+    assert len(packed) < len(str(result.to_dict()))
+
+
+def test_context_pack_roundtrip():
+    context = TaskContext(
+        task_id="c1",
+        task_type=TaskType.CODE_GENERATION,
+        input_data={"samples": 64},
+        project_path="/p",
+        depends_on=["a"],
+        upstream_outputs={"a": {"ok": True}},
+        timeout=5.0,
+        deadline=datetime.now() + timedelta(minutes=1),
+        agent_name="agent",
+    )
+    restored = CompactTaskContext.unpack(pack_context(context)).to_context()
+    for field in ("task_id", "task_type", "input_data", "project_path", "depends_on",
+                  "upstream_outputs", "timeout", "agent_name"):
+        assert getattr(restored, field) == getattr(context, field)
+    assert abs((restored.deadline - context.deadline).total_seconds()) < 1e-3
+
+
+def test_unpack_rejects_other_records():
+    packed = pack_result(TaskResult("t", TaskStatus.COMPLETED))
+    with pytest.raises(ValueError):
+        CompactTaskContext.unpack(packed)
+    with pytest.raises(ValueError):
+        CompactTaskResult.unpack(packed[:-1] + b"x" + packed[-1:])
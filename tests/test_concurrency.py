@@ -0,0 +1,123 @@
+"""Tests for engine-wide and per-agent concurrency caps and rate limits."""
+
+import asyncio
+import time
+
+from blender_engine.engine import BlenderEngine
+from blender_engine.limits import ConcurrencyLimiter, RateLimiter
+from blender_engine.tasks import TaskContext, TaskResult, TaskStatus, TaskType
+
+
+class PeakAgent:
+    """Tracks the most calls it ever had in flight at once."""
+
+    capabilities = [TaskType.ANALYSIS]
+
+    def __init__(self, name="peak", delay=0.02):
+        self.name = name
+        self.delay = delay
+        self.in_flight = 0
+        self.peak = 0
+        self.calls = []
+
+    async def execute(self, context: TaskContext) -> TaskResult:
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        self.calls.append(time.monotonic())
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+        return TaskResult(task_id=context.task_id, status=TaskStatus.COMPLETED)
+
+
+def _tasks(count):
+    return [TaskContext(f"t{i}", TaskType.ANALYSIS, {"i": i}) for i in range(count)]
+
+
+def test_rate_limiter_enforces_rate_after_burst():
+    async def main():
+        limiter = RateLimiter(rate=20, burst=5)
+        start = time.monotonic()
+        times = []
+        for _ in range(15):
+            await limiter.acquire()
+            times.append(time.monotonic() - start)
+        return times
+
+    times = asyncio.run(main())
+    # The burst is admitted at once, the rest at 20 per second
+    assert times[4] < 0.05
+    assert 0.45 <= times[-1] < 1.0
+
+
+def test_rate_limiter_serves_waiters_in_arrival_order():
+    async def main():
+        limiter = RateLimiter(rate=50, burst=1)
+        order = []
+
+        async def caller(index):
+            await limiter.acquire()
+            order.append(index)
+
+        callers = []
+        for index in range(8):
+            callers.append(asyncio.ensure_future(caller(index)))
+            await asyncio.sleep(0)
+        await asyncio.gather(*callers)
+        return order
+
+    assert asyncio.run(main()) == list(range(8))
+
+
+def test_concurrency_limiter_caps_in_flight():
+    async def main():
+        limiter = ConcurrencyLimiter(max_in_flight=3)
+        peak = 0
+
+        async def call():
+            nonlocal peak
+            async with limiter:
+                peak = max(peak, limiter.in_flight)
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(*(call() for _ in range(20)))
+        return peak, limiter.in_flight
+
+    assert asyncio.run(main()) == (3, 0)
+
+
+def test_engine_wide_cap_spans_agents():
+    engine = BlenderEngine(max_concurrency=4)
+    agents = [PeakAgent("a"), PeakAgent("b")]
+    for agent in agents:
+        engine.register_agent(agent)
+    peak = 0
+
+    async def main():
+        nonlocal peak
+        run = asyncio.ensure_future(engine.execute_workflow(_tasks(40), parallel=True))
+        while not run.done():
+            peak = max(peak, sum(agent.in_flight for agent in agents))
+            await asyncio.sleep(0.001)
+        return run.result()
+
+    results = asyncio.run(main())
+    assert all(r.status == TaskStatus.COMPLETED for r in results)
+    assert peak == 4
+    assert all(agent.calls for agent in agents)
+
+
+def test_per_agent_cap_and_rate_limit():
+    engine = BlenderEngine()
+    capped = PeakAgent("capped")
+    engine.register_agent(capped, max_in_flight=2)
+    results = asyncio.run(engine.execute_workflow(_tasks(10), parallel=True))
+    assert all(r.status == TaskStatus.COMPLETED for r in results)
+    assert capped.peak == 2
+
+    engine = BlenderEngine()
+    rated = PeakAgent("rated", delay=0)
+    engine.register_agent(rated, rate_limit=20, burst=1)
+    asyncio.run(engine.execute_workflow(_tasks(6), parallel=True))
+    assert rated.calls[-1] - rated.calls[0] >= 0.2
@@ -0,0 +1,122 @@
+"""Tests for dependency-graph workflow scheduling."""
+
+import asyncio
+import time
+
+import pytest
+
+from blender_engine.engine import BlenderEngine
+from blender_engine.tasks import TaskContext, TaskResult, TaskStatus, TaskType
+
+
+class TimingAgent:
+    """Records when each task starts and ends; fails tasks asked to."""
+
+    name = "timing"
+    capabilities = list(TaskType)
+
+    def __init__(self, delay=0.05):
+        self.delay = delay
+        self.started = {}
+        self.finished = {}
+
+    async def execute(self, context: TaskContext) -> TaskResult:
+        self.started[context.task_id] = time.monotonic()
+        await asyncio.sleep(self.delay)
+        self.finished[context.task_id] = time.monotonic()
+        if context.input_data.get("fail"):
+            raise RuntimeError("requested failure")
+        return TaskResult(
+            task_id=context.task_id,
+            status=TaskStatus.COMPLETED,
+            output={"id": context.task_id, "upstream": sorted(context.upstream_outputs)}
+        )
+
+
+def _task(task_id, *depends_on, **input_data):
+    return TaskContext(task_id, TaskType.ANALYSIS, input_data, depends_on=list(depends_on))
+
+
+def _run(tasks, delay=0.05):
+    engine = BlenderEngine()
+    agent = TimingAgent(delay)
+    engine.register_agent(agent)
+    results = asyncio.run(engine.execute_workflow(tasks))
+    return agent, results
+
+
+def test_diamond_runs_in_dependency_order():
+    tasks = [_task("d", "b", "c"), _task("b", "a"), _task("c", "a"), _task("a")]
+    agent, results = _run(tasks)
+
+    assert [r.task_id for r in results] == ["d", "b", "c", "a"]
+    assert all(r.status == TaskStatus.COMPLETED for r in results)
+    assert agent.started["b"] >= agent.finished["a"]
+    assert agent.started["c"] >= agent.finished["a"]
+    assert agent.started["d"] >= max(agent.finished["b"], agent.finished["c"])
+    assert results[0].output["upstream"] == ["b", "c"]
+
+
+def test_independent_branches_run_in_parallel():
+    tasks = [_task(f"root{i}") for i in range(5)]
+    tasks += [_task(f"leaf{i}", f"root{i}") for i in range(5)]
+    start = time.monotonic()
+    agent, results = _run(tasks, delay=0.1)
+    elapsed = time.monotonic() - start
+
+    assert all(r.status == TaskStatus.COMPLETED for r in results)
+    # Two levels of 0.1 s each, not ten tasks one after another
+    assert elapsed < 0.5
+    assert max(agent.started[f"root{i}"] for i in range(5)) < min(agent.finished.values())
+
+
+def test_failure_cancels_only_downstream_tasks():
+    tasks = [
+        _task("a", fail=True), _task("b", "a"), _task("c", "b"),
+        _task("x"), _task("y", "x"),
+    ]
+    agent, results = _run(tasks)
+    status = {r.task_id: r.status for r in results}
+
+    assert status == {
+        "a": TaskStatus.FAILED, "b": TaskStatus.CANCELLED, "c": TaskStatus.CANCELLED,
+        "x": TaskStatus.COMPLETED, "y": TaskStatus.COMPLETED,
+    }
+    assert "b" not in agent.started and "c" not in agent.started
+
+
+@pytest.mark.parametrize("tasks, message", [
+    ([_task("a", "c"), _task("b", "a"), _task("c", "b"), _task("d")], "cycle"),
+    ([_task("a", "a")], "cycle"),
+    ([_task("a", "missing")], "unknown task 'missing'"),
+    ([_task("a"), _task("a"), _task("b", "a")], "Duplicate task ID"),
+])
+def test_invalid_graphs_are_rejected_before_running(tasks, message):
+    engine = BlenderEngine()
+    agent = TimingAgent()
+    engine.register_agent(agent)
+
+    with pytest.raises(ValueError, match=message):
+        asyncio.run(engine.execute_workflow(tasks))
+    assert agent.started == {}
+
+
+def test_streamed_dag_waits_for_late_dependencies():
+    engine = BlenderEngine()
+    engine.register_agent(TimingAgent(delay=0.01))
+
+    async def arriving():
+        yield _task("child", "parent")
+        await asyncio.sleep(0.05)
+        yield _task("parent")
+        yield _task("orphan", "never")
+
+    async def main():
+        return [r async for r in engine.as_completed(arriving(), mode="dag")]
+
+    results = asyncio.run(main())
+    assert [r.task_id for r in results] == ["parent", "child", "orphan"]
+    assert results[1].status == TaskStatus.COMPLETED
+    assert results[1].output["upstream"] == ["parent"]
+    assert results[2].status == TaskStatus.FAILED
+    assert "never" in results[2].error
@@ -0,0 +1,56 @@
+"""Tests for BlenderEngine workflow execution."""
+
+import asyncio
+from datetime import datetime, timedelta
+
+from blender_engine.compact import CompactTaskContext
+from blender_engine.engine import BlenderEngine
+from blender_engine.tasks import TaskContext, TaskResult, TaskStatus, TaskType
+
+
+class EchoAgent:
+    name = "echo"
+    capabilities = list(TaskType)
+
+    async def execute(self, context: TaskContext) -> TaskResult:
+        await asyncio.sleep(0.01)
+        return TaskResult(task_id=context.task_id, status=TaskStatus.COMPLETED, output=context.input_data)
+
+
+def test_workflow_deadline_does_not_modify_caller_contexts():
+    engine = BlenderEngine()
+    engine.register_agent(EchoAgent())
+    tasks = [TaskContext(f"t{i}", TaskType.ANALYSIS, {"i": i}) for i in range(3)]
+
+    results = asyncio.run(engine.execute_workflow(tasks, timeout=0.5))
+    assert [r.status for r in results] == [TaskStatus.COMPLETED] * 3
+    assert all(ctx.deadline is None for ctx in tasks)
+
+    # Run again after the first run's deadline has passed
+    asyncio.run(asyncio.sleep(0.6))
+    results = asyncio.run(engine.execute_workflow(tasks))
+    assert [r.status for r in results] == [TaskStatus.COMPLETED] * 3
+
+
+def test_workflow_deadline_keeps_earlier_task_deadline():
+    engine = BlenderEngine()
+    engine.register_agent(EchoAgent())
+    expired = datetime.now() - timedelta(seconds=1)
+    tasks = [TaskContext("late", TaskType.ANALYSIS, {}, deadline=expired)]
+
+    results = asyncio.run(engine.execute_workflow(tasks, parallel=True, timeout=10))
+    assert results[0].status == TaskStatus.CANCELLED
+    assert tasks[0].deadline == expired
+
+
+def test_workflow_deadline_with_compact_contexts():
+    engine = BlenderEngine()
+    engine.register_agent(EchoAgent())
+    tasks = [
+        CompactTaskContext("a", TaskType.ANALYSIS, {"i": 0}),
+        CompactTaskContext("b", TaskType.ANALYSIS, {"i": 1}, depends_on=["a"]),
+    ]
+
+    results = asyncio.run(engine.execute_workflow(tasks, timeout=5))
+    assert [r.status for r in results] == [TaskStatus.COMPLETED] * 2
+    assert all(ctx.deadline is None for ctx in tasks)
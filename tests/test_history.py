@@ -0,0 +1,113 @@
+"""Tests for bounded, indexed task history."""
+
+import asyncio
+import time
+
+from blender_engine.compact import CompactTaskResult
+from blender_engine.engine import BlenderEngine
+from blender_engine.history import TaskHistory
+from blender_engine.tasks import TaskContext, TaskResult, TaskStatus, TaskType
+
+
+def _result(task_id, status=TaskStatus.COMPLETED):
+    return TaskResult(task_id=task_id, status=status, output={"id": task_id})
+
+
+def test_max_entries_keeps_the_newest_results():
+    history = TaskHistory(max_entries=3)
+    for i in range(10):
+        history.append(_result(f"t{i}"))
+
+    assert len(history) == 3
+    assert [r.task_id for r in history] == ["t7", "t8", "t9"]
+    assert history.get("t0") == []
+    assert history.get("t9")[0].output == {"id": "t9"}
+    assert history.evicted == 7
+
+
+def test_repeated_task_ids_are_indexed_oldest_first():
+    history = TaskHistory(max_entries=3)
+    history.append(_result("a", TaskStatus.FAILED))
+    history.append(_result("a"))
+    history.append(_result("b"))
+    assert [r.status for r in history.get("a")] == [TaskStatus.FAILED, TaskStatus.COMPLETED]
+
+    history.append(_result("c"))
+    assert [r.status for r in history.get("a")] == [TaskStatus.COMPLETED]
+
+
+def test_max_age_prunes_old_results():
+    history = TaskHistory(max_age=0.05)
+    history.append(_result("old"))
+    time.sleep(0.08)
+    history.append(_result("new"))
+
+    assert [r.task_id for r in history] == ["new"]
+    assert history.get("old") == []
+
+
+def test_status_counts_include_evicted_results():
+    history = TaskHistory(max_entries=2)
+    statuses = [TaskStatus.COMPLETED] * 3 + [TaskStatus.FAILED] * 2 + [TaskStatus.CANCELLED]
+    for i, status in enumerate(statuses):
+        history.append(_result(f"t{i}", status))
+
+    assert history.count(TaskStatus.COMPLETED) == 3
+    assert history.count(TaskStatus.FAILED) == 2
+    assert history.count(TaskStatus.CANCELLED) == 1
+    assert len(history) == 2
+
+
+def test_evicted_results_spill_to_disk(tmp_path):
+    history = TaskHistory(max_entries=2, spill_path=tmp_path / "spill.jsonl")
+    for i in range(5):
+        history.append(_result(f"t{i}", TaskStatus.FAILED if i % 2 else TaskStatus.COMPLETED))
+
+    assert [r.task_id for r in history.query_spill()] == ["t0", "t1", "t2"]
+    assert [r.task_id for r in history.query_spill(status=TaskStatus.FAILED)] == ["t1"]
+    assert [r.output for r in history.query_spill(task_id="t2")] == [{"id": "t2"}]
+    history.close()
+
+
+def test_compact_history_stores_slotted_results():
+    history = TaskHistory(compact=True)
+    history.append(_result("a"))
+    stored = history.get("a")[0]
+    assert isinstance(stored, CompactTaskResult)
+    assert stored.output == {"id": "a"}
+
+
+class FailingOddAgent:
+    name = "odd"
+    capabilities = list(TaskType)
+
+    async def execute(self, context: TaskContext) -> TaskResult:
+        if context.input_data["i"] % 2:
+            raise RuntimeError("odd")
+        return TaskResult(task_id=context.task_id, status=TaskStatus.COMPLETED)
+
+
+def test_engine_status_counts_come_from_history():
+    engine = BlenderEngine(history=TaskHistory(max_entries=4))
+    engine.register_agent(FailingOddAgent())
+    tasks = [TaskContext(f"t{i}", TaskType.ANALYSIS, {"i": i}) for i in range(10)]
+    asyncio.run(engine.execute_workflow(tasks, parallel=True))
+
+    status = engine.get_engine_status()
+    assert status["completed_tasks"] == 5
+    assert status["failed_tasks"] == 5
+    assert len(engine.task_history) == 4
+
+
+def test_engine_shutdown_closes_the_spill_log(tmp_path):
+    history = TaskHistory(max_entries=1, spill_path=tmp_path / "spill.jsonl")
+    engine = BlenderEngine(history=history)
+    engine.register_agent(FailingOddAgent())
+    tasks = [TaskContext(f"t{i}", TaskType.ANALYSIS, {"i": 0}) for i in range(3)]
+    asyncio.run(engine.execute_workflow(tasks))
+    spill_file = history._spill_file
+    assert spill_file is not None
+
+    engine.shutdown()
+    assert spill_file.closed and history._spill_file is None
+    assert [r.task_id for r in history.query_spill()] == ["t0", "t1"]
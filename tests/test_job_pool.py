@@ -0,0 +1,95 @@
+"""Tests for BlenderJobPool against a stub Blender executable."""
+
+import asyncio
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from blender_engine.blender_tool import BlenderJobPool
+
+REPORT = "import bpy, json, os; print(json.dumps({'threads': bpy.app.threads, 'cpus': sorted(os.sched_getaffinity(0))}))"
+
+
+def test_pool_runs_jobs_by_priority(stub_blender):
+    pool = BlenderJobPool(stub_blender, slots=1, threads=1)
+    for job_id, priority in [('low', 0), ('high', 5), ('mid', 2), ('high2', 5)]:
+        pool.submit("print('ok')", priority=priority, job_id=job_id)
+    jobs = pool.run_sync()
+    assert [job.job_id for job in jobs] == ['high', 'high2', 'mid', 'low']
+    assert all(job.ok for job in jobs)
+
+
+def test_pool_counts_failed_and_timed_out_jobs(stub_blender):
+    pool = BlenderJobPool(stub_blender, slots=2, threads=1)
+    pool.submit("print('ok')", job_id='good')
+    pool.submit("raise ValueError('render failed')", job_id='bad')
+    pool.submit("import time; time.sleep(10)", timeout=0.3, job_id='slow')
+    jobs = {job.job_id: job for job in pool.run_sync()}
+    assert jobs['good'].ok
+    assert not jobs['bad'].ok and "render failed" in jobs['bad'].result.stderr
+    assert jobs['slow'].result.timed_out
+    stats = pool.stats()
+    assert (stats['finished'], stats['completed'], stats['failed']) == (3, 1, 2)
+    assert stats['jobs_per_minute'] > 0
+
+
+def test_pool_runs_slots_concurrently(stub_blender):
+    pool = BlenderJobPool(stub_blender, slots=4, threads=1)
+    for _ in range(4):
+        pool.submit("import time; time.sleep(0.5)")
+    jobs = pool.run_sync()
+    assert all(job.ok for job in jobs)
+    assert sorted(job.slot for job in jobs) == [0, 1, 2, 3]
+    assert pool.stats()['elapsed'] < 1.5
+
+
+@pytest.mark.skipif(not hasattr(os, 'sched_setaffinity'), reason="CPU pinning is Linux only")
+def test_pool_passes_threads_and_pins_cpus(stub_blender):
+    pool = BlenderJobPool(stub_blender, slots=2, threads=2)
+    for _ in range(2):
+        pool.submit(REPORT)
+    for job in pool.run_sync():
+        report = json.loads(job.result.stdout)
+        assert report['threads'] == 2
+        assert report['cpus'] == sorted(set(pool.slot_cpus[job.slot]))
+
+
+def test_pool_requeues_jobs_when_cancelled(stub_blender):
+    pool = BlenderJobPool(stub_blender, slots=1, threads=1)
+    first = pool.submit("import time; time.sleep(10)", priority=1, job_id='long')
+    pool.submit("print('ok')", job_id='short')
+
+    async def main():
+        task = asyncio.ensure_future(pool.run())
+        while first.started_at is None:
+            await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(main())
+    assert first.result is None and first.slot is None
+    assert pool.stats()['queued'] == 2
+
+    first.python_code = "print('ok')"
+    jobs = pool.run_sync()
+    assert [job.job_id for job in jobs] == ['long', 'short']
+
+
+def test_pool_cli_with_stub_blender(stub_blender, tmp_path):
+    spec = tmp_path / "jobs.json"
+    spec.write_text(json.dumps({"jobs": [
+        {"id": "a", "python": "print('a')", "priority": 1},
+        {"id": "b", "python": "raise SystemExit(2)"},
+    ]}))
+    tool = os.path.join(os.path.dirname(__file__), '..', 'blender_engine', 'blender_tool.py')
+    proc = subprocess.run(
+        [sys.executable, tool, 'pool', '--spec', str(spec), '--slots', '2', '--threads', '1',
+         '--blender', stub_blender],
+        capture_output=True, text=True, timeout=60
+    )
+    assert proc.returncode == 1
+    assert "Pool: 1/2 jobs completed" in proc.stdout
@@ -0,0 +1,127 @@
+"""Tests for adaptive concurrency limits under load-dependent latency."""
+
+import asyncio
+
+import pytest
+
+from blender_engine.engine import BlenderEngine
+from blender_engine.limits import AdaptiveLimiter, AIMDLimit, GradientLimit
+from blender_engine.tasks import TaskContext, TaskResult, TaskStatus, TaskType
+
+
+def _degraded_rtt(in_flight, capacity, base=0.01):
+    """Latency of a backend that slows down in proportion to its overload."""
+    return base * (1 + max(0, in_flight - capacity) / capacity)
+
+
+class LoadSensitiveAgent:
+    """Agent whose latency grows once more than ``capacity`` calls are in flight."""
+
+    name = "backend"
+    capabilities = list(TaskType)
+
+    def __init__(self, capacity, latency=0.01):
+        self.capacity = capacity
+        self.latency = latency
+        self.in_flight = 0
+
+    async def execute(self, context: TaskContext) -> TaskResult:
+        self.in_flight += 1
+        try:
+            await asyncio.sleep(_degraded_rtt(self.in_flight, self.capacity, self.latency))
+        finally:
+            self.in_flight -= 1
+        return TaskResult(task_id=context.task_id, status=TaskStatus.COMPLETED)
+
+
+ALGORITHMS = {
+    "aimd": lambda: AIMDLimit(initial=10, max_limit=100, timeout=0.02),
+    "gradient": lambda: GradientLimit(initial=10, max_limit=100),
+}
+
+
+@pytest.mark.parametrize("name", sorted(ALGORITHMS))
+def test_algorithm_shrinks_under_degradation_and_recovers(name):
+    algorithm = ALGORITHMS[name]()
+    observed = []
+    for capacity, samples in [(100, 400), (10, 400), (100, 800)]:
+        for _ in range(samples):
+            algorithm.update(_degraded_rtt(algorithm.limit, capacity), algorithm.limit, False)
+        observed.append(algorithm.limit)
+    healthy, degraded, recovered = observed
+    assert healthy == 100
+    assert degraded < healthy
+    assert recovered == 100
+
+
+@pytest.mark.parametrize("name", sorted(ALGORITHMS))
+def test_algorithm_backs_off_on_errors(name):
+    algorithm = ALGORITHMS[name]()
+    for _ in range(20):
+        algorithm.update(0.01, algorithm.limit, dropped=True)
+    assert algorithm.limit == algorithm.min_limit
+
+
+@pytest.mark.parametrize("name", sorted(ALGORITHMS))
+def test_engine_limit_follows_backend_capacity(name):
+    async def main():
+        engine = BlenderEngine()
+        agent = LoadSensitiveAgent(capacity=40)
+        engine.register_agent(agent, adaptive_concurrency=ALGORITHMS[name]())
+
+        async def burst(tag, count):
+            tasks = [TaskContext(f"{tag}{i}", TaskType.ANALYSIS, {"tag": tag, "i": i}) for i in range(count)]
+            results = await engine.execute_workflow(tasks, parallel=True)
+            assert all(r.status == TaskStatus.COMPLETED for r in results)
+            return engine.get_engine_status()["concurrency_limits"]["backend"]["limit"]
+
+        healthy = await burst("a", 1500)
+        agent.capacity = 4
+        degraded = await burst("b", 600)
+        agent.capacity = 40
+        recovered = await burst("c", 1500)
+        return healthy, degraded, recovered
+
+    healthy, degraded, recovered = asyncio.run(main())
+    assert degraded * 2 <= healthy
+    assert recovered >= degraded * 2
+
+
+def test_engine_queueing_does_not_shrink_agent_limit():
+    async def main():
+        engine = BlenderEngine(max_concurrency=4)
+        # Constant 10 ms latency: the agent never degrades
+        engine.register_agent(
+            LoadSensitiveAgent(capacity=1000),
+            adaptive_concurrency=AIMDLimit(initial=20, timeout=0.03)
+        )
+        tasks = [TaskContext(f"t{i}", TaskType.ANALYSIS, {"i": i}) for i in range(200)]
+        results = await engine.execute_workflow(tasks, parallel=True)
+        assert all(r.status == TaskStatus.COMPLETED for r in results)
+        return engine.get_engine_status()["concurrency_limits"]["backend"]
+
+    limits = asyncio.run(main())
+    assert limits["limit"] >= 20
+    assert limits["dropped"] == 0
+
+
+def test_adaptive_limiter_records_exceptions_as_drops():
+    limiter = AdaptiveLimiter(AIMDLimit(initial=10))
+
+    async def main():
+        with pytest.raises(RuntimeError):
+            async with limiter:
+                raise RuntimeError("boom")
+
+    asyncio.run(main())
+    assert limiter.dropped == 1
+    assert limiter.algorithm.limit == 9
+    assert limiter.in_flight == 0
+
+
+def test_gradient_accepts_zero_rtt():
+    algorithm = GradientLimit(initial=10, max_limit=100)
+    algorithm.update(0.01, 10, False)
+    for _ in range(5):
+        algorithm.update(0.0, 10, False)
+    assert 10 <= algorithm.limit <= 100
@@ -0,0 +1,136 @@
+"""Tests for structured event logging and per-task sampling."""
+
+import asyncio
+import io
+import json
+import logging
+
+import pytest
+
+from blender_engine.engine import BlenderEngine
+from blender_engine.log import (
+    ROOT_LOGGER_NAME,
+    EventLogger,
+    StructuredFormatter,
+    configure_logging,
+    set_task_sample_rate,
+    shutdown_logging,
+)
+from blender_engine.tasks import TaskContext, TaskResult, TaskStatus, TaskType
+
+
+@pytest.fixture(autouse=True)
+def reset_logging():
+    yield
+    shutdown_logging()
+    package_logger = logging.getLogger(ROOT_LOGGER_NAME)
+    for handler in list(package_logger.handlers):
+        if not isinstance(handler, logging.NullHandler):
+            package_logger.removeHandler(handler)
+    package_logger.setLevel(logging.NOTSET)
+    package_logger.propagate = True
+    set_task_sample_rate(1.0)
+
+
+class ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+def _event_logger(name, level=logging.DEBUG, rate=1.0):
+    logger = logging.getLogger(f"{ROOT_LOGGER_NAME}.tests.{name}")
+    logger.setLevel(level)
+    logger.propagate = False
+    handler = ListHandler()
+    logger.handlers = [handler]
+    return EventLogger(logger, task_sample_rate=rate), handler
+
+
+class EchoAgent:
+    name = "echo"
+    capabilities = list(TaskType)
+
+    async def execute(self, context: TaskContext) -> TaskResult:
+        return TaskResult(task_id=context.task_id, status=TaskStatus.COMPLETED)
+
+
+def test_engine_events_are_written_as_json_lines():
+    stream = io.StringIO()
+    configure_logging(stream=stream, json_output=True, async_sink=False)
+    engine = BlenderEngine()
+    engine.register_agent(EchoAgent())
+    asyncio.run(engine.execute_task(TaskContext("t1", TaskType.ANALYSIS, {})))
+
+    records = [json.loads(line) for line in stream.getvalue().splitlines()]
+    events = {record["event"]: record for record in records}
+    assert {"agent.registered", "task.started", "task.completed"} <= set(events)
+    completed = events["task.completed"]
+    assert completed["task_id"] == "t1"
+    assert completed["agent"] == "echo"
+    assert completed["level"] == "INFO"
+    assert completed["logger"] == "blender_engine.engine"
+    assert completed["message"].startswith("Task t1 completed in")
+
+
+def test_async_sink_flushes_on_shutdown():
+    stream = io.StringIO()
+    configure_logging(stream=stream, async_sink=True)
+    EventLogger(logging.getLogger(f"{ROOT_LOGGER_NAME}.tests.sink")).info(
+        "sink.test", "hello %s", "world", answer=42
+    )
+    shutdown_logging()
+    assert "hello world answer=42" in stream.getvalue()
+
+
+def test_task_sampling_keeps_all_or_none_of_a_task_and_every_warning():
+    events, handler = _event_logger("sampling", rate=0.5)
+    task_ids = [f"task-{i}" for i in range(400)]
+    for task_id in task_ids:
+        events.task(logging.INFO, "task.started", task_id, "started")
+        events.task(logging.INFO, "task.completed", task_id, "completed")
+        events.task(logging.WARNING, "task.retry", task_id, "retry")
+
+    by_task = {}
+    for record in handler.records:
+        by_task.setdefault(record.fields["task_id"], []).append(record.event)
+    sampled = [task_id for task_id, names in by_task.items() if "task.started" in names]
+    assert all(by_task[task_id] == ["task.started", "task.completed", "task.retry"] for task_id in sampled)
+    assert all(names == ["task.retry"] for task_id, names in by_task.items() if task_id not in sampled)
+    assert len(by_task) == 400
+    assert 120 < len(sampled) < 280
+
+
+def test_disabled_levels_skip_formatting():
+    events, handler = _event_logger("lazy", level=logging.WARNING)
+    formatted = []
+
+    class Expensive:
+        def __str__(self):
+            formatted.append(True)
+            return "expensive"
+
+    events.info("lazy.info", "value %s", Expensive())
+    events.task(logging.DEBUG, "lazy.task", "t", "value %s", Expensive())
+    assert handler.records == [] and formatted == []
+
+    events.warning("lazy.warning", "value %s", Expensive(), size=3)
+    record = handler.records[0]
+    assert record.getMessage() == "value expensive"
+    assert record.event == "lazy.warning" and record.fields == {"size": 3}
+
+
+def test_text_formatter_appends_fields():
+    events, handler = _event_logger("text")
+    events.info("text.event", "done", count=2, name="x")
+    text = StructuredFormatter().format(handler.records[0])
+    assert text.endswith("done count=2 name=x")
+
+
+def test_sample_rate_is_validated():
+    events, _ = _event_logger("validate")
+    with pytest.raises(ValueError):
+        events.task_sample_rate = 1.5
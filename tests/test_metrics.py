@@ -0,0 +1,116 @@
+"""Tests for engine metrics and tracing spans."""
+
+import asyncio
+import json
+
+import pytest
+
+from blender_engine.engine import BlenderEngine
+from blender_engine.metrics import Histogram, MetricsRegistry, Tracer
+from blender_engine.tasks import TaskContext, TaskResult, TaskStatus, TaskType
+
+
+class OddFailAgent:
+    name = "odd"
+    capabilities = list(TaskType)
+
+    async def execute(self, context: TaskContext) -> TaskResult:
+        await asyncio.sleep(0.01)
+        if context.input_data["i"] % 2:
+            raise RuntimeError("odd")
+        return TaskResult(task_id=context.task_id, status=TaskStatus.COMPLETED)
+
+
+def _run(count=6):
+    metrics = MetricsRegistry()
+    tracer = Tracer()
+    engine = BlenderEngine(metrics=metrics, tracer=tracer)
+    engine.register_agent(OddFailAgent())
+    tasks = [TaskContext(f"t{i}", TaskType.ANALYSIS, {"i": i}) for i in range(count)]
+    asyncio.run(engine.execute_workflow(tasks, parallel=True))
+    return engine, metrics, tracer
+
+
+def test_engine_counts_tasks_errors_and_latency():
+    engine, metrics, _ = _run()
+
+    tasks_total = metrics.counter("blender_engine_tasks_total")
+    assert tasks_total.value(status="completed") == 3
+    assert tasks_total.value(status="failed") == 3
+    assert metrics.counter("blender_engine_agent_errors_total").value(agent="odd") == 3
+
+    latency = engine.get_engine_status()["latency"]["odd"]
+    assert latency["count"] == 6
+    assert 0.005 < latency["p50"] < 0.1
+
+    text = metrics.render_prometheus()
+    assert "# TYPE blender_engine_tasks_total counter" in text
+    assert 'blender_engine_tasks_total{status="failed"} 3' in text
+    assert 'blender_engine_agent_latency_seconds_count{agent="odd"} 6' in text
+
+
+def test_task_spans_nest_under_one_trace_per_task():
+    _, _, tracer = _run(count=2)
+    spans = tracer.spans()
+    roots = {span.attributes["task_id"]: span for span in spans if span.name == "task"}
+    assert set(roots) == {"t0", "t1"}
+    assert roots["t0"].trace_id != roots["t1"].trace_id
+
+    for span in spans:
+        if span.name == "task":
+            continue
+        root = roots[span.attributes["task_id"]]
+        assert span.trace_id == root.trace_id
+        assert span.duration <= root.duration
+    names = {span.name for span in spans if span.attributes["task_id"] == "t0"}
+    assert {"task", "agent_selection", "agent_execution", "result_storage"} <= names
+    execution = next(s for s in spans if s.name == "agent_execution" and s.attributes["task_id"] == "t0")
+    assert execution.parent_id == roots["t0"].span_id
+    assert execution.duration >= 0.005
+
+
+def test_queue_wait_is_recorded_for_submitted_tasks():
+    metrics = MetricsRegistry()
+    tracer = Tracer()
+    engine = BlenderEngine(metrics=metrics, tracer=tracer)
+    engine.register_agent(OddFailAgent())
+
+    async def main():
+        for i in range(3):
+            engine.submit(TaskContext(f"q{i}", TaskType.ANALYSIS, {"i": 0}))
+        engine.start_workers(1)
+        await engine.stop_workers(drain=True)
+
+    asyncio.run(main())
+    assert [s.attributes["task_id"] for s in tracer.spans() if s.name == "queue_wait"] == ["q0", "q1", "q2"]
+    assert metrics.histogram("blender_engine_queue_wait_seconds").summary()["count"] == 3
+
+
+def test_tracer_exports_otlp_json_lines(tmp_path):
+    _, _, tracer = _run(count=2)
+    path = tmp_path / "spans.jsonl"
+    count = tracer.export(path)
+
+    assert count > 0 and tracer.spans() == []
+    document = json.loads(path.read_text().splitlines()[0])
+    resource = document["resourceSpans"][0]
+    assert resource["resource"]["attributes"][0]["value"]["stringValue"] == "blender-engine"
+    spans = resource["scopeSpans"][0]["spans"]
+    assert len(spans) == count
+    status = {
+        attribute["value"]["stringValue"]: span["status"]["code"]
+        for span in spans if span["name"] == "agent_execution"
+        for attribute in span["attributes"] if attribute["key"] == "task_id"
+    }
+    # t1's agent raised, so its execution span is marked as an error
+    assert status == {"t0": 1, "t1": 2}
+    assert all(int(s["endTimeUnixNano"]) >= int(s["startTimeUnixNano"]) for s in spans)
+
+
+def test_histogram_quantiles_interpolate_within_buckets():
+    histogram = Histogram("h", buckets=(0.1, 0.2, 0.5))
+    for value in (0.05, 0.15, 0.15, 0.3):
+        histogram.observe(value)
+    assert histogram.quantile(0.5) == pytest.approx(0.15)
+    assert histogram.summary()["count"] == 4
+    assert histogram.quantile(0.5, agent="missing") is None
@@ -0,0 +1,55 @@
+"""Tests for compiled pipelines."""
+
+import asyncio
+
+import pytest
+
+from blender_engine.engine import BlenderEngine, ExampleAgent, PipelineBuilder
+from blender_engine.tasks import TaskStatus, TaskType
+
+
+def _engine():
+    engine = BlenderEngine()
+    engine.register_agent(ExampleAgent("coder", [TaskType.CODE_GENERATION]))
+    engine.register_agent(ExampleAgent("reviewer", [TaskType.CODE_REVIEW]))
+    return engine
+
+
+def test_compiled_pipeline_runs_repeatedly_with_fan_out():
+    engine = _engine()
+    pipeline = (PipelineBuilder(engine)
+                .for_each("files", TaskType.CODE_GENERATION, name="generate")
+                .add_task(TaskType.CODE_REVIEW, name="review", depends_on=["generate"])
+                .compile())
+    assert pipeline.edges == [("generate", "review")]
+    for files in (["a.py", "b.py"], ["c.py"]):
+        results = asyncio.run(pipeline.run({"files": files}, run_id="r"))
+        assert [r.task_id for r in results] == [f"r:generate[{i}]" for i in range(len(files))] + ["r:review"]
+        assert all(r.status == TaskStatus.COMPLETED for r in results)
+
+
+def test_compile_rejects_invalid_plans():
+    engine = _engine()
+    with pytest.raises(ValueError, match="cycle"):
+        (PipelineBuilder(engine)
+         .add_task(TaskType.CODE_GENERATION, name="a", depends_on=["b"])
+         .add_task(TaskType.CODE_REVIEW, name="b", depends_on=["a"])
+         .compile())
+    with pytest.raises(ValueError, match="no agent available"):
+        PipelineBuilder(engine).add_task(TaskType.DOCUMENTATION).compile()
+
+
+def test_run_fails_when_compiled_agents_are_gone():
+    engine = _engine()
+    pipeline = PipelineBuilder(engine).add_task(TaskType.CODE_REVIEW, name="review").compile()
+    assert pipeline.stages[0].candidates == ("reviewer",)
+    engine.unregister_agent("reviewer")
+    with pytest.raises(ValueError, match="no longer registered"):
+        asyncio.run(pipeline.run())
+
+    # A replacement agent needs a recompile
+    engine.register_agent(ExampleAgent("reviewer-2", [TaskType.CODE_REVIEW]))
+    with pytest.raises(ValueError):
+        asyncio.run(pipeline.run())
+    recompiled = PipelineBuilder(engine).add_task(TaskType.CODE_REVIEW, name="review").compile()
+    assert asyncio.run(recompiled.run())[0].status == TaskStatus.COMPLETED
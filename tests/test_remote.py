@@ -0,0 +1,149 @@
+"""Tests for remote agent workers, using several local worker processes."""
+
+import asyncio
+import os
+import subprocess
+import sys
+
+import pytest
+
+from blender_engine.engine import BlenderEngine
+from blender_engine.remote import AgentWorker, WorkerClient, register_remote_agents
+from blender_engine.retry import RetryPolicy
+from blender_engine.tasks import TaskContext, TaskStatus, TaskType
+
+from remote_agents import PidAgent
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture
+def workers():
+    """Start three worker processes on free ports; yield (process, address) pairs."""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([ROOT, os.path.join(ROOT, "tests")]))
+    started = []
+    try:
+        for _ in range(3):
+            process = subprocess.Popen(
+                [sys.executable, "-m", "blender_engine.remote",
+                 "--listen", "tcp://127.0.0.1:0", "--agent", "remote_agents:agents"],
+                stdout=subprocess.PIPE, text=True, env=env, cwd=ROOT
+            )
+            line = process.stdout.readline()
+            assert line.startswith("Worker listening on "), line
+            started.append((process, line.split()[-1]))
+        yield started
+    finally:
+        for process, _ in started:
+            process.kill()
+            process.wait()
+
+
+def _workflow(count, tag="t"):
+    return [TaskContext(f"{tag}{i}", TaskType.ANALYSIS, {"i": i}) for i in range(count)]
+
+
+def test_tasks_spread_across_worker_processes(workers):
+    async def main():
+        engine = BlenderEngine()
+        clients = [await register_remote_agents(engine, address) for _, address in workers]
+        try:
+            assert sorted(engine.agents) == sorted(f"pid@{address}" for _, address in workers)
+            return await engine.execute_workflow(_workflow(60), parallel=True)
+        finally:
+            for client in clients:
+                await client.close()
+
+    results = asyncio.run(main())
+    assert all(r.status == TaskStatus.COMPLETED for r in results)
+    pids = {r.output["pid"] for r in results}
+    assert pids <= {process.pid for process, _ in workers}
+    assert len(pids) > 1
+
+
+def test_remote_dag_and_agent_errors(workers):
+    async def main():
+        engine = BlenderEngine()
+        client = await register_remote_agents(engine, workers[0][1])
+        try:
+            tasks = [
+                TaskContext("a", TaskType.ANALYSIS, {}),
+                TaskContext("b", TaskType.ANALYSIS, {}, depends_on=["a"]),
+                TaskContext("bad", TaskType.ANALYSIS, {"fail": True}),
+            ]
+            return await engine.execute_workflow(tasks)
+        finally:
+            await client.close()
+
+    a, b, bad = asyncio.run(main())
+    assert b.status == TaskStatus.COMPLETED and b.output["upstream"] == ["a"]
+    assert bad.status == TaskStatus.FAILED and "requested failure" in bad.error
+
+
+def test_failover_when_a_worker_dies(workers):
+    async def main():
+        engine = BlenderEngine(breaker_threshold=1, retry_policy=RetryPolicy(max_attempts=3, base_delay=0.01))
+        clients = [
+            await register_remote_agents(engine, address, heartbeat_interval=0.2)
+            for _, address in workers
+        ]
+        try:
+            first = await engine.execute_workflow(_workflow(30, "a"), parallel=True)
+            workers[0][0].kill()
+            workers[0][0].wait()
+            second = await engine.execute_workflow(_workflow(30, "b"), parallel=True)
+            return first, second, clients[0].healthy
+        finally:
+            for client in clients:
+                await client.close()
+
+    first, second, dead_healthy = asyncio.run(main())
+    assert all(r.status == TaskStatus.COMPLETED for r in first + second)
+    assert workers[0][0].pid not in {r.output["pid"] for r in second}
+    assert not dead_healthy
+
+
+def test_worker_close_with_open_client_connections():
+    async def main():
+        worker = AgentWorker([PidAgent()])
+        address = await worker.start()
+        client = WorkerClient(address, pool_size=2, heartbeat_interval=60)
+        await client.connect()
+        assert await client.ping()
+        await asyncio.wait_for(worker.close(), timeout=5)
+        assert not await client.ping()
+        await client.close()
+
+    asyncio.run(main())
+
+
+def test_saturated_pool_stays_healthy():
+    async def main():
+        worker = AgentWorker([PidAgent()])
+        address = await worker.start()
+        client = WorkerClient(address, pool_size=2, heartbeat_interval=0.05, heartbeat_timeout=0.3)
+        agent = (await client.connect())[0]
+        try:
+            busy = [
+                asyncio.ensure_future(agent.execute(
+                    TaskContext(f"long{i}", TaskType.ANALYSIS, {"sleep": 0.6})
+                ))
+                for i in range(4)
+            ]
+            health = []
+            for _ in range(10):
+                await asyncio.sleep(0.05)
+                health.append(client.healthy)
+            pinged = await client.ping()
+            extra = await agent.execute(TaskContext("extra", TaskType.ANALYSIS, {}))
+            results = await asyncio.gather(*busy)
+            return health, pinged, extra, results
+        finally:
+            await client.close()
+            await worker.close()
+
+    health, pinged, extra, results = asyncio.run(main())
+    assert all(health)
+    assert pinged
+    assert extra.status == TaskStatus.COMPLETED
+    assert all(r.status == TaskStatus.COMPLETED for r in results)
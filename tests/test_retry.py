@@ -0,0 +1,172 @@
+"""Tests for retry policies, backoff and circuit breakers."""
+
+import asyncio
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from blender_engine.engine import BlenderEngine
+from blender_engine.retry import CircuitBreaker, RetryPolicy
+from blender_engine.tasks import TaskContext, TaskResult, TaskStatus, TaskType
+
+
+class FlakyAgent:
+    """Raises ``error`` for the first ``failures`` calls, then succeeds."""
+
+    capabilities = [TaskType.ANALYSIS]
+
+    def __init__(self, name="flaky", failures=0, error=ConnectionError):
+        self.name = name
+        self.failures = failures
+        self.error = error
+        self.calls = 0
+
+    async def execute(self, context: TaskContext) -> TaskResult:
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise self.error(f"failure {self.calls}")
+        return TaskResult(task_id=context.task_id, status=TaskStatus.COMPLETED, output={"agent": self.name})
+
+
+def _policy(**kwargs):
+    kwargs.setdefault("base_delay", 0.01)
+    kwargs.setdefault("jitter", False)
+    return RetryPolicy(**kwargs)
+
+
+def _task(task_id="t", **kwargs):
+    return TaskContext(task_id, TaskType.ANALYSIS, {}, **kwargs)
+
+
+def test_backoff_grows_exponentially_up_to_the_cap():
+    policy = RetryPolicy(base_delay=0.1, multiplier=2.0, max_delay=0.5, jitter=False)
+    assert [policy.delay(attempt) for attempt in range(1, 6)] == pytest.approx([0.1, 0.2, 0.4, 0.5, 0.5])
+
+    jittered = RetryPolicy(base_delay=0.1, multiplier=2.0, max_delay=0.5)
+    assert all(0 <= jittered.delay(3) <= 0.4 for _ in range(100))
+
+
+def test_should_retry_respects_attempts_and_error_types():
+    policy = RetryPolicy(max_attempts=3, retry_on=(ConnectionError,))
+    assert policy.should_retry(1, ConnectionError())
+    assert policy.should_retry(2, ConnectionRefusedError())
+    assert not policy.should_retry(3, ConnectionError())
+    assert not policy.should_retry(1, ValueError())
+
+
+def test_retryable_failures_are_retried_until_success():
+    engine = BlenderEngine(retry_policy=_policy(max_attempts=3, retry_on=(ConnectionError,)))
+    agent = FlakyAgent(failures=2)
+    engine.register_agent(agent)
+
+    result = asyncio.run(engine.execute_task(_task()))
+    assert result.status == TaskStatus.COMPLETED
+    assert agent.calls == 3
+
+
+def test_non_retryable_failures_are_not_retried():
+    engine = BlenderEngine(retry_policy=_policy(max_attempts=3, retry_on=(ConnectionError,)))
+    agent = FlakyAgent(failures=1, error=ValueError)
+    engine.register_agent(agent)
+
+    result = asyncio.run(engine.execute_task(_task()))
+    assert result.status == TaskStatus.FAILED
+    assert "failure 1" in result.error
+    assert agent.calls == 1
+
+
+def test_retries_give_up_after_max_attempts():
+    engine = BlenderEngine()
+    agent = FlakyAgent(failures=10)
+    engine.register_agent(agent, retry_policy=_policy(max_attempts=4))
+
+    result = asyncio.run(engine.execute_task(_task()))
+    assert result.status == TaskStatus.FAILED
+    assert agent.calls == 4
+
+
+def test_retry_fails_over_to_another_agent():
+    engine = BlenderEngine(retry_policy=_policy(max_attempts=2))
+    broken = FlakyAgent("broken", failures=10)
+    healthy = FlakyAgent("healthy")
+    engine.register_agent(broken)
+    engine.register_agent(healthy)
+
+    results = asyncio.run(engine.execute_workflow([_task(f"t{i}") for i in range(6)], parallel=True))
+    assert all(r.status == TaskStatus.COMPLETED for r in results)
+    assert all(r.output["agent"] == "healthy" for r in results)
+
+
+def test_retry_is_skipped_when_backoff_would_pass_the_deadline():
+    engine = BlenderEngine(retry_policy=_policy(max_attempts=5, base_delay=0.5))
+    agent = FlakyAgent(failures=1)
+    engine.register_agent(agent)
+
+    start = time.monotonic()
+    result = asyncio.run(engine.execute_task(
+        _task(deadline=datetime.now() + timedelta(seconds=0.2))
+    ))
+    assert result.status == TaskStatus.FAILED
+    assert agent.calls == 1
+    assert time.monotonic() - start < 0.2
+
+
+def test_retry_within_the_deadline_succeeds():
+    engine = BlenderEngine(retry_policy=_policy(max_attempts=5, base_delay=0.01))
+    agent = FlakyAgent(failures=2)
+    engine.register_agent(agent)
+
+    result = asyncio.run(engine.execute_task(
+        _task(deadline=datetime.now() + timedelta(seconds=5))
+    ))
+    assert result.status == TaskStatus.COMPLETED
+    assert agent.calls == 3
+
+
+def test_breaker_opens_then_half_opens_after_cooldown():
+    breaker = CircuitBreaker(failure_threshold=3, recovery_timeout=0.05)
+    for _ in range(2):
+        breaker.on_dispatch()
+        breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+    breaker.on_dispatch()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.available()
+
+    time.sleep(0.06)
+    assert breaker.available()
+    breaker.on_dispatch()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    # Only one probe at a time
+    assert not breaker.available()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+
+    time.sleep(0.06)
+    breaker.on_dispatch()
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.failures == 0
+
+
+def test_engine_breaker_skips_agent_until_cooldown():
+    engine = BlenderEngine(breaker_threshold=2, breaker_recovery_timeout=0.1)
+    agent = FlakyAgent(failures=2)
+    engine.register_agent(agent)
+
+    async def main():
+        failed = [await engine.execute_task(_task(f"f{i}"), agent_name="flaky") for i in range(2)]
+        rejected = await engine.execute_task(_task("rejected"), agent_name="flaky")
+        await asyncio.sleep(0.12)
+        probe = await engine.execute_task(_task("probe"), agent_name="flaky")
+        return failed, rejected, probe
+
+    failed, rejected, probe = asyncio.run(main())
+    assert [r.status for r in failed] == [TaskStatus.FAILED] * 2
+    assert rejected.status == TaskStatus.FAILED
+    assert "Circuit open" in rejected.error
+    assert probe.status == TaskStatus.COMPLETED
+    # The rejected task never reached the agent
+    assert agent.calls == 3
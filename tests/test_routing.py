@@ -0,0 +1,102 @@
+"""Tests for the capability index and agent routing policies."""
+
+import asyncio
+from collections import Counter
+
+from blender_engine.engine import BlenderEngine
+from blender_engine.routing import (
+    AgentStats,
+    CapabilityIndex,
+    LatencyEWMAPolicy,
+    LeastOutstandingPolicy,
+    RoundRobinPolicy,
+)
+from blender_engine.tasks import TaskContext, TaskResult, TaskStatus, TaskType
+
+
+class SleepAgent:
+    def __init__(self, name, delay, capabilities=(TaskType.ANALYSIS,)):
+        self.name = name
+        self.delay = delay
+        self.capabilities = list(capabilities)
+
+    async def execute(self, context: TaskContext) -> TaskResult:
+        await asyncio.sleep(self.delay)
+        return TaskResult(task_id=context.task_id, status=TaskStatus.COMPLETED, output={"agent": self.name})
+
+
+def _stats(in_flight=0, latency=None):
+    stats = AgentStats()
+    stats.in_flight = in_flight
+    stats.latency_ewma = latency
+    return stats
+
+
+def test_capability_index_tracks_registration_and_removal():
+    index = CapabilityIndex()
+    index.add("a", [TaskType.ANALYSIS, TaskType.ANALYSIS])
+    index.add("b", [TaskType.ANALYSIS, TaskType.CODE_GENERATION])
+    assert index.candidates(TaskType.ANALYSIS) == ["a", "b"]
+    assert index.candidates(TaskType.CODE_GENERATION) == ["b"]
+
+    index.remove("b")
+    assert index.candidates(TaskType.ANALYSIS) == ["a"]
+    assert index.candidates(TaskType.CODE_GENERATION) == []
+
+
+def test_round_robin_cycles_regardless_of_load():
+    policy = RoundRobinPolicy()
+    stats = {"a": _stats(in_flight=100), "b": _stats(), "c": _stats()}
+    assert [policy.choose(["a", "b", "c"], stats) for _ in range(6)] == ["a", "b", "c"] * 2
+
+
+def test_least_outstanding_picks_least_loaded_and_spreads_ties():
+    policy = LeastOutstandingPolicy()
+    stats = {"a": _stats(in_flight=3), "b": _stats(in_flight=1), "c": _stats(in_flight=2)}
+    assert policy.choose(["a", "b", "c"], stats) == "b"
+
+    idle = {"a": _stats(), "b": _stats(), "c": _stats()}
+    assert {policy.choose(["a", "b", "c"], idle) for _ in range(3)} == {"a", "b", "c"}
+
+
+def test_latency_policy_prefers_untried_then_fastest_expected_completion():
+    policy = LatencyEWMAPolicy()
+    stats = {"fast": _stats(latency=0.01), "slow": _stats(latency=0.1), "new": _stats()}
+    assert policy.choose(["fast", "slow", "new"], stats) == "new"
+
+    stats["new"] = _stats(latency=0.05)
+    assert policy.choose(["fast", "slow", "new"], stats) == "fast"
+    # A long enough queue outweighs a fast agent's latency
+    stats["fast"].in_flight = 9
+    assert policy.choose(["fast", "slow", "new"], stats) == "new"
+
+
+def test_engine_routes_most_work_to_the_faster_agent():
+    engine = BlenderEngine()
+    engine.register_agent(SleepAgent("fast", 0.005))
+    engine.register_agent(SleepAgent("slow", 0.05))
+    tasks = [TaskContext(f"t{i}", TaskType.ANALYSIS, {"i": i}) for i in range(60)]
+
+    async def main():
+        results = []
+        # Waves of a few tasks, so latency estimates exist before most routing
+        for start in range(0, len(tasks), 4):
+            results += await engine.execute_workflow(tasks[start:start + 4], parallel=True)
+        return results
+
+    results = asyncio.run(main())
+    counts = Counter(r.output["agent"] for r in results)
+    assert counts["fast"] > counts["slow"] * 2
+
+
+def test_engine_routes_only_to_capable_registered_agents():
+    engine = BlenderEngine(routing_policy=RoundRobinPolicy())
+    engine.register_agent(SleepAgent("analysis", 0, [TaskType.ANALYSIS]))
+    engine.register_agent(SleepAgent("code", 0, [TaskType.CODE_GENERATION]))
+    engine.register_agent(SleepAgent("both", 0, [TaskType.ANALYSIS, TaskType.CODE_GENERATION]))
+    engine.unregister_agent("both")
+
+    tasks = [TaskContext(f"a{i}", TaskType.ANALYSIS, {}) for i in range(3)]
+    tasks += [TaskContext(f"c{i}", TaskType.CODE_GENERATION, {}) for i in range(3)]
+    results = asyncio.run(engine.execute_workflow(tasks, parallel=True))
+    assert [r.output["agent"] for r in results] == ["analysis"] * 3 + ["code"] * 3
@@ -0,0 +1,117 @@
+"""Tests for streaming workflow results with as_completed."""
+
+import asyncio
+import itertools
+
+import pytest
+
+from blender_engine.engine import BlenderEngine
+from blender_engine.tasks import TaskContext, TaskResult, TaskStatus, TaskType
+
+
+class DelayAgent:
+    """Sleeps for ``input_data["delay"]`` seconds; fails tasks asked to."""
+
+    name = "delay"
+    capabilities = list(TaskType)
+
+    def __init__(self):
+        self.started = []
+
+    async def execute(self, context: TaskContext) -> TaskResult:
+        self.started.append(context.task_id)
+        await asyncio.sleep(context.input_data.get("delay", 0.01))
+        if context.input_data.get("fail"):
+            raise RuntimeError("requested failure")
+        return TaskResult(task_id=context.task_id, status=TaskStatus.COMPLETED)
+
+
+def _engine():
+    engine = BlenderEngine()
+    agent = DelayAgent()
+    engine.register_agent(agent)
+    return engine, agent
+
+
+def _task(task_id, **input_data):
+    return TaskContext(task_id, TaskType.ANALYSIS, input_data)
+
+
+def _collect(engine, tasks, **kwargs):
+    async def main():
+        return [r async for r in engine.as_completed(tasks, **kwargs)]
+    return asyncio.run(main())
+
+
+def test_parallel_results_arrive_in_completion_order():
+    engine, _ = _engine()
+    tasks = [_task("slow", delay=0.15), _task("medium", delay=0.08), _task("fast", delay=0.01)]
+    assert [r.task_id for r in _collect(engine, tasks)] == ["fast", "medium", "slow"]
+
+
+def test_async_input_is_consumed_as_it_arrives():
+    engine, _ = _engine()
+    first_seen_at = None
+
+    async def arriving():
+        yield _task("early", delay=0.01)
+        await asyncio.sleep(0.1)
+        yield _task("late", delay=0.01)
+
+    async def main():
+        nonlocal first_seen_at
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        ids = []
+        async for result in engine.as_completed(arriving()):
+            if first_seen_at is None:
+                first_seen_at = loop.time() - start
+            ids.append(result.task_id)
+        return ids
+
+    assert asyncio.run(main()) == ["early", "late"]
+    # The first result did not wait for the input to finish
+    assert first_seen_at < 0.08
+
+
+def test_max_pending_bounds_tasks_pulled_from_the_input():
+    engine, agent = _engine()
+    pulled = 0
+
+    def endless():
+        nonlocal pulled
+        for i in itertools.count():
+            pulled += 1
+            yield _task(f"t{i}", delay=0.005)
+
+    async def main():
+        yielded = 0
+        most_outstanding = 0
+        async for _ in engine.as_completed(endless(), max_pending=3):
+            yielded += 1
+            most_outstanding = max(most_outstanding, pulled - yielded)
+            if yielded == 20:
+                break
+        return most_outstanding
+
+    assert asyncio.run(main()) <= 3
+    # Breaking out stopped pulling new work
+    assert pulled <= 23
+    assert len(agent.started) <= 23
+
+
+def test_sequential_mode_stops_after_first_failure():
+    engine, agent = _engine()
+    tasks = [_task("a"), _task("b", fail=True), _task("c")]
+    results = _collect(engine, tasks, mode="sequential")
+
+    assert [(r.task_id, r.status) for r in results] == [
+        ("a", TaskStatus.COMPLETED), ("b", TaskStatus.FAILED)
+    ]
+    assert agent.started == ["a", "b"]
+
+
+def test_unknown_mode_is_rejected():
+    engine, _ = _engine()
+    with pytest.raises(ValueError, match="Unknown workflow mode"):
+        _collect(engine, [_task("a")], mode="batched")
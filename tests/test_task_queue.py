@@ -0,0 +1,129 @@
+"""Tests for the priority task queue, its workers and SQLite persistence."""
+
+import asyncio
+
+from blender_engine.engine import BlenderEngine
+from blender_engine.task_queue import PriorityTaskQueue
+from blender_engine.tasks import TaskContext, TaskResult, TaskStatus, TaskType
+
+
+class RecordingAgent:
+    """Records the order in which tasks run."""
+
+    name = "recorder"
+    capabilities = list(TaskType)
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.ran = []
+
+    async def execute(self, context: TaskContext) -> TaskResult:
+        self.ran.append(context.task_id)
+        await asyncio.sleep(self.delay)
+        return TaskResult(task_id=context.task_id, status=TaskStatus.COMPLETED)
+
+
+def _task(task_id):
+    return TaskContext(task_id, TaskType.ANALYSIS, {"id": task_id})
+
+
+def test_higher_priorities_run_first_and_ties_in_submit_order():
+    engine = BlenderEngine()
+    agent = RecordingAgent()
+    engine.register_agent(agent)
+
+    async def main():
+        for task_id, priority in [("low", 0), ("high", 5), ("mid1", 2), ("mid2", 2), ("top", 9)]:
+            engine.submit(_task(task_id), priority=priority)
+        engine.start_workers(1)
+        await engine.stop_workers(drain=True)
+
+    asyncio.run(main())
+    assert agent.ran == ["top", "high", "mid1", "mid2", "low"]
+
+
+def test_cancel_queued_task():
+    engine = BlenderEngine()
+    agent = RecordingAgent()
+    engine.register_agent(agent)
+
+    async def main():
+        handles = [engine.submit(_task(f"t{i}")) for i in range(3)]
+        assert engine.cancel_task("t1")
+        assert "t1" not in engine.task_queue
+        engine.start_workers(1)
+        results = [await handle for handle in handles]
+        await engine.stop_workers(drain=True)
+        return results
+
+    results = asyncio.run(main())
+    assert [r.status for r in results] == [TaskStatus.COMPLETED, TaskStatus.CANCELLED, TaskStatus.COMPLETED]
+    assert results[1].error == "Cancelled before start"
+    assert agent.ran == ["t0", "t2"]
+    assert not engine.cancel_task("t1")
+
+
+def test_pending_tasks_survive_a_restart(tmp_path):
+    path = tmp_path / "queue.db"
+
+    async def first_run():
+        engine = BlenderEngine(queue_path=path)
+        agent = RecordingAgent()
+        engine.register_agent(agent)
+        done = engine.submit(_task("done"))
+        engine.start_workers(1)
+        await done
+        await engine.stop_workers()
+        engine.submit(_task("a"), priority=1)
+        engine.submit(_task("b"), priority=3)
+        engine.submit(_task("cancelled"))
+        engine.cancel_task("cancelled")
+        engine.shutdown()
+        return agent.ran
+
+    async def second_run():
+        engine = BlenderEngine(queue_path=path)
+        agent = RecordingAgent()
+        engine.register_agent(agent)
+        recovered = [entry.task_id for entry in engine.task_queue.queued()]
+        engine.start_workers(1)
+        await engine.stop_workers(drain=True)
+        engine.shutdown()
+        return recovered, agent.ran
+
+    assert asyncio.run(first_run()) == ["done"]
+    recovered, ran = asyncio.run(second_run())
+    assert recovered == ["b", "a"]
+    assert ran == ["b", "a"]
+    # Everything finished, so nothing is left for a third run
+    queue = PriorityTaskQueue(path)
+    assert len(queue) == 0
+    queue.close()
+
+
+def test_interrupted_task_is_requeued_after_a_restart(tmp_path):
+    path = tmp_path / "queue.db"
+
+    async def interrupted():
+        engine = BlenderEngine(queue_path=path)
+        agent = RecordingAgent(delay=10)
+        engine.register_agent(agent)
+        engine.submit(_task("slow"))
+        engine.start_workers(1)
+        await asyncio.sleep(0.05)
+        # Not drained: the running task is interrupted and stays persisted
+        await engine.stop_workers()
+        engine.shutdown()
+        return agent.ran
+
+    async def resumed():
+        engine = BlenderEngine(queue_path=path)
+        agent = RecordingAgent()
+        engine.register_agent(agent)
+        engine.start_workers(1)
+        await engine.stop_workers(drain=True)
+        engine.shutdown()
+        return agent.ran
+
+    assert asyncio.run(interrupted()) == ["slow"]
+    assert asyncio.run(resumed()) == ["slow"]